@@ -1,11 +1,13 @@
+import re
 from langchain_ollama import OllamaLLM
 from typing import Dict, TypedDict
 from langgraph.graph import StateGraph, START, END
-from langchain_core.messages import HumanMessage, AIMessage
+from langchain_core.messages import HumanMessage, AIMessage, SystemMessage
 
 
 class AgentState(TypedDict):
     messages: list[HumanMessage | AIMessage]
+    summary: str
 
 
 llm = OllamaLLM(
@@ -13,28 +15,67 @@ llm = OllamaLLM(
     base_url="http://localhost:11434"
 )
 
+# Turns (user message + AI answer) sent verbatim; older ones go into the summary
+KEEP_TURNS = 3
+
+SUMMARY_PROMPT = """Update the summary of this conversation with the new messages.
+Keep names, facts and anything the user asked to remember. Answer only with the summary.
+
+Current summary:
+{summary}
+
+New messages:
+{conversation}"""
+
+
+def memory(state: AgentState) -> AgentState:
+    """This node keeps the last KEEP_TURNS turns and folds the older ones into the summary"""
+    human_indexes = [i for i, message in enumerate(state["messages"]) if isinstance(message, HumanMessage)]
+    if len(human_indexes) <= KEEP_TURNS:
+        return state
+    cut = human_indexes[-KEEP_TURNS]
+    old, state["messages"] = state["messages"][:cut], state["messages"][cut:]
+    conversation = "\n".join(
+        f"{'You' if isinstance(message, HumanMessage) else 'AI'}: {message.content}" for message in old
+    )
+    summary = llm.invoke(SUMMARY_PROMPT.format(summary=state["summary"] or "(empty)", conversation=conversation))
+    # deepseek-r1 returns its reasoning inside <think>...</think>: keep it out of the summary
+    state["summary"] = re.sub(r"<think>.*?</think>", "", summary, flags=re.DOTALL).strip()
+    return state
+
+
 def process(state: AgentState) -> AgentState:
     """This node will the request you input"""
-    response = llm.invoke(state["messages"])
+    prompt = state["messages"]
+    if state["summary"]:
+        prompt = [SystemMessage(content=f"Summary of the earlier conversation:\n{state['summary']}")] + prompt
+    response = llm.invoke(prompt)
     state["messages"].append(AIMessage(content=response))
     print(f"\nAI: {response}")
     return state
 
 graph = StateGraph(AgentState)
+graph.add_node("memory", memory)
 graph.add_node("process", process)
 
-graph.add_edge(START, "process")
+graph.add_edge(START, "memory")
+graph.add_edge("memory", "process")
 graph.add_edge("process", END)
 
 agent = graph.compile()
+# conversation_history is the window sent to the model; transcript keeps everything for the log
 conversation_history = []
+summary = ""
+transcript = []
 
 user_input = input("Enter: ")
 while  user_input != "exit":
     conversation_history.append(HumanMessage(content=user_input))
-    result = agent.invoke({"messages": conversation_history})
+    result = agent.invoke({"messages": conversation_history, "summary": summary})
     print(result["messages"])
     conversation_history = result["messages"]
+    summary = result["summary"]
+    transcript += [HumanMessage(content=user_input), conversation_history[-1]]
 
     user_input = input("Enter: ")
 
@@ -42,7 +83,7 @@ while  user_input != "exit":
 with open("logging.txt", "w") as file:
     file.write("Your Conversation Log:\n")
     
-    for message in conversation_history:
+    for message in transcript:
         if isinstance(message, HumanMessage):
             file.write(f"You: {message.content}\n")
         elif isinstance(message, AIMessage):
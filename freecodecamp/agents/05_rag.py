@@ -1,5 +1,8 @@
 from dotenv import load_dotenv
+import hashlib
+import json
 import os
+from pathlib import Path
 from langgraph.graph import StateGraph, END
 from typing import TypedDict, Annotated, Sequence
 from langchain_core.messages import BaseMessage, SystemMessage, HumanMessage, ToolMessage
@@ -22,22 +25,14 @@ embeddings = OpenAIEmbeddings(
 )
 
 
-pdf_path = "Stock_Market_Performance_2024.pdf"
+BASE_DIR = Path(__file__).resolve().parent
+# The document set: add more PDFs here and only their pages get embedded
+pdf_paths = [BASE_DIR / "Stock_Market_Performance_2024.pdf"]
 
-
-# Safety measure I have put for debugging purposes :)
-if not os.path.exists(pdf_path):
-    raise FileNotFoundError(f"PDF file not found: {pdf_path}")
-
-pdf_loader = PyPDFLoader(pdf_path) # This loads the PDF
-
-# Checks if the PDF is there
-try:
-    pages = pdf_loader.load()
-    print(f"PDF has been loaded and has {len(pages)} pages")
-except Exception as e:
-    print(f"Error loading PDF: {e}")
-    raise
+persist_directory = os.getenv("RAG_PERSIST_DIR", str(BASE_DIR / "chroma_db"))
+collection_name = "stock_market"
+# Records the content hash of every indexed PDF and the settings used to index them
+manifest_path = Path(persist_directory) / f"{collection_name}_manifest.json"
 
 # Chunking Process
 text_splitter = RecursiveCharacterTextSplitter(
@@ -45,37 +40,102 @@ text_splitter = RecursiveCharacterTextSplitter(
     chunk_overlap=200
 )
 
+# If any of these change, the stored vectors are no longer comparable and the index is rebuilt
+index_settings = {"embedding_model": embeddings.model, "chunk_size": 1000, "chunk_overlap": 200}
 
-pages_split = text_splitter.split_documents(pages) # We now apply this to our pages
-
-persist_directory = r"C:\Vaibhav\LangGraph_Book\LangGraphCourse\Agents"
-collection_name = "stock_market"
 
-# If our collection does not exist in the directory, we create using the os command
-if not os.path.exists(persist_directory):
-    os.makedirs(persist_directory)
+def file_hash(path: Path) -> str:
+    return hashlib.sha256(path.read_bytes()).hexdigest()
 
 
-try:
-    # Here, we actually create the chroma database using our embeddigns model
-    vectorstore = Chroma.from_documents(
-        documents=pages_split,
-        embedding=embeddings,
-        persist_directory=persist_directory,
-        collection_name=collection_name
-    )
-    print(f"Created ChromaDB vector store!")
-    
-except Exception as e:
-    print(f"Error setting up ChromaDB: {str(e)}")
-    raise
+def chunk_pages(path: Path) -> tuple[list, list[str]]:
+    """
+    Load and split a PDF; chunk ids depend only on the file name and the page content.
 
+    The page number is left out of the id on purpose: inserting or removing a
+    page would renumber every page after it and re-embed them all.
+    """
+    pages = PyPDFLoader(str(path)).load() # This loads the PDF
+    print(f"{path.name} has been loaded and has {len(pages)} pages")
+    chunks, ids = [], []
+    seen = {}
+    for page in pages:
+        page_hash = hashlib.sha256(page.page_content.encode("utf-8")).hexdigest()[:16]
+        # Identical pages (e.g. blank ones) need distinct ids
+        occurrence = seen[page_hash] = seen.get(page_hash, -1) + 1
+        for index, chunk in enumerate(text_splitter.split_documents([page])):
+            chunk.metadata["source_name"] = path.name
+            chunks.append(chunk)
+            ids.append(f"{path.name}:{page_hash}:{occurrence}:{index}")
+    return chunks, ids
+
+
+def sync_vectorstore(vectorstore: Chroma) -> None:
+    """Embed only new or changed PDFs (and within them, only new pages); drop removed ones."""
+    manifest = json.loads(manifest_path.read_text()) if manifest_path.exists() else {}
+    if manifest.get("settings") != index_settings:
+        if manifest:
+            print("Index settings changed, rebuilding the collection")
+        vectorstore.reset_collection()
+        manifest = {"settings": index_settings, "files": {}}
+
+    current = {}
+    for path in pdf_paths:
+        # Safety measure I have put for debugging purposes :)
+        if not path.exists():
+            raise FileNotFoundError(f"PDF file not found: {path}")
+        current[path.name] = file_hash(path)
+
+    for name in set(manifest["files"]) - set(current):
+        stale = vectorstore.get(where={"source_name": name})["ids"]
+        if stale:
+            vectorstore.delete(ids=stale)
+        print(f"Removed {name} from the index ({len(stale)} chunks)")
+
+    for path in pdf_paths:
+        if manifest["files"].get(path.name) == current[path.name]:
+            continue  # same content hash: nothing to load or embed
+        chunks, ids = chunk_pages(path)
+        existing = set(vectorstore.get(where={"source_name": path.name})["ids"])
+        new = [(chunk, chunk_id) for chunk, chunk_id in zip(chunks, ids) if chunk_id not in existing]
+        if new:
+            vectorstore.add_documents([chunk for chunk, _ in new], ids=[chunk_id for _, chunk_id in new])
+        stale = list(existing - set(ids))
+        if stale:
+            vectorstore.delete(ids=stale)
+        print(f"Indexed {path.name}: {len(new)} new chunks embedded, {len(stale)} removed, {len(existing) - len(stale)} reused")
+
+    manifest["files"] = current
+    manifest_path.write_text(json.dumps(manifest, indent=2))
+
+
+_retriever = None
+
+
+def get_retriever():
+    """Open the persisted collection on first use and bring it up to date with pdf_paths."""
+    global _retriever
+    if _retriever is None:
+        os.makedirs(persist_directory, exist_ok=True)
+        try:
+            vectorstore = Chroma(
+                collection_name=collection_name,
+                embedding_function=embeddings,
+                persist_directory=persist_directory,
+            )
+            sync_vectorstore(vectorstore)
+            print(f"ChromaDB vector store ready ({persist_directory})")
+        except Exception as e:
+            print(f"Error setting up ChromaDB: {str(e)}")
+            raise
+
+        # Now we create our retriever
+        _retriever = vectorstore.as_retriever(
+            search_type="similarity",
+            search_kwargs={"k": 5} # K is the amount of chunks to return
+        )
+    return _retriever
 
-# Now we create our retriever 
-retriever = vectorstore.as_retriever(
-    search_type="similarity",
-    search_kwargs={"k": 5} # K is the amount of chunks to return
-)
 
 @tool
 def retriever_tool(query: str) -> str:
@@ -83,7 +143,7 @@ def retriever_tool(query: str) -> str:
     This tool searches and returns the information from the Stock Market Performance 2024 document.
     """
 
-    docs = retriever.invoke(query)
+    docs = get_retriever().invoke(query)
 
     if not docs:
         return "I found no relevant information in the Stock Market Performance 2024 document."
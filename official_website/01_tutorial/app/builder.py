@@ -0,0 +1,71 @@
+from langchain_core.language_models import BaseChatModel
+from langchain_core.runnables import RunnableLambda
+from langchain_core.tools import BaseTool
+from langgraph.graph import StateGraph, START, END
+from app.utils import BasicToolNode
+from app.memory import MemoryNode, KEEP_TURNS, with_summary
+from app.schemas import State
+from app.edges import route_tools
+
+# Tools que llaman a interrupt(): no se ejecutan en paralelo con otras
+INTERRUPT_TOOLS = ("human_assistance",)
+
+
+def build_graph(llm: BaseChatModel, tools: list[BaseTool], checkpointer=None, keep_turns: int = KEEP_TURNS):
+    """
+    Compila el grafo memory → chatbot ⇄ tools.
+
+    Recibe el modelo, las tools y el checkpointer para poder armar el mismo
+    grafo con otros componentes (app/graph.py usa OpenAI + Tavily; loadtest.py
+    un modelo falso). Cada nodo tiene versión sync (graph.stream, main.py) y
+    async (graph.astream, server.py).
+
+    memory se ejecuta una vez por mensaje del usuario: deja los últimos
+    keep_turns turnos completos y resume los anteriores en "summary", así el
+    prompt del chatbot no crece con la conversación.
+    """
+    graph_builder = StateGraph(State)
+    llm_with_tools = llm.bind_tools(tools)
+
+    def check_tool_calls(message):
+        # Because we will be interrupting during tool execution,
+        # we disable parallel tool calling to avoid repeating any
+        # tool invocations when we resume.
+
+        # Aqui se tiene un nodo con 2 tools, lo cual puede causar problemas con el paralelismo.
+        # se recomienda hacer el HITL (Human In The Loop) en un nodo separado.
+        # algo así como un grafo de expertos por nodo
+        # Varias búsquedas sí se pueden pedir juntas: BasicToolNode las ejecuta en paralelo.
+        assert len(message.tool_calls) <= 1 or not any(
+            call["name"] in INTERRUPT_TOOLS for call in message.tool_calls
+        )
+
+    def chatbot(state: State):
+        message = llm_with_tools.invoke(with_summary(state))
+        check_tool_calls(message)
+        return {"messages": [message]}
+
+    async def achatbot(state: State):
+        message = await llm_with_tools.ainvoke(with_summary(state))
+        check_tool_calls(message)
+        return {"messages": [message]}
+
+    memory_node = MemoryNode(llm, keep_turns)
+    graph_builder.add_node("memory", RunnableLambda(memory_node, afunc=memory_node.ainvoke, name="memory"))
+    graph_builder.add_node("chatbot", RunnableLambda(chatbot, afunc=achatbot, name="chatbot"))
+    # graph.stream usa el pool de threads (__call__) y graph.astream usa asyncio.gather (ainvoke)
+    tool_node = BasicToolNode(tools=tools, timeout=30.0, interrupt_tools=INTERRUPT_TOOLS)
+    graph_builder.add_node("tools", RunnableLambda(tool_node, afunc=tool_node.ainvoke, name="tools"))
+
+    graph_builder.add_edge(START, "memory")  # entrada → memory (resume turnos viejos)
+    graph_builder.add_edge("memory", "chatbot")  # memory → chatbot
+    graph_builder.add_edge("tools", "chatbot")  # al terminar tool → chatbot
+    graph_builder.add_edge("chatbot", END)  # chatbot puede terminar
+
+    graph_builder.add_conditional_edges(
+        "chatbot",
+        route_tools,
+        {"tools": "tools", END: END},  # Mapa de resoluciones
+    )
+
+    return graph_builder.compile(checkpointer=checkpointer)
@@ -0,0 +1,148 @@
+import asyncio
+import atexit
+import os
+import sqlite3
+import threading
+from pathlib import Path
+
+from langgraph.checkpoint.sqlite import SqliteSaver
+
+CHECKPOINT_DB = os.getenv(
+    "TUTORIAL_CHECKPOINT_DB", str(Path(__file__).resolve().parent.parent / ".checkpoints.sqlite")
+)
+
+
+class CompactingSqliteSaver(SqliteSaver):
+    """
+    SqliteSaver on a local file (WAL mode) that keeps only the latest
+    `keep_last` checkpoints of each thread.
+
+    InMemorySaver keeps every checkpoint of every thread in process memory
+    (each one with the full message history) and loses them on restart.
+    Here checkpoints live on disk and the memory used by the saver is
+    bounded by the SQLite page cache (`cache_mb`), shared by the hot threads.
+
+    Every `put` marks its thread as dirty; a background thread deletes the
+    older checkpoints (and their pending writes) of the dirty threads every
+    `compact_interval` seconds and truncates the WAL. History older than
+    `keep_last` checkpoints is lost (no time travel past that point).
+
+    SqliteSaver is sync only; the async methods (graph.astream, server.py)
+    run the sync ones in a thread, serialized by the saver's lock.
+    """
+
+    def __init__(
+        self,
+        conn: sqlite3.Connection,
+        keep_last: int = 20,
+        compact_interval: float = 30.0,
+        cache_mb: int = 16,
+    ) -> None:
+        super().__init__(conn)
+        self.keep_last = keep_last
+        self.compact_interval = compact_interval
+        with self.lock:
+            # WAL: lecturas sin bloquear la escritura; NORMAL: fsync solo en checkpoints del WAL
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            # Tope de memoria: cache de páginas en KiB (valor negativo) y sin mmap
+            conn.execute(f"PRAGMA cache_size=-{cache_mb * 1024}")
+            conn.execute("PRAGMA mmap_size=0")
+        self._dirty: set[tuple[str, str]] = set()
+        self._dirty_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._worker: threading.Thread | None = None
+
+    @classmethod
+    def from_path(cls, path: str = CHECKPOINT_DB, **kwargs) -> "CompactingSqliteSaver":
+        """Open the saver on `path` and start background compaction (closed at exit)."""
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(path, check_same_thread=False)
+        saver = cls(conn, **kwargs)
+        saver.start()
+        atexit.register(saver.close)
+        return saver
+
+    def put(self, config, checkpoint, metadata, new_versions):
+        next_config = super().put(config, checkpoint, metadata, new_versions)
+        configurable = config["configurable"]
+        with self._dirty_lock:
+            self._dirty.add((str(configurable["thread_id"]), configurable.get("checkpoint_ns", "")))
+        return next_config
+
+    async def aget_tuple(self, config):
+        return await asyncio.to_thread(self.get_tuple, config)
+
+    async def alist(self, config, *, filter=None, before=None, limit=None):
+        items = await asyncio.to_thread(
+            lambda: list(self.list(config, filter=filter, before=before, limit=limit))
+        )
+        for item in items:
+            yield item
+
+    async def aput(self, config, checkpoint, metadata, new_versions):
+        return await asyncio.to_thread(self.put, config, checkpoint, metadata, new_versions)
+
+    async def aput_writes(self, config, writes, task_id, task_path=""):
+        return await asyncio.to_thread(self.put_writes, config, writes, task_id, task_path)
+
+    async def adelete_thread(self, thread_id):
+        return await asyncio.to_thread(self.delete_thread, thread_id)
+
+    def start(self) -> None:
+        """Start the compaction thread; threads already on disk are compacted first."""
+        if self._worker is not None:
+            return
+        self.setup()
+        with self.lock:
+            rows = self.conn.execute("SELECT DISTINCT thread_id, checkpoint_ns FROM checkpoints").fetchall()
+        with self._dirty_lock:
+            self._dirty.update((str(thread_id), checkpoint_ns) for thread_id, checkpoint_ns in rows)
+        self._worker = threading.Thread(target=self._run, name="checkpoint-compaction", daemon=True)
+        self._worker.start()
+
+    def close(self) -> None:
+        """Stop the compaction thread, run a last compaction and close the connection."""
+        if self._stop.is_set():
+            return
+        self._stop.set()
+        if self._worker is not None:
+            self._worker.join()
+        self.compact()
+        self.conn.close()
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.compact_interval):
+            self.compact()
+
+    def compact(self) -> int:
+        """Delete checkpoints older than `keep_last` in the dirty threads; returns how many."""
+        with self._dirty_lock:
+            dirty, self._dirty = self._dirty, set()
+        if not dirty:
+            return 0
+
+        deleted = 0
+        with self.lock:
+            for thread_id, checkpoint_ns in dirty:
+                # checkpoint_id es un uuid6: el orden lexicográfico es el orden de creación
+                keep = (
+                    "SELECT checkpoint_id FROM checkpoints WHERE thread_id = ? AND checkpoint_ns = ? "
+                    "ORDER BY checkpoint_id DESC LIMIT ?"
+                )
+                params = (thread_id, checkpoint_ns, thread_id, checkpoint_ns, self.keep_last)
+                deleted += self.conn.execute(
+                    f"DELETE FROM checkpoints WHERE thread_id = ? AND checkpoint_ns = ? "
+                    f"AND checkpoint_id NOT IN ({keep})",
+                    params,
+                ).rowcount
+                self.conn.execute(
+                    f"DELETE FROM writes WHERE thread_id = ? AND checkpoint_ns = ? "
+                    f"AND checkpoint_id NOT IN ({keep})",
+                    params,
+                )
+            self.conn.commit()
+            if deleted:
+                # Devolver al disco el WAL que dejaron los borrados
+                self.conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        return deleted
@@ -0,0 +1,87 @@
+import asyncio
+import json
+import time
+import uuid
+
+from langchain_core.language_models import BaseChatModel
+from langchain_core.messages import AIMessage, AIMessageChunk
+from langchain_core.outputs import ChatGeneration, ChatGenerationChunk, ChatResult
+from langchain_core.tools import StructuredTool, tool
+from langgraph.types import interrupt
+
+
+class FakeToolChatModel(BaseChatModel):
+    """
+    Chat model falso para loadtest.py y stream_bench.py (sin OpenAI).
+
+    Ante un mensaje del usuario pide una búsqueda (o human_assistance si el
+    mensaje dice "ayuda"); después de la tool responde con texto. En modo
+    streaming envía la respuesta palabra por palabra.
+    """
+
+    latency: float = 0.05
+
+    @property
+    def _llm_type(self) -> str:
+        return "fake-tool-chat"
+
+    def bind_tools(self, tools, **kwargs):
+        return self
+
+    def _reply(self, messages) -> AIMessage:
+        last = messages[-1]
+        if last.type != "human":
+            return AIMessage(content=f"Respuesta final: {str(last.content)[:80]}")
+        tool_name = "human_assistance" if "ayuda" in last.content else "search"
+        call = {"name": tool_name, "args": {"query": last.content}, "id": f"call_{uuid.uuid4().hex[:12]}"}
+        return AIMessage(content="", tool_calls=[call])
+
+    @staticmethod
+    def _chunks(message: AIMessage):
+        if message.tool_calls:
+            call = message.tool_calls[0]
+            tool_call_chunk = {"name": call["name"], "args": json.dumps(call["args"]), "id": call["id"], "index": 0}
+            yield ChatGenerationChunk(message=AIMessageChunk(content="", tool_call_chunks=[tool_call_chunk]))
+            return
+        for index, word in enumerate(message.content.split(" ")):
+            yield ChatGenerationChunk(message=AIMessageChunk(content=word if index == 0 else f" {word}"))
+
+    def _generate(self, messages, stop=None, run_manager=None, **kwargs) -> ChatResult:
+        time.sleep(self.latency)
+        return ChatResult(generations=[ChatGeneration(message=self._reply(messages))])
+
+    async def _agenerate(self, messages, stop=None, run_manager=None, **kwargs) -> ChatResult:
+        await asyncio.sleep(self.latency)
+        return ChatResult(generations=[ChatGeneration(message=self._reply(messages))])
+
+    def _stream(self, messages, stop=None, run_manager=None, **kwargs):
+        time.sleep(self.latency)
+        yield from self._chunks(self._reply(messages))
+
+    async def _astream(self, messages, stop=None, run_manager=None, **kwargs):
+        await asyncio.sleep(self.latency)
+        for chunk in self._chunks(self._reply(messages)):
+            yield chunk
+
+
+def fake_tools(tool_latency: float):
+    """search (con latencia fija, sync y async) y human_assistance, igual que en app/tools.py."""
+
+    def search(query: str) -> str:
+        time.sleep(tool_latency)
+        return f"Resultados para {query}"
+
+    async def asearch(query: str) -> str:
+        await asyncio.sleep(tool_latency)
+        return f"Resultados para {query}"
+
+    @tool
+    def human_assistance(query: str) -> str:
+        """Request assistance from a human."""
+        human_response = interrupt({"query": query})
+        return human_response["data"]
+
+    search_tool = StructuredTool.from_function(
+        func=search, coroutine=asearch, name="search", description="Busca información (falso)."
+    )
+    return [search_tool, human_assistance]
@@ -0,0 +1,93 @@
+from langchain_core.language_models import BaseChatModel
+from langchain_core.messages import AIMessage, HumanMessage, RemoveMessage, SystemMessage, ToolMessage
+
+# Turnos (mensaje del usuario + respuestas y tools) que se mandan completos al modelo
+KEEP_TURNS = 4
+# Caracteres de cada resultado de tool que ve el resumidor
+TOOL_RESULT_CHARS = 500
+
+SUMMARY_PROMPT = """Eres la memoria de un chatbot. Actualiza el resumen de la conversación
+con los mensajes nuevos. Conserva nombres, fechas, datos y decisiones que el
+usuario dio o confirmó, y lo que quedó pendiente. Responde solo con el resumen.
+
+Resumen actual:
+{summary}
+
+Mensajes nuevos:
+{conversation}"""
+
+
+def split_history(messages: list, keep_turns: int = KEEP_TURNS) -> tuple[list, list]:
+    """
+    Split the history into (old, recent): recent holds the last `keep_turns` turns.
+
+    A turn starts at a HumanMessage, so an AIMessage with tool_calls and its
+    ToolMessages always stay on the same side.
+    """
+    human_indexes = [index for index, message in enumerate(messages) if isinstance(message, HumanMessage)]
+    if len(human_indexes) <= keep_turns:
+        return [], messages
+    cut = human_indexes[-keep_turns]
+    return messages[:cut], messages[cut:]
+
+
+def format_messages(messages: list) -> str:
+    lines = []
+    for message in messages:
+        if isinstance(message, HumanMessage):
+            lines.append(f"Usuario: {message.content}")
+        elif isinstance(message, ToolMessage):
+            lines.append(f"Tool {message.name}: {str(message.content)[:TOOL_RESULT_CHARS]}")
+        elif isinstance(message, AIMessage):
+            if message.content:
+                lines.append(f"Asistente: {message.content}")
+            for call in message.tool_calls:
+                lines.append(f"Asistente llamó a {call['name']}({call['args']})")
+    return "\n".join(lines)
+
+
+def with_summary(state: dict) -> list:
+    """Messages for the model: the running summary (if any) first, then the recent turns."""
+    if summary := state.get("summary"):
+        return [SystemMessage(content=f"Resumen de la conversación anterior:\n{summary}"), *state["messages"]]
+    return state["messages"]
+
+
+class MemoryNode:
+    """
+    A node that keeps the prompt size flat over long threads.
+
+    Runs before the chatbot on every user message: the last `keep_turns`
+    turns stay verbatim and the older ones are folded into `summary`
+    (only the turns that fall out of the window are sent to the model,
+    together with the previous summary) and removed from the state with
+    RemoveMessage, so the checkpoints stop growing too.
+    """
+
+    def __init__(self, llm: BaseChatModel, keep_turns: int = KEEP_TURNS) -> None:
+        self.llm = llm
+        self.keep_turns = keep_turns
+
+    def _prompt(self, state: dict, old: list) -> str:
+        return SUMMARY_PROMPT.format(
+            summary=state.get("summary") or "(vacío)", conversation=format_messages(old)
+        )
+
+    @staticmethod
+    def _update(old: list, summary) -> dict:
+        return {
+            "summary": summary.content,
+            "messages": [RemoveMessage(id=message.id) for message in old],
+        }
+
+    def __call__(self, state: dict):
+        old, _ = split_history(state["messages"], self.keep_turns)
+        if not old:
+            return {}
+        return self._update(old, self.llm.invoke(self._prompt(state, old)))
+
+    async def ainvoke(self, state: dict):
+        old, _ = split_history(state["messages"], self.keep_turns)
+        if not old:
+            return {}
+        return self._update(old, await self.llm.ainvoke(self._prompt(state, old)))
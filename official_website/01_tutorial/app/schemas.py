@@ -6,4 +6,6 @@ from langgraph.graph.message import add_messages
 class State(TypedDict):
     messages: Annotated[list, add_messages]
     name: str
-    birthday: str
\ No newline at end of file
+    birthday: str
+    # Resumen de los turnos que ya salieron de la ventana (app/memory.py)
+    summary: str
@@ -0,0 +1,160 @@
+import asyncio
+import json
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+
+from langchain_core.tools import BaseTool
+from pydantic import BaseModel, Field, PrivateAttr
+
+
+def normalize_query(query: str) -> str:
+    """Lowercase and collapse whitespace: "Noticias  IA" and "noticias ia" share an entry."""
+    return " ".join(query.lower().split())
+
+
+class CachedSearchTool(BaseTool):
+    """
+    Wraps a search tool (TavilySearch) with a TTL + LRU cache.
+
+    The key is the normalized query plus the other arguments, so the same
+    search issued again in a thread (or by another user) within `ttl`
+    seconds doesn't hit the network. Concurrent identical searches (e.g.
+    the parallel tool calls of BasicToolNode, or several sessions of
+    server.py) share one in-flight request. Errors are not cached.
+
+    The wrapped tool keeps its name, description and args schema, so the
+    model sees the same tool.
+    """
+
+    backend: BaseTool
+    ttl: float = 300.0
+    max_entries: int = 256
+
+    _entries: OrderedDict = PrivateAttr(default_factory=OrderedDict)
+    _inflight: dict = PrivateAttr(default_factory=dict)
+    _lock: threading.Lock = PrivateAttr(default_factory=threading.Lock)
+    _stats: dict = PrivateAttr(default_factory=lambda: {"hits": 0, "misses": 0, "coalesced": 0})
+
+    def __init__(self, backend: BaseTool, **kwargs) -> None:
+        super().__init__(
+            name=backend.name,
+            description=backend.description,
+            args_schema=backend.args_schema,
+            backend=backend,
+            **kwargs,
+        )
+
+    @property
+    def stats(self) -> dict:
+        return {**self._stats, "entries": len(self._entries)}
+
+    def cache_key(self, kwargs: dict) -> str:
+        args = {**kwargs, "query": normalize_query(kwargs.get("query", ""))}
+        return json.dumps(args, sort_keys=True, default=str)
+
+    def _lookup(self, key: str) -> tuple[bool, object, Future | None]:
+        """Returns (hit, result, in-flight future); with neither, the caller runs the search."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > time.monotonic():
+                self._entries.move_to_end(key)
+                self._stats["hits"] += 1
+                return True, entry[1], None
+            if key in self._inflight:
+                self._stats["coalesced"] += 1
+                return False, None, self._inflight[key]
+            self._stats["misses"] += 1
+            self._inflight[key] = Future()
+            return False, None, None
+
+    def _finish(self, key: str, result=None, error: BaseException | None = None) -> None:
+        with self._lock:
+            future = self._inflight.pop(key)
+            if error is None:
+                self._entries[key] = (time.monotonic() + self.ttl, result)
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+        if future.done():
+            # Un waiter canceló la future compartida: no hay a quién entregar el resultado
+            return
+        if error is None:
+            future.set_result(result)
+        else:
+            future.set_exception(error)
+
+    def _run(self, **kwargs):
+        key = self.cache_key(kwargs)
+        hit, result, pending = self._lookup(key)
+        if hit:
+            return result
+        if pending is not None:
+            return pending.result()
+        try:
+            result = self.backend.invoke(kwargs)
+        except BaseException as e:
+            # También cancelaciones: los que esperan la future no pueden quedar colgados
+            self._finish(key, error=e)
+            raise
+        self._finish(key, result)
+        return result
+
+    async def _arun(self, **kwargs):
+        key = self.cache_key(kwargs)
+        hit, result, pending = self._lookup(key)
+        if hit:
+            return result
+        if pending is not None:
+            # shield: cancelar a este waiter no debe cancelar la future que comparten los demás
+            return await asyncio.shield(asyncio.wrap_future(pending))
+        try:
+            result = await self.backend.ainvoke(kwargs)
+        except BaseException as e:
+            # También cancelaciones: los que esperan la future no pueden quedar colgados
+            self._finish(key, error=e)
+            raise
+        self._finish(key, result)
+        return result
+
+
+class LocalSearchInput(BaseModel):
+    query: str = Field(description="Search query to look up")
+
+
+class LocalSearch(BaseTool):
+    """
+    Offline stand-in for TavilySearch: same result shape, fixed latency.
+
+    Used to measure the cache without network access (search_bench.py, or
+    TUTORIAL_SEARCH_BACKEND=local in app/tools.py).
+    """
+
+    name: str = "local_search"
+    description: str = "Search the web for current information. Useful for questions about recent events."
+    args_schema: type[BaseModel] = LocalSearchInput
+    latency: float = 0.5
+    calls: int = 0
+
+    def _results(self, query: str) -> dict:
+        self.calls += 1
+        return {
+            "query": query,
+            "results": [
+                {
+                    "title": f"Resultado {index} para {query}",
+                    "url": f"https://example.com/{index}?q={'+'.join(query.split())}",
+                    "content": f"Contenido local de ejemplo sobre {query}.",
+                }
+                for index in (1, 2)
+            ],
+        }
+
+    def _run(self, query: str) -> dict:
+        time.sleep(self.latency)
+        return self._results(query)
+
+    async def _arun(self, query: str) -> dict:
+        await asyncio.sleep(self.latency)
+        return self._results(query)
@@ -1,11 +1,20 @@
+import os
+
 from langchain_tavily import TavilySearch
 from dotenv import load_dotenv
 from langgraph.types import interrupt
 from langchain_core.tools import tool
+from app.search import CachedSearchTool, LocalSearch
 
 load_dotenv()
 
-travily_tool = TavilySearch(max_results=2)
+# Búsquedas con cache (TTL + LRU) y deduplicadas: la misma query no vuelve a ir a la red.
+# TUTORIAL_SEARCH_BACKEND=local usa resultados locales (sin red ni API key).
+if os.getenv("TUTORIAL_SEARCH_BACKEND") == "local":
+    search_backend = LocalSearch()
+else:
+    search_backend = TavilySearch(max_results=2)
+travily_tool = CachedSearchTool(search_backend, ttl=300.0, max_entries=256)
 
 
 @tool
@@ -1,31 +1,152 @@
+import asyncio
+import contextvars
 import json
+import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
 
 from langchain_core.messages import ToolMessage
 from langchain_core.tools import BaseTool
+from langgraph.errors import GraphBubbleUp
 
 
 class BasicToolNode:
-    """A node that runs the tools requested in the last AIMessage."""
+    """
+    A node that runs the tools requested in the last AIMessage.
 
-    def __init__(self, tools: list[BaseTool]) -> None:
+    When the model asks for several tools at once (e.g. several Tavily
+    searches) they run concurrently: in a thread pool from the sync graph
+    (`graph.stream`) or with `asyncio.gather` from an async graph
+    (`graph.astream`, see `ainvoke` and app/graph.py). Each call has its own
+    timeout and the ToolMessages keep the order of `message.tool_calls`.
+
+    Python can't kill a thread: in the sync path a tool that exceeds the
+    timeout gets a timeout ToolMessage, but its thread keeps running until
+    the tool returns. Each batch therefore gets its own short-lived pool,
+    so a hung call never takes a worker away from the next step.
+
+    Tools that call `interrupt()` (human_assistance) can't run in parallel:
+    on resume the node runs again from the start and would repeat every
+    other call. Batches with any of the `interrupt_tools`, single calls and
+    `parallel=False` use the original sequential mode.
+    """
+
+    def __init__(
+        self,
+        tools: list[BaseTool],
+        parallel: bool = True,
+        timeout: float = 30.0,
+        max_workers: int = 8,
+        interrupt_tools: tuple[str, ...] = ("human_assistance",),
+    ) -> None:
         self.tools_by_name = {tool.name: tool for tool in tools}
+        self.parallel = parallel
+        self.timeout = timeout
+        self.interrupt_tools = set(interrupt_tools)
+        self.max_workers = max_workers
 
     def __call__(self, inputs: dict):
-        if messages := inputs.get("messages", []):
-            message = messages[-1]
-        else:
-            raise ValueError("No message found in input")
+        message = self._last_message(inputs)
+        if not self._can_parallelize(message.tool_calls):
+            return {"messages": [self._run_sequential(call) for call in message.tool_calls]}
+
+        # Pool por batch: shutdown(wait=False) no espera a los tools colgados,
+        # que terminan en su thread sin ocupar workers de los pasos siguientes
+        executor = ThreadPoolExecutor(
+            max_workers=min(len(message.tool_calls), self.max_workers), thread_name_prefix="tools"
+        )
+        try:
+            # copy_context: cada thread ve el config del grafo (callbacks, get_config)
+            deadline = time.monotonic() + self.timeout
+            futures = [
+                executor.submit(contextvars.copy_context().run, self._invoke, call)
+                for call in message.tool_calls
+            ]
+            outputs = []
+            for tool_call, future in zip(message.tool_calls, futures):
+                try:
+                    tool_result = future.result(timeout=max(deadline - time.monotonic(), 0))
+                    outputs.append(self._tool_message(tool_call, tool_result))
+                except FutureTimeoutError:
+                    # cancel() solo evita que arranquen las calls que seguían en cola
+                    future.cancel()
+                    outputs.append(self._timeout_message(tool_call))
+                except GraphBubbleUp:
+                    raise
+                except Exception as e:
+                    outputs.append(self._error_message(tool_call, e))
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+        return {"messages": outputs}
+
+    async def ainvoke(self, inputs: dict):
+        """Async version for `graph.astream`: the tool calls run with asyncio.gather."""
+        message = self._last_message(inputs)
+        if not self._can_parallelize(message.tool_calls):
+            return {"messages": [await self._arun_sequential(call) for call in message.tool_calls]}
+
+        results = await asyncio.gather(
+            *(self._ainvoke(call) for call in message.tool_calls), return_exceptions=True
+        )
         outputs = []
-        for tool_call in message.tool_calls:
-            tool_result = self.tools_by_name[tool_call["name"]].invoke(
-                tool_call["args"]
-            )
-            outputs.append(
-                ToolMessage(
-                    content=json.dumps(tool_result),
-                    name=tool_call["name"],
-                    tool_call_id=tool_call["id"],
-                )
-            )
+        for tool_call, result in zip(message.tool_calls, results):
+            if isinstance(result, GraphBubbleUp):
+                raise result
+            if isinstance(result, TimeoutError):
+                outputs.append(self._timeout_message(tool_call))
+            elif isinstance(result, Exception):
+                outputs.append(self._error_message(tool_call, result))
+            else:
+                outputs.append(self._tool_message(tool_call, result))
         return {"messages": outputs}
 
+    @staticmethod
+    def _last_message(inputs: dict):
+        if messages := inputs.get("messages", []):
+            return messages[-1]
+        raise ValueError("No message found in input")
+
+    def _can_parallelize(self, tool_calls: list[dict]) -> bool:
+        return (
+            self.parallel
+            and len(tool_calls) > 1
+            and not any(call["name"] in self.interrupt_tools for call in tool_calls)
+        )
+
+    def _run_sequential(self, tool_call: dict) -> ToolMessage:
+        # Sin timeout ni captura de errores: interrupt() tiene que propagarse al grafo
+        return self._tool_message(tool_call, self._invoke(tool_call))
+
+    async def _arun_sequential(self, tool_call: dict) -> ToolMessage:
+        tool = self.tools_by_name[tool_call["name"]]
+        return self._tool_message(tool_call, await tool.ainvoke(tool_call["args"]))
+
+    def _invoke(self, tool_call: dict):
+        return self.tools_by_name[tool_call["name"]].invoke(tool_call["args"])
+
+    async def _ainvoke(self, tool_call: dict):
+        tool = self.tools_by_name[tool_call["name"]]
+        # BaseTool.ainvoke ya delega los tools sync a un executor
+        return await asyncio.wait_for(tool.ainvoke(tool_call["args"]), self.timeout)
+
+    @staticmethod
+    def _tool_message(tool_call: dict, tool_result) -> ToolMessage:
+        # Los tools que ya retornan texto no se vuelven a serializar
+        content = tool_result if isinstance(tool_result, str) else json.dumps(tool_result, default=str)
+        return ToolMessage(content=content, name=tool_call["name"], tool_call_id=tool_call["id"])
+
+    def _timeout_message(self, tool_call: dict) -> ToolMessage:
+        return ToolMessage(
+            content=f"Error: {tool_call['name']} timed out after {self.timeout:.0f}s",
+            name=tool_call["name"],
+            tool_call_id=tool_call["id"],
+            status="error",
+        )
+
+    @staticmethod
+    def _error_message(tool_call: dict, error: Exception) -> ToolMessage:
+        return ToolMessage(
+            content=f"Error: {type(error).__name__}: {error}",
+            name=tool_call["name"],
+            tool_call_id=tool_call["id"],
+            status="error",
+        )
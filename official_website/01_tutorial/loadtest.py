@@ -0,0 +1,138 @@
+"""
+Prueba de carga del servidor SSE (server.py) con un modelo falso.
+
+Levanta el servidor en proceso con el mismo grafo del tutorial
+(app/builder.py) pero con un chat model falso y tools falsas con latencia
+fija (app/fakes.py), así que no usa OpenAI ni Tavily. Cada sesión simulada:
+
+1. envía un mensaje → el modelo pide una búsqueda → tool → respuesta
+2. cada --resume-every sesiones, el modelo pide human_assistance y la
+   sesión responde el interrupt con /resume
+
+Mide sesiones por segundo y la latencia de cada request (p50 / p95).
+
+Ejecutar desde official_website/01_tutorial:
+    python loadtest.py
+    python loadtest.py --sessions 500 --concurrency 100 --max-concurrency 32
+    python loadtest.py --sqlite   # con CompactingSqliteSaver en vez de InMemorySaver
+"""
+
+import argparse
+import asyncio
+import json
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+import aiohttp
+from aiohttp import web
+from langgraph.checkpoint.memory import InMemorySaver
+
+from app.builder import build_graph
+from app.fakes import FakeToolChatModel, fake_tools
+from server import create_app
+
+
+def percentile(values: list[float], pct: float) -> float:
+    """Percentil nearest-rank de una lista de floats."""
+    ordered = sorted(values)
+    index = max(0, min(len(ordered) - 1, round(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+async def post_sse(http: aiohttp.ClientSession, url: str, body: dict) -> tuple[list[str], float]:
+    """Envía un request y lee el stream SSE completo; retorna (eventos, segundos)."""
+    start = time.perf_counter()
+    events = []
+    async with http.post(url, json=body) as response:
+        response.raise_for_status()
+        async for line in response.content:
+            if line.startswith(b"event: "):
+                events.append(line[len(b"event: "):].decode().strip())
+    return events, time.perf_counter() - start
+
+
+async def run_session(http, base_url: str, index: int, resume_every: int, latencies: list[float]):
+    user_url = f"{base_url}/sessions/user-{index}"
+    needs_help = resume_every and index % resume_every == 0
+    message = "necesito ayuda con mi reserva" if needs_help else f"noticias del tema {index}"
+
+    events, seconds = await post_sse(http, f"{user_url}/messages", {"message": message})
+    latencies.append(seconds)
+    if "interrupt" in events:
+        events, seconds = await post_sse(http, f"{user_url}/resume", {"data": "Sí, es correcto"})
+        latencies.append(seconds)
+    if "error" in events or "done" not in events:
+        raise RuntimeError(f"sesión {index}: eventos {events}")
+
+
+async def run_load(args) -> dict:
+    if args.sqlite:
+        from app.checkpointer import CompactingSqliteSaver
+
+        db_path = Path(tempfile.mkdtemp()) / "loadtest.sqlite"
+        checkpointer = CompactingSqliteSaver.from_path(str(db_path), compact_interval=1.0)
+    else:
+        checkpointer = InMemorySaver()
+
+    graph = build_graph(FakeToolChatModel(latency=args.llm_latency), fake_tools(args.tool_latency), checkpointer)
+    runner = web.AppRunner(create_app(graph, args.max_concurrency, queue_timeout=120.0))
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    host, port = runner.addresses[0][:2]
+    base_url = f"http://{host}:{port}"
+
+    latencies: list[float] = []
+    failures = []
+    clients = asyncio.Semaphore(args.concurrency)
+
+    async def client(http, index):
+        async with clients:
+            try:
+                await run_session(http, base_url, index, args.resume_every, latencies)
+            except Exception as e:
+                failures.append(f"{type(e).__name__}: {e}")
+
+    start = time.perf_counter()
+    try:
+        connector = aiohttp.TCPConnector(limit=args.concurrency)
+        async with aiohttp.ClientSession(connector=connector) as http:
+            await asyncio.gather(*(client(http, index) for index in range(args.sessions)))
+    finally:
+        await runner.cleanup()
+    elapsed = time.perf_counter() - start
+
+    return {
+        "sessions": args.sessions,
+        "concurrency": args.concurrency,
+        "max_concurrency": args.max_concurrency,
+        "checkpointer": type(checkpointer).__name__,
+        "failures": len(failures),
+        "failure_samples": failures[:5],
+        "seconds": round(elapsed, 2),
+        "sessions_per_second": round(args.sessions / elapsed, 2),
+        "requests": len(latencies),
+        "latency_p50_ms": round(statistics.median(latencies) * 1000, 1) if latencies else None,
+        "latency_p95_ms": round(percentile(latencies, 95) * 1000, 1) if latencies else None,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Prueba de carga del servidor SSE del tutorial")
+    parser.add_argument("--sessions", type=int, default=200, help="Sesiones simuladas (una por usuario)")
+    parser.add_argument("--concurrency", type=int, default=50, help="Clientes en paralelo")
+    parser.add_argument("--max-concurrency", type=int, default=32, help="Límite de ejecuciones del servidor")
+    parser.add_argument("--llm-latency", type=float, default=0.05, help="Segundos por respuesta del modelo falso")
+    parser.add_argument("--tool-latency", type=float, default=0.05, help="Segundos por búsqueda falsa")
+    parser.add_argument("--resume-every", type=int, default=10, help="Cada cuántas sesiones hay interrupt (0 = nunca)")
+    parser.add_argument("--sqlite", action="store_true", help="Usar CompactingSqliteSaver")
+    args = parser.parse_args()
+
+    result = asyncio.run(run_load(args))
+    print(json.dumps(result, indent=2, ensure_ascii=False))
+
+
+if __name__ == "__main__":
+    main()
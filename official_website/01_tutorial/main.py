@@ -5,21 +5,51 @@ from langgraph.types import Command
 load_dotenv()
 
 
+def print_update(node: str, update: dict | None, streamed: bool):
+    """Imprime lo que un nodo agregó al estado (no el estado completo)."""
+    for message in (update or {}).get("messages", []):
+        if message.type == "ai":
+            # Si el texto ya llegó token por token solo falta cerrar la línea
+            if message.content and streamed:
+                print()
+            elif message.content:
+                print(f"Assistant: {message.content}")
+            for call in message.tool_calls:
+                print(f"🔧 {call['name']}({call['args']})")
+        elif message.type == "tool":
+            print(f"📎 {message.name}: {str(message.content)[:300]}")
+
+
 def stream_graph_updates(user_input: str, is_resume: bool = False):
     config = {"configurable": {"thread_id": "1"}}
 
     if is_resume:
         # Aquí metes la respuesta humana (resume)
         command = Command(resume={"data": user_input})
-        events = graph.stream(command, config, stream_mode="values")
     else:
         # Input normal del usuario
         command = {"messages": [{"role": "user", "content": user_input}]}
-        events = graph.stream(command, config, stream_mode="values")
 
-    for event in events:
-        if "messages" in event:
-            event["messages"][-1].pretty_print()
+    # "values" emitía el estado completo después de cada paso (todo el historial)
+    # para imprimir solo el último mensaje. Con "messages" llegan los tokens del
+    # modelo a medida que se generan y con "updates" solo lo que agregó cada nodo.
+    streaming = False
+    for mode, chunk in graph.stream(command, config, stream_mode=["messages", "updates"]):
+        if mode == "messages":
+            token, metadata = chunk
+            # Solo el chatbot: memory también llama al modelo para resumir
+            if metadata.get("langgraph_node") == "chatbot" and isinstance(token.content, str) and token.content:
+                if not streaming:
+                    print("Assistant: ", end="")
+                    streaming = True
+                print(token.content, end="", flush=True)
+        elif "__interrupt__" in chunk:
+            for interrupt in chunk["__interrupt__"]:
+                print(f"✋ Se necesita ayuda humana: {interrupt.value}. Responde con /resume <respuesta>")
+        else:
+            for node, update in chunk.items():
+                print_update(node, update, streaming)
+                streaming = False
 
 
 if __name__ == "__main__":
@@ -0,0 +1,87 @@
+"""
+Benchmark del cache de búsquedas (app/search.py) sin red.
+
+Usa LocalSearch (latencia fija, mismo formato que Tavily) y lanza
+--queries búsquedas en tandas de --concurrency en paralelo, elegidas de un
+conjunto de --distinct queries distintas (con variaciones de mayúsculas y
+espacios). Compara la búsqueda directa contra CachedSearchTool: tiempo
+total, latencia p50 / p95 y cuántas búsquedas llegan al backend.
+
+Ejecutar desde official_website/01_tutorial:
+    python search_bench.py
+    python search_bench.py --queries 400 --distinct 20 --concurrency 16 --latency 0.3
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import statistics
+import time
+
+from app.search import CachedSearchTool, LocalSearch
+
+
+def percentile(values: list[float], pct: float) -> float:
+    """Percentil nearest-rank de una lista de floats."""
+    ordered = sorted(values)
+    index = max(0, min(len(ordered) - 1, round(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+def make_queries(count: int, distinct: int, seed: int) -> list[str]:
+    rng = random.Random(seed)
+    topics = [f"noticias sobre el tema {index}" for index in range(distinct)]
+    variants = [str.lower, str.upper, str.title, lambda text: f"  {text}  "]
+    return [rng.choice(variants)(rng.choice(topics)) for _ in range(count)]
+
+
+async def run(tool, queries: list[str], concurrency: int) -> dict:
+    latencies = []
+
+    async def search(query):
+        start = time.perf_counter()
+        await tool.ainvoke({"query": query})
+        latencies.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    for offset in range(0, len(queries), concurrency):
+        await asyncio.gather(*(search(query) for query in queries[offset:offset + concurrency]))
+    return {
+        "seconds": round(time.perf_counter() - start, 2),
+        "p50_ms": round(statistics.median(latencies) * 1000, 1),
+        "p95_ms": round(percentile(latencies, 95) * 1000, 1),
+    }
+
+
+async def main_async(args) -> dict:
+    queries = make_queries(args.queries, args.distinct, args.seed)
+
+    direct_backend = LocalSearch(latency=args.latency)
+    direct = await run(direct_backend, queries, args.concurrency)
+    direct["backend_calls"] = direct_backend.calls
+
+    cached_backend = LocalSearch(latency=args.latency)
+    cached_tool = CachedSearchTool(cached_backend, ttl=args.ttl, max_entries=args.max_entries)
+    cached = await run(cached_tool, queries, args.concurrency)
+    cached["backend_calls"] = cached_backend.calls
+    cached["cache"] = cached_tool.stats
+
+    return {"queries": len(queries), "distinct": args.distinct, "direct": direct, "cached": cached}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark del cache de búsquedas")
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--distinct", type=int, default=20, help="Queries distintas (antes de normalizar)")
+    parser.add_argument("--concurrency", type=int, default=8, help="Búsquedas en paralelo por tanda")
+    parser.add_argument("--latency", type=float, default=0.2, help="Segundos por búsqueda de LocalSearch")
+    parser.add_argument("--ttl", type=float, default=300.0)
+    parser.add_argument("--max-entries", type=int, default=256)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    print(json.dumps(asyncio.run(main_async(args)), indent=2, ensure_ascii=False))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,174 @@
+"""
+Servidor HTTP async para el grafo del tutorial (varios usuarios a la vez).
+
+main.py es un loop con input() y un único thread_id "1". Aquí cada usuario
+(y cada sesión del usuario) tiene su propio thread_id y las respuestas del
+grafo se envían como Server-Sent Events a medida que cada nodo termina.
+
+Endpoints:
+    POST /sessions/{user_id}/messages   {"message": "...", "session": "default"}
+    POST /sessions/{user_id}/resume     {"data": "...", "session": "default"}
+    GET  /health
+
+Eventos SSE:
+    token      cada token de la respuesta del chatbot, a medida que se genera
+    message    cada mensaje nuevo (AI o tool), con el nodo que lo produjo
+    interrupt  human_assistance pidió ayuda: responder con /resume
+    done       fin de la ejecución
+    error      la ejecución falló
+
+Ejecutar desde official_website/01_tutorial:
+    python server.py --port 8000 --max-concurrency 32
+
+    curl -N -X POST localhost:8000/sessions/ana/messages -d '{"message": "hola"}'
+    curl -N -X POST localhost:8000/sessions/ana/resume -d '{"data": "Sí, es correcto"}'
+"""
+
+import argparse
+import asyncio
+import json
+
+from aiohttp import web
+from langgraph.types import Command
+
+# Claves en el app de aiohttp
+GRAPH = web.AppKey("graph", object)
+LIMITER = web.AppKey("limiter", asyncio.Semaphore)
+ACTIVE_THREADS = web.AppKey("active_threads", set)
+QUEUE_TIMEOUT = web.AppKey("queue_timeout", float)
+
+
+def thread_id_for(user_id: str, session: str) -> str:
+    """thread_id del checkpointer: un historial por usuario y sesión."""
+    return f"{user_id}:{session}"
+
+
+def serialize_message(node: str, message) -> dict:
+    data = {"node": node, "type": message.type, "content": message.content}
+    if getattr(message, "tool_calls", None):
+        data["tool_calls"] = [{"name": call["name"], "args": call["args"]} for call in message.tool_calls]
+    if getattr(message, "name", None):
+        data["name"] = message.name
+    return data
+
+
+async def send_event(response: web.StreamResponse, event: str, data: dict):
+    payload = json.dumps(data, ensure_ascii=False, default=str)
+    await response.write(f"event: {event}\ndata: {payload}\n\n".encode("utf-8"))
+
+
+async def stream_graph(request: web.Request, graph_input) -> web.StreamResponse:
+    """Ejecuta el grafo para el thread del usuario y envía sus updates como SSE."""
+    app = request.app
+    user_id = request.match_info["user_id"]
+    session = request["body"].get("session", "default")
+    thread_id = thread_id_for(user_id, session)
+
+    # Concurrencia acotada por worker: si no hay lugar en queue_timeout, 503
+    try:
+        await asyncio.wait_for(app[LIMITER].acquire(), app[QUEUE_TIMEOUT])
+    except TimeoutError:
+        raise web.HTTPServiceUnavailable(text="Servidor ocupado, intenta de nuevo")
+
+    # Un mismo thread no puede ejecutarse dos veces a la vez (los checkpoints se pisarían)
+    if thread_id in app[ACTIVE_THREADS]:
+        app[LIMITER].release()
+        raise web.HTTPConflict(text=f"La sesión {thread_id} ya tiene una ejecución en curso")
+
+    app[ACTIVE_THREADS].add(thread_id)
+    try:
+        response = web.StreamResponse(
+            headers={"Content-Type": "text/event-stream", "Cache-Control": "no-cache"}
+        )
+        await response.prepare(request)
+        config = {"configurable": {"thread_id": thread_id}}
+        try:
+            # Solo deltas: tokens del chatbot ("messages") y lo que agregó cada nodo ("updates")
+            async for mode, chunk in app[GRAPH].astream(graph_input, config, stream_mode=["messages", "updates"]):
+                if mode == "messages":
+                    token, metadata = chunk
+                    if metadata.get("langgraph_node") == "chatbot" and isinstance(token.content, str) and token.content:
+                        await send_event(response, "token", {"content": token.content})
+                    continue
+                for node, update in chunk.items():
+                    if node == "__interrupt__":
+                        for interrupt in update:
+                            await send_event(response, "interrupt", {"value": interrupt.value})
+                        continue
+                    for message in (update or {}).get("messages", []):
+                        if message.type == "remove":
+                            # Mensajes viejos que memory pasó al resumen
+                            continue
+                        await send_event(response, "message", serialize_message(node, message))
+            await send_event(response, "done", {"thread_id": thread_id})
+        except ConnectionResetError:
+            # El cliente cerró la conexión: el checkpoint del último paso ya quedó guardado
+            pass
+        except Exception as e:
+            await send_event(response, "error", {"error": f"{type(e).__name__}: {e}"})
+        return response
+    finally:
+        app[ACTIVE_THREADS].discard(thread_id)
+        app[LIMITER].release()
+
+
+async def read_body(request: web.Request, field: str) -> dict:
+    try:
+        body = await request.json()
+    except json.JSONDecodeError:
+        raise web.HTTPBadRequest(text="El body debe ser JSON")
+    if not isinstance(body, dict) or not isinstance(body.get(field), str):
+        raise web.HTTPBadRequest(text=f'Falta el campo "{field}"')
+    request["body"] = body
+    return body
+
+
+async def post_message(request: web.Request) -> web.StreamResponse:
+    body = await read_body(request, "message")
+    return await stream_graph(request, {"messages": [{"role": "user", "content": body["message"]}]})
+
+
+async def post_resume(request: web.Request) -> web.StreamResponse:
+    # Respuesta humana para el interrupt de human_assistance (igual que /resume en main.py)
+    body = await read_body(request, "data")
+    return await stream_graph(request, Command(resume={"data": body["data"]}))
+
+
+async def health(request: web.Request) -> web.Response:
+    app = request.app
+    return web.json_response({"status": "ok", "active_sessions": len(app[ACTIVE_THREADS])})
+
+
+def create_app(graph, max_concurrency: int = 32, queue_timeout: float = 30.0) -> web.Application:
+    """
+    Crea el app aiohttp para un grafo compilado (con checkpointer).
+
+    max_concurrency limita las ejecuciones del grafo en paralelo en este
+    worker; las demás esperan hasta queue_timeout segundos.
+    """
+    app = web.Application()
+    app[GRAPH] = graph
+    app[LIMITER] = asyncio.Semaphore(max_concurrency)
+    app[ACTIVE_THREADS] = set()
+    app[QUEUE_TIMEOUT] = queue_timeout
+    app.router.add_post("/sessions/{user_id}/messages", post_message)
+    app.router.add_post("/sessions/{user_id}/resume", post_resume)
+    app.router.add_get("/health", health)
+    return app
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Servidor SSE para el chatbot del tutorial")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--max-concurrency", type=int, default=32, help="Ejecuciones del grafo en paralelo por worker")
+    parser.add_argument("--queue-timeout", type=float, default=30.0, help="Segundos de espera antes de responder 503")
+    args = parser.parse_args()
+
+    from app.graph import graph
+
+    web.run_app(create_app(graph, args.max_concurrency, args.queue_timeout), host=args.host, port=args.port)
+
+
+if __name__ == "__main__":
+    main()
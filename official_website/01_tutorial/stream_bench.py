@@ -0,0 +1,96 @@
+"""
+Benchmark del overhead por paso de cada stream_mode según el largo del historial.
+
+Arma el grafo del tutorial (app/builder.py) con el modelo y las tools falsas
+de app/fakes.py (latencia 0, así solo se mide el grafo) y un InMemorySaver.
+Para cada largo de historial siembra un thread con ese historial y ejecuta
+--turns turnos (memory → chatbot → tools → chatbot) con cada modo:
+
+- values             el modo anterior de main.py: el estado completo después de cada paso
+- updates            solo lo que agregó cada nodo
+- messages+updates   el modo actual de main.py y server.py: tokens + updates
+
+Reporta ms por paso y cuántos mensajes llegan al consumidor por turno (con
+"values" crece con el historial; con los otros modos no). La ventana de
+memory se desactiva para que el historial no se resuma.
+
+Ejecutar desde official_website/01_tutorial:
+    python stream_bench.py
+    python stream_bench.py --history 10 200 1000 5000 --turns 20
+"""
+
+import argparse
+import json
+import time
+
+from langchain_core.messages import AIMessage, HumanMessage
+from langgraph.checkpoint.memory import InMemorySaver
+
+from app.builder import build_graph
+from app.fakes import FakeToolChatModel, fake_tools
+
+MODES = {
+    "values": "values",
+    "updates": "updates",
+    "messages+updates": ["messages", "updates"],
+}
+# memory, chatbot (tool call), tools, chatbot (respuesta)
+STEPS_PER_TURN = 4
+
+
+def make_history(length: int) -> list:
+    text = "Lorem ipsum dolor sit amet, consectetur adipiscing elit. " * 4
+    return [
+        HumanMessage(content=f"pregunta {index}: {text}")
+        if index % 2 == 0
+        else AIMessage(content=f"respuesta {index}: {text}")
+        for index in range(length)
+    ]
+
+
+def emitted_messages(mode: str, chunk) -> int:
+    """Mensajes que el consumidor recibe en un chunk."""
+    if mode == "values":
+        return len(chunk.get("messages", []))
+    if isinstance(chunk, tuple):
+        # ("messages", (token, metadata)) o ("updates", {...})
+        chunk_mode, payload = chunk
+        if chunk_mode == "messages":
+            return 1
+        chunk = payload
+    return sum(len((update or {}).get("messages", [])) for update in chunk.values() if isinstance(update, dict))
+
+
+def bench(graph, history_length: int, mode: str, turns: int) -> dict:
+    config = {"configurable": {"thread_id": f"bench-{mode}-{history_length}"}}
+    graph.invoke({"messages": make_history(history_length)}, config)
+
+    emitted = 0
+    start = time.perf_counter()
+    for turn in range(turns):
+        command = {"messages": [{"role": "user", "content": f"noticias del tema {turn}"}]}
+        for chunk in graph.stream(command, config, stream_mode=MODES[mode]):
+            emitted += emitted_messages(mode, chunk)
+    elapsed = time.perf_counter() - start
+    return {
+        "ms_per_step": round(elapsed * 1000 / (turns * STEPS_PER_TURN), 3),
+        "messages_per_turn": round(emitted / turns, 1),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Overhead por paso de cada stream_mode")
+    parser.add_argument("--history", type=int, nargs="+", default=[10, 100, 500, 2000], help="Mensajes en el historial")
+    parser.add_argument("--turns", type=int, default=10, help="Turnos medidos por combinación")
+    args = parser.parse_args()
+
+    graph = build_graph(FakeToolChatModel(latency=0.0), fake_tools(0.0), InMemorySaver(), keep_turns=10**9)
+    results = {
+        str(length): {mode: bench(graph, length, mode, args.turns) for mode in MODES}
+        for length in args.history
+    }
+    print(json.dumps(results, indent=2, ensure_ascii=False))
+
+
+if __name__ == "__main__":
+    main()
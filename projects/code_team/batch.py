@@ -0,0 +1,218 @@
+"""
+Batch - Genera varios proyectos en paralelo con el mismo grafo.
+
+Lee una lista de specs en JSON y ejecuta un graph.ainvoke por proyecto:
+
+- cada proyecto escribe en su propio main_output (output/batch/<proyecto>/)
+- cada proyecto tiene su propio servidor MCP filesystem con raíz en su
+  main_output (un servidor compartido con raíz output/batch dejaría que el
+  agente de un proyecto lea y escriba los archivos de los demás)
+- todos comparten el cliente del modelo y el checkpointer SQLite
+- --concurrency limita los proyectos simultáneos y --rpm los requests por
+  minuto al modelo, sumando todos los proyectos
+
+Formato de las specs (lista JSON):
+    [
+      {
+        "project_name": "tasks_app",
+        "requirements": "Aplicación de gestión de tareas con autenticación...",
+        "backend_stack": "FastAPI, PostgreSQL, SQLAlchemy",
+        "frontend_stack": "React, TailwindCSS, Zustand"
+      }
+    ]
+
+Cada proyecto usa el thread "<batch_id>-<proyecto>" del checkpointer. Con
+--resume <batch_id> (y el mismo archivo de specs) los proyectos que quedaron a
+medias se retoman desde su último nodo completado, los terminados se
+reportan sin volver a ejecutarse y los que no llegaron a empezar se ejecutan.
+
+Ejecutar desde projects/code_team:
+    python batch.py projects.json
+    python batch.py projects.json --concurrency 3 --rpm 120
+    python batch.py projects.json --resume batch-20250101-120000
+"""
+
+import argparse
+import asyncio
+import json
+import re
+import time
+from datetime import datetime
+from pathlib import Path
+from langchain_core.messages import HumanMessage
+from graph import build_graph
+from graph.tools import mcp_filesystem_session
+from graph.agents import configure_rate_limit
+from graph.checkpoint import open_checkpointer
+from graph.report import build_run_report, write_run_report
+
+DEFAULT_BACKEND_STACK = "FastAPI, PostgreSQL, SQLAlchemy"
+DEFAULT_FRONTEND_STACK = "React, TailwindCSS, Zustand"
+
+
+def slugify(name: str) -> str:
+    return re.sub(r"[^a-z0-9_-]+", "_", name.lower()).strip("_") or "project"
+
+
+def load_specs(path: Path) -> list[dict]:
+    """Lee las specs y les asigna un nombre de directorio único."""
+    specs = json.loads(path.read_text(encoding="utf-8"))
+    if not isinstance(specs, list) or not specs:
+        raise ValueError(f"{path} debe contener una lista JSON de proyectos")
+
+    seen = set()
+    for index, spec in enumerate(specs, 1):
+        if not spec.get("requirements"):
+            raise ValueError(f"El proyecto #{index} no tiene 'requirements'")
+        spec.setdefault("project_name", f"project_{index}")
+        slug = slugify(spec["project_name"])
+        if slug in seen:
+            slug = f"{slug}_{index}"
+        seen.add(slug)
+        spec["slug"] = slug
+    return specs
+
+
+def initial_state(spec: dict, output_root: Path) -> dict:
+    main_output = output_root / spec["slug"]
+    main_output.mkdir(parents=True, exist_ok=True)
+    return {
+        "messages": [HumanMessage(content=spec["requirements"])],
+        "project_name": spec["project_name"],
+        "backend_stack": spec.get("backend_stack", DEFAULT_BACKEND_STACK),
+        "frontend_stack": spec.get("frontend_stack", DEFAULT_FRONTEND_STACK),
+        "main_output": str(main_output.resolve()),
+    }
+
+
+def node_errors(result: dict) -> list[str]:
+    """Primeras líneas de los mensajes de error que dejaron los nodos."""
+    errors = []
+    for msg in result.get("messages", []):
+        first_line = str(msg.content).splitlines()[0] if msg.content else ""
+        if "Error" in first_line:
+            errors.append(first_line)
+    return errors
+
+
+async def run_project(
+    graph, spec: dict, output_root: Path, batch_id: str, semaphore: asyncio.Semaphore, resume: bool = False
+) -> dict:
+    """Ejecuta (o retoma, con resume) el grafo para un proyecto y retorna su resumen."""
+    run_id = f"{batch_id}-{spec['slug']}"
+    config = {"configurable": {"thread_id": run_id}}
+    async with semaphore:
+        start = time.perf_counter()
+        state = initial_state(spec, output_root)
+        graph_input = state
+        snapshot = await graph.aget_state(config) if resume else None
+        if snapshot and snapshot.values and not snapshot.next:
+            print(f"✅ [{spec['slug']}] Ya estaba completo (run ID: {run_id})")
+            result = snapshot.values
+        else:
+            if snapshot and snapshot.values:
+                # None = continuar desde el último checkpoint con el estado guardado
+                graph_input = None
+                print(f"\n⏯️  [{spec['slug']}] Retomando desde: {', '.join(snapshot.next)} (run ID: {run_id})")
+            else:
+                print(f"\n🚀 [{spec['slug']}] Iniciando (run ID: {run_id})")
+            try:
+                # Servidor MCP confinado al directorio del proyecto (arranca con el primer nodo que lo usa)
+                async with mcp_filesystem_session(state["main_output"]) as mcp_session:
+                    result = await graph.ainvoke(graph_input, config)
+                print(f"🔌 [{spec['slug']}] {mcp_session.report()}")
+            except Exception as e:
+                seconds = round(time.perf_counter() - start, 1)
+                print(f"❌ [{spec['slug']}] Falló en {seconds}s: {type(e).__name__}: {e}")
+                return {"project": spec["slug"], "run_id": run_id, "status": "failed",
+                        "seconds": seconds, "errors": [f"{type(e).__name__}: {e}"]}
+
+    seconds = round(time.perf_counter() - start, 1)
+    write_run_report(result, run_id)
+    errors = node_errors(result)
+    status = "completed_with_errors" if errors else "completed"
+    print(f"{'⚠️ ' if errors else '✅'} [{spec['slug']}] {status} en {seconds}s")
+    return {
+        "project": spec["slug"],
+        "run_id": run_id,
+        "status": status,
+        "seconds": seconds,
+        "totals": build_run_report(result, run_id)["totals"],
+        "errors": errors,
+    }
+
+
+def format_summary(summary: dict) -> str:
+    lines = [f"{'proyecto':<28}{'estado':>24}{'tiempo':>10}{'costo':>10}"]
+    for project in summary["projects"]:
+        cost = project.get("totals", {}).get("cost_usd", 0.0)
+        lines.append(
+            f"{project['project']:<28}{project['status']:>24}{project['seconds']:>9.1f}s{'$' + format(cost, '.3f'):>10}"
+        )
+    lines.append(
+        f"\n{summary['completed']}/{summary['total']} completados, {summary['failed']} fallidos, "
+        f"{summary['with_errors']} con errores de nodos | {summary['seconds']:.0f}s en total | "
+        f"{summary['projects_per_hour']:.1f} proyectos/hora | ${summary['cost_usd']:.3f}"
+    )
+    return "\n".join(lines)
+
+
+async def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("specs", help="Archivo JSON con la lista de proyectos")
+    parser.add_argument("--concurrency", type=int, default=2, help="Proyectos ejecutándose a la vez")
+    parser.add_argument("--rpm", type=float, default=None, help="Requests por minuto al modelo (global)")
+    parser.add_argument("--output", default="output/batch", help="Directorio raíz de los proyectos")
+    parser.add_argument(
+        "--resume", metavar="BATCH_ID",
+        help="Retomar un batch anterior (mismo archivo de specs): cada proyecto continúa su thread",
+    )
+    args = parser.parse_args()
+
+    specs = load_specs(Path(args.specs))
+    output_root = Path(args.output).resolve()
+    output_root.mkdir(parents=True, exist_ok=True)
+    batch_id = args.resume or datetime.now().strftime("batch-%Y%m%d-%H%M%S")
+
+    configure_rate_limit(args.rpm)
+    semaphore = asyncio.Semaphore(args.concurrency)
+
+    print(f"\n📦 Batch {batch_id}: {len(specs)} proyectos, hasta {args.concurrency} en paralelo"
+          + (f", {args.rpm:.0f} requests/min" if args.rpm else ""))
+
+    start = time.perf_counter()
+    async with open_checkpointer() as checkpointer:
+        if args.resume and checkpointer is None:
+            print("❌ No se puede retomar sin checkpointer (pip install langgraph-checkpoint-sqlite)")
+            return
+        graph = build_graph(checkpointer)
+        projects = await asyncio.gather(
+            *(run_project(graph, spec, output_root, batch_id, semaphore, bool(args.resume)) for spec in specs)
+        )
+    seconds = time.perf_counter() - start
+
+    summary = {
+        "batch_id": batch_id,
+        "total": len(projects),
+        "completed": sum(project["status"] != "failed" for project in projects),
+        "failed": sum(project["status"] == "failed" for project in projects),
+        "with_errors": sum(project["status"] == "completed_with_errors" for project in projects),
+        "seconds": round(seconds, 1),
+        "projects_per_hour": round(len(projects) / seconds * 3600, 2) if seconds else 0.0,
+        "cost_usd": round(sum(project.get("totals", {}).get("cost_usd", 0.0) for project in projects), 4),
+        "concurrency": args.concurrency,
+        "rpm": args.rpm,
+        "projects": projects,
+    }
+    summary_path = output_root / f"{batch_id}.json"
+    summary_path.write_text(json.dumps(summary, indent=2, ensure_ascii=False), encoding="utf-8")
+
+    print("\n📊 Resumen del batch:")
+    print(format_summary(summary))
+    print(f"\n🧾 Resumen guardado en: {summary_path}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
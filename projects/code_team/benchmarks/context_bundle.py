@@ -0,0 +1,94 @@
+"""
+Benchmark del contexto precargado en el subgrafo backend.
+
+Ejecuta el subgrafo backend dos veces sobre las mismas user stories y la misma
+planificación (copiadas de una ejecución previa), una sin bundle y otra con
+bundle, y compara turnos de LLM, tool calls y tiempo por nodo.
+
+Requiere OPENAI_API_KEY: los agentes se ejecutan de verdad.
+
+Ejecutar desde projects/code_team (después de al menos una ejecución de main.py):
+    python -m benchmarks.context_bundle
+    python -m benchmarks.context_bundle --source output --filesystem-backend mcp
+"""
+
+import argparse
+import asyncio
+import shutil
+import tempfile
+from pathlib import Path
+from graph.nodes.backend_subgraph import create_backend_subgraph, BACKEND_MAX_CONCURRENCY
+from graph.tools import close_mcp_sessions
+
+
+async def run_subgraph(source: Path, workdir: Path, context_bundle: bool, filesystem_backend: str) -> list[dict]:
+    """Copia las entradas a `workdir` y ejecuta el subgrafo backend."""
+    shutil.copytree(source / "user_stories", workdir / "user_stories")
+    shutil.copytree(source / "sprint_planning", workdir / "sprint_planning")
+    backend_dir = workdir / "app/backend"
+    backend_dir.mkdir(parents=True)
+
+    state = {
+        "messages": [],
+        "project_name": "benchmark_project",
+        "main_output": str(workdir),
+        "user_stories_dir": str(workdir / "user_stories"),
+        "sprint_planning_dir": str(workdir / "sprint_planning"),
+        "backend_output_dir": str(backend_dir),
+        "filesystem_backend": filesystem_backend,
+        "context_bundle": context_bundle,
+        "agent_stats": [],
+        "completed_units": [],
+    }
+    result = await create_backend_subgraph().ainvoke(
+        state, {"max_concurrency": BACKEND_MAX_CONCURRENCY, "recursion_limit": 100}
+    )
+    return result.get("agent_stats", [])
+
+
+async def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--source", default="output", help="Directorio con user_stories/ y sprint_planning/")
+    parser.add_argument("--filesystem-backend", default="native", choices=["native", "mcp"])
+    args = parser.parse_args()
+
+    source = Path(args.source).resolve()
+    if not (source / "sprint_planning" / "backend_tasks.md").exists():
+        print(f"❌ {source} no contiene sprint_planning/backend_tasks.md. Ejecuta main.py primero.")
+        return
+
+    runs = {}
+    try:
+        for label, enabled in (("sin bundle", False), ("con bundle", True)):
+            print(f"\n⏱️  Subgrafo backend {label}...")
+            with tempfile.TemporaryDirectory(prefix="context_bundle_") as tmp:
+                stats = await run_subgraph(source, Path(tmp).resolve(), enabled, args.filesystem_backend)
+            runs[label] = {entry["stage"]: entry for entry in stats}
+    finally:
+        await close_mcp_sessions()
+
+    without, with_bundle = runs["sin bundle"], runs["con bundle"]
+    print(f"\n{'etapa':<18}{'turnos sin':>12}{'turnos con':>12}{'tiempo sin':>12}{'tiempo con':>12}")
+    for stage in without:
+        before, after = without[stage], with_bundle.get(stage)
+        if after is None:
+            continue
+        print(
+            f"{stage:<18}{before['llm_turns']:>12}{after['llm_turns']:>12}"
+            f"{before['seconds']:>11.1f}s{after['seconds']:>11.1f}s"
+        )
+
+    turns_before = sum(entry["llm_turns"] for entry in without.values())
+    turns_after = sum(entry["llm_turns"] for entry in with_bundle.values())
+    seconds_before = sum(entry["seconds"] for entry in without.values())
+    seconds_after = sum(entry["seconds"] for entry in with_bundle.values())
+    print(
+        f"{'total':<18}{turns_before:>12}{turns_after:>12}"
+        f"{seconds_before:>11.1f}s{seconds_after:>11.1f}s"
+    )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
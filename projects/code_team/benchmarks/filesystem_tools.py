@@ -0,0 +1,161 @@
+"""
+Benchmark de las tools de filesystem: servidor MCP (npx) vs tools nativas en proceso.
+
+Mide:
+- Latencia por llamada de cada tool (p50 / p95)
+- Tiempo total de una "etapa" sintética que reproduce el patrón de llamadas de
+  un paso del subgrafo backend (crear directorios, escribir ~N archivos,
+  releerlos, listar y buscar), incluyendo el arranque del backend
+
+No usa el LLM: invoca las tools directamente, igual que lo haría el ToolNode
+del agente. Trabaja sobre un directorio temporal.
+
+Ejecutar desde projects/code_team:
+    python -m benchmarks.filesystem_tools
+    python -m benchmarks.filesystem_tools --calls 200 --files 40
+    python -m benchmarks.filesystem_tools --backends native
+"""
+
+import argparse
+import asyncio
+import statistics
+import tempfile
+import time
+from pathlib import Path
+from graph.tools import MCPFilesystemSession, NativeFilesystem
+
+SAMPLE_MODULE = '''"""Modelo generado para el benchmark."""
+
+from sqlalchemy import Column, Integer, String
+from app.db.base import Base
+
+
+class Entity{index}(Base):
+    __tablename__ = "entity_{index}"
+
+    id = Column(Integer, primary_key=True, index=True)
+    name = Column(String(255), nullable=False)
+'''
+
+
+def percentile(values: list[float], pct: float) -> float:
+    """Percentil nearest-rank de una lista de floats."""
+    ordered = sorted(values)
+    index = max(0, min(len(ordered) - 1, round(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+async def start_backend(backend: str, root: Path):
+    """Arranca el backend y retorna (tools por nombre, cierre, segundos de arranque)."""
+    start = time.perf_counter()
+    if backend == "native":
+        tools = NativeFilesystem(root).as_tools()
+
+        async def close():
+            pass
+    else:
+        session = MCPFilesystemSession(root)
+        tools = await session.get_tools()
+        close = session.close
+    return {tool.name: tool for tool in tools}, close, time.perf_counter() - start
+
+
+async def time_calls(tool, args_list: list[dict]) -> list[float]:
+    """Ejecuta la tool con cada juego de argumentos y retorna latencias en ms."""
+    latencies = []
+    for args in args_list:
+        start = time.perf_counter()
+        await tool.ainvoke(args)
+        latencies.append((time.perf_counter() - start) * 1000)
+    return latencies
+
+
+async def per_call_latency(tools: dict, root: Path, calls: int) -> dict[str, list[float]]:
+    """Latencia por llamada de las tools más usadas por los agentes."""
+    bench_dir = root / "per_call"
+    await tools["create_directory"].ainvoke({"path": str(bench_dir)})
+    paths = [str(bench_dir / f"file_{i}.py") for i in range(calls)]
+    content = SAMPLE_MODULE.format(index=0)
+
+    return {
+        "write_file": await time_calls(
+            tools["write_file"], [{"path": path, "content": content} for path in paths]
+        ),
+        "read_file": await time_calls(tools["read_file"], [{"path": path} for path in paths]),
+        "list_directory": await time_calls(
+            tools["list_directory"], [{"path": str(bench_dir)}] * min(calls, 50)
+        ),
+        "search_files": await time_calls(
+            tools["search_files"], [{"path": str(bench_dir), "pattern": "file_1"}] * min(calls, 50)
+        ),
+    }
+
+
+async def synthetic_stage(tools: dict, root: Path, files: int) -> float:
+    """Reproduce el patrón de llamadas de un paso backend y retorna segundos."""
+    app_dir = root / "stage" / "app"
+    start = time.perf_counter()
+    for sub in ("models", "schemas", "crud", "api"):
+        await tools["create_directory"].ainvoke({"path": str(app_dir / sub)})
+    await tools["directory_tree"].ainvoke({"path": str(app_dir)})
+    paths = [str(app_dir / "models" / f"entity_{i}.py") for i in range(files)]
+    for i, path in enumerate(paths):
+        await tools["write_file"].ainvoke({"path": path, "content": SAMPLE_MODULE.format(index=i)})
+    await tools["read_multiple_files"].ainvoke({"paths": paths})
+    for path in paths:
+        await tools["read_file"].ainvoke({"path": path})
+    await tools["search_files"].ainvoke({"path": str(app_dir), "pattern": "entity"})
+    await tools["list_directory"].ainvoke({"path": str(app_dir / "models")})
+    return time.perf_counter() - start
+
+
+async def run_backend(backend: str, calls: int, files: int) -> dict:
+    with tempfile.TemporaryDirectory(prefix=f"fs_bench_{backend}_") as tmp:
+        root = Path(tmp).resolve()
+        tools, close, startup = await start_backend(backend, root)
+        try:
+            latencies = await per_call_latency(tools, root, calls)
+            stage = await synthetic_stage(tools, root, files)
+        finally:
+            await close()
+    return {"backend": backend, "startup": startup, "latencies": latencies, "stage": stage}
+
+
+async def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--calls", type=int, default=100, help="Llamadas por tool")
+    parser.add_argument("--files", type=int, default=25, help="Archivos de la etapa sintética")
+    parser.add_argument(
+        "--backends", nargs="+", default=["native", "mcp"], choices=["native", "mcp"]
+    )
+    args = parser.parse_args()
+
+    reports = []
+    for backend in args.backends:
+        print(f"⏱️  Midiendo backend {backend}...")
+        try:
+            reports.append(await run_backend(backend, args.calls, args.files))
+        except Exception as e:
+            print(f"   ⚠️  Backend {backend} no disponible: {e}")
+
+    if not reports:
+        return
+
+    print(f"\n{'tool':<16}" + "".join(f"{r['backend'] + ' p50':>14}{r['backend'] + ' p95':>14}" for r in reports))
+    for tool_name in reports[0]["latencies"]:
+        row = f"{tool_name:<16}"
+        for report in reports:
+            values = report["latencies"][tool_name]
+            row += f"{statistics.median(values):>12.2f}ms{percentile(values, 95):>12.2f}ms"
+        print(row)
+
+    print(f"\n{'backend':<10}{'arranque':>12}{'etapa':>12}{'total':>12}")
+    for report in reports:
+        total = report["startup"] + report["stage"]
+        print(f"{report['backend']:<10}{report['startup']:>11.2f}s{report['stage']:>11.2f}s{total:>11.2f}s")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,197 @@
+"""
+Agents - Ejecución de los agentes ReAct de cada nodo con métricas básicas.
+
+Todos los nodos crean el mismo tipo de agente (create_react_agent sobre las
+tools de filesystem). run_agent centraliza esa creación y mide cuántos turnos
+de LLM, tool calls (por nombre de tool), tokens, costo estimado y tiempo
+consumió cada etapa, para poder comparar cambios como el contexto precargado
+(graph/context.py) y encontrar las etapas más caras (graph/report.py).
+Además aplica el presupuesto de cada etapa (graph/budget.py) y corta los
+agentes en loop.
+"""
+
+import asyncio
+import time
+from collections import Counter
+from langchain.chat_models import init_chat_model
+from langchain_core.messages import AIMessage, HumanMessage, SystemMessage
+from langchain_core.rate_limiters import InMemoryRateLimiter
+from langgraph.errors import GraphRecursionError
+from langgraph.prebuilt import create_react_agent
+from graph.events import emit, tool_paths, WRITE_TOOLS
+from graph.budget import AgentBudget
+
+AGENT_MODEL = "openai:gpt-4.1"
+
+# Precio en USD por millón de tokens (input, output) para estimar el costo
+MODEL_PRICES = {
+    "openai:gpt-4.1": (2.00, 8.00),
+    "openai:gpt-4.1-mini": (0.40, 1.60),
+    "openai:gpt-4o": (2.50, 10.00),
+    "anthropic:claude-sonnet-4-5": (3.00, 15.00),
+}
+
+
+# Un cliente por modelo compartido por todos los agentes (y proyectos del batch)
+_chat_models = {}
+_rate_limiter = None
+
+
+def configure_rate_limit(requests_per_minute: float | None):
+    """
+    Limita los requests al modelo para todos los agentes del proceso.
+
+    El limitador es compartido: con varios proyectos en paralelo (batch.py)
+    el presupuesto es global, no por proyecto. None lo desactiva.
+    """
+    global _rate_limiter
+    _rate_limiter = (
+        InMemoryRateLimiter(requests_per_second=requests_per_minute / 60, check_every_n_seconds=0.1)
+        if requests_per_minute else None
+    )
+    _chat_models.clear()
+
+
+def get_chat_model(model: str = AGENT_MODEL):
+    """Retorna el cliente del modelo, creándolo una sola vez por proceso."""
+    if model not in _chat_models:
+        _chat_models[model] = init_chat_model(model, rate_limiter=_rate_limiter)
+    return _chat_models[model]
+
+
+def estimate_cost(model: str, input_tokens: int, output_tokens: int) -> float:
+    """Costo estimado en USD; 0 si el modelo no está en MODEL_PRICES."""
+    input_price, output_price = MODEL_PRICES.get(model, (0.0, 0.0))
+    return round((input_tokens * input_price + output_tokens * output_price) / 1_000_000, 4)
+
+
+def emit_agent_step(stage: str, msg: AIMessage):
+    """Eventos de una respuesta del modelo: tokens, tool calls y archivos escritos."""
+    usage = msg.usage_metadata or {}
+    emit(
+        "llm_turn", stage=stage,
+        input_tokens=usage.get("input_tokens", 0), output_tokens=usage.get("output_tokens", 0),
+    )
+    for call in msg.tool_calls:
+        paths = tool_paths(call["args"])
+        emit("tool_call", stage=stage, tool=call["name"], paths=paths)
+        if call["name"] in WRITE_TOOLS:
+            for path in paths:
+                emit("file_written", stage=stage, path=path)
+
+
+async def run_agent(stage: str, prompt: str, tools: list, model: str = AGENT_MODEL):
+    """
+    Ejecuta un agente ReAct y retorna (resultado, estadísticas).
+
+    Args:
+        stage: Nombre de la etapa (ej: "backend_models"), usado en el reporte
+        prompt: Prompt inicial del agente
+        tools: Tools disponibles para el agente
+        model: Modelo en formato "proveedor:modelo"
+
+    Returns:
+        tuple: (estado final del agente, dict con stage, model, llm_turns, tool_calls,
+                tool_calls_by_name, input_tokens, output_tokens, cost_usd, seconds, stopped)
+
+    Si el agente agota su presupuesto (pasos, tiempo, tokens) o entra en loop,
+    se corta y el resultado contiene los mensajes hasta ese punto; el motivo
+    queda en stats["stopped"] (None si terminó normalmente).
+    """
+    agent = create_react_agent(get_chat_model(model), tools)
+    budget = AgentBudget(stage)
+
+    start = time.perf_counter()
+    emit("agent_start", stage=stage, model=model)
+    # Streaming paso a paso: cada respuesta se emite (graph/events.py) y pasa por el presupuesto
+    messages = [HumanMessage(content=prompt)]
+    stream = agent.astream(
+        {"messages": prompt}, {"recursion_limit": budget.limits["max_steps"]}, stream_mode="updates"
+    )
+    try:
+        async with asyncio.timeout(budget.limits["max_seconds"]):
+            async for chunk in stream:
+                step_messages = [msg for update in chunk.values() for msg in (update or {}).get("messages", [])]
+                messages += step_messages
+                for msg in step_messages:
+                    if isinstance(msg, AIMessage):
+                        emit_agent_step(stage, msg)
+                        budget.observe(msg)
+                if budget.stopped:
+                    break
+    except TimeoutError:
+        budget.timeout()
+    except GraphRecursionError:
+        budget.steps_exhausted()
+    finally:
+        await stream.aclose()
+    elapsed = time.perf_counter() - start
+    result = {"messages": messages}
+
+    ai_messages = [msg for msg in result["messages"] if isinstance(msg, AIMessage)]
+    tool_names = Counter(call["name"] for msg in ai_messages for call in msg.tool_calls)
+    # usage_metadata lo completan los chat models que reportan uso de tokens
+    input_tokens = sum((msg.usage_metadata or {}).get("input_tokens", 0) for msg in ai_messages)
+    output_tokens = sum((msg.usage_metadata or {}).get("output_tokens", 0) for msg in ai_messages)
+    stats = {
+        "stage": stage,
+        "model": model,
+        "llm_turns": len(ai_messages),
+        "tool_calls": sum(tool_names.values()),
+        "tool_calls_by_name": dict(tool_names.most_common()),
+        "input_tokens": input_tokens,
+        "output_tokens": output_tokens,
+        "cost_usd": estimate_cost(model, input_tokens, output_tokens),
+        "seconds": round(elapsed, 2),
+        "stopped": budget.stopped,
+    }
+    if budget.stopped:
+        stats["budget"] = budget.summary()
+        emit("agent_stopped", stage=stage, reason=budget.stopped)
+        print(f"   ⛔ {stage}: agente detenido ({budget.stopped})")
+    emit("agent_end", **stats)
+    print(
+        f"   📊 {stage}: {stats['llm_turns']} turnos LLM, "
+        f"{stats['tool_calls']} tool calls, "
+        f"{input_tokens + output_tokens} tokens (${stats['cost_usd']:.3f}), {stats['seconds']:.1f}s"
+    )
+    return result, stats
+
+
+def stopped_update(node: str, stats: dict) -> dict | None:
+    """
+    Update de error para un nodo cuyo agente fue cortado por el presupuesto.
+
+    Un agente detenido deja el trabajo a medias: el nodo lo informa como
+    fallo (y no registra su cache) en vez de darlo por completado.
+
+    Returns:
+        dict | None: Update con el mensaje de error y las stats, o None si el agente terminó normalmente
+    """
+    if not stats.get("stopped"):
+        return None
+    error_msg = f"{node} - Error: agente {stats['stage']} detenido ({stats['stopped']})"
+    print(f"❌ {error_msg}")
+    return {"messages": [SystemMessage(content=error_msg)], "agent_stats": [stats]}
+
+
+def format_agent_stats(agent_stats: list[dict]) -> str:
+    """Tabla de turnos LLM, tool calls, tokens, costo y tiempo por etapa."""
+    header = f"{'etapa':<28}{'turnos LLM':>12}{'tool calls':>12}{'tokens in':>12}{'tokens out':>12}{'costo':>10}{'tiempo':>10}"
+    lines = [header]
+
+    def row(name, stats_list):
+        turns = sum(stats["llm_turns"] for stats in stats_list)
+        calls = sum(stats["tool_calls"] for stats in stats_list)
+        tokens_in = sum(stats.get("input_tokens", 0) for stats in stats_list)
+        tokens_out = sum(stats.get("output_tokens", 0) for stats in stats_list)
+        cost = sum(stats.get("cost_usd", 0.0) for stats in stats_list)
+        seconds = sum(stats["seconds"] for stats in stats_list)
+        return f"{name:<28}{turns:>12}{calls:>12}{tokens_in:>12}{tokens_out:>12}{'$' + format(cost, '.3f'):>10}{seconds:>9.1f}s"
+
+    for stats in agent_stats:
+        # ⛔ marca los agentes cortados por presupuesto (graph/budget.py)
+        name = f"⛔ {stats['stage']}" if stats.get("stopped") else stats["stage"]
+        lines.append(row(name, [stats]))
+    lines.append(row("total", agent_stats))
+    return "\n".join(lines)
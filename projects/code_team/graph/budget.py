@@ -0,0 +1,125 @@
+"""
+Budget - Presupuestos y corte temprano para los agentes ReAct.
+
+Antes cada agente tenía recursion_limit=100: un agente que entra en loop
+(relee el mismo archivo, reescribe el mismo archivo) gastaba minutos hasta
+fallar con GraphRecursionError, y el nodo se tragaba el error.
+
+AgentBudget observa cada respuesta del modelo mientras el agente corre
+(graph/agents.py la alimenta desde el stream) y corta la ejecución cuando:
+
+- una misma tool call (nombre + argumentos) se repite más de max_repeats veces
+  desde la última escritura (releer un archivo después de escribirlo es progreso)
+- pasan max_idle_turns turnos seguidos sin ninguna tool call nueva (loop sin progreso)
+- se supera el presupuesto de tokens de la etapa
+- se supera el tiempo de la etapa (lo aplica run_agent con asyncio.timeout)
+
+El límite de pasos (recursion_limit) también depende de la etapa. Al cortar,
+run_agent retorna lo que el agente hizo hasta ese momento y el motivo en
+stats["stopped"]; los nodos tratan ese caso como un fallo y no registran el
+cache de la etapa.
+"""
+
+import json
+import os
+from collections import Counter
+from langchain_core.messages import AIMessage
+from graph.events import WRITE_TOOLS
+
+DEFAULT_BUDGET = {
+    "max_steps": int(os.getenv("AGENT_MAX_STEPS", "100")),
+    "max_seconds": float(os.getenv("AGENT_MAX_SECONDS", "600")),
+    "max_tokens": int(os.getenv("AGENT_MAX_TOKENS", "400000")),
+    "max_repeats": int(os.getenv("AGENT_MAX_REPEATS", "3")),
+    "max_idle_turns": int(os.getenv("AGENT_MAX_IDLE_TURNS", "6")),
+}
+
+# Ajustes por etapa (clave: etapa sin la entidad, ej. "backend_models" para "backend_models:task")
+STAGE_BUDGETS = {
+    "product_manager": {"max_steps": 80, "max_seconds": 900},
+    "scrum_master": {"max_steps": 80, "max_seconds": 900},
+    "api_contract": {"max_steps": 40},
+    "backend_setup": {"max_steps": 80},
+    "backend_models": {"max_steps": 30, "max_seconds": 300, "max_tokens": 150000},
+    "backend_schemas": {"max_steps": 30, "max_seconds": 300, "max_tokens": 150000},
+    "backend_crud": {"max_steps": 30, "max_seconds": 300, "max_tokens": 150000},
+    "backend_api": {"max_steps": 40, "max_seconds": 400, "max_tokens": 200000},
+    "backend_repair": {"max_steps": 24, "max_seconds": 300, "max_tokens": 150000},
+    "frontend_feature": {"max_steps": 60},
+    "qa_frontend": {"max_steps": 30, "max_seconds": 300},
+    "qa_contract": {"max_steps": 30, "max_seconds": 300},
+}
+
+
+def stage_budget(stage: str) -> dict:
+    """Presupuesto de una etapa: DEFAULT_BUDGET con los ajustes de STAGE_BUDGETS."""
+    return {**DEFAULT_BUDGET, **STAGE_BUDGETS.get(stage.split(":")[0], {})}
+
+
+class AgentBudget:
+    """
+    Controla el presupuesto de un agente a partir de sus respuestas.
+
+    Uso:
+        budget = AgentBudget("backend_models:task")
+        for msg in respuestas_del_agente:
+            if budget.observe(msg):
+                break   # budget.stopped tiene el motivo
+    """
+
+    def __init__(self, stage: str, **overrides):
+        self.stage = stage
+        self.limits = {**stage_budget(stage), **overrides}
+        self.tokens = 0
+        self.turns = 0
+        self.idle_turns = 0
+        self.calls = Counter()
+        self.stopped = None
+
+    @staticmethod
+    def call_key(call: dict) -> str:
+        return f"{call['name']}({json.dumps(call['args'], sort_keys=True, default=str)})"
+
+    def observe(self, msg: AIMessage) -> str | None:
+        """Registra una respuesta del modelo; retorna el motivo de corte o None."""
+        self.turns += 1
+        usage = msg.usage_metadata or {}
+        self.tokens += usage.get("input_tokens", 0) + usage.get("output_tokens", 0)
+
+        new_calls = 0
+        for call in msg.tool_calls:
+            key = self.call_key(call)
+            new_calls += key not in self.calls
+            self.calls[key] += 1
+            if self.calls[key] > self.limits["max_repeats"]:
+                self.stopped = f"tool call repetida {self.calls[key]} veces: {key[:120]}"
+                return self.stopped
+
+        # Después de una escritura solo siguen contando las escrituras idénticas
+        if any(call["name"] in WRITE_TOOLS for call in msg.tool_calls):
+            self.calls = Counter({key: count for key, count in self.calls.items() if key.split("(")[0] in WRITE_TOOLS})
+
+        # Turnos con tool calls pero ninguna nueva: releer o reescribir lo mismo
+        self.idle_turns = self.idle_turns + 1 if msg.tool_calls and not new_calls else 0
+        if self.idle_turns >= self.limits["max_idle_turns"]:
+            self.stopped = f"{self.idle_turns} turnos seguidos sin tool calls nuevas"
+        elif self.tokens > self.limits["max_tokens"]:
+            self.stopped = f"presupuesto de tokens agotado ({self.tokens} > {self.limits['max_tokens']})"
+        return self.stopped
+
+    def timeout(self) -> str:
+        self.stopped = f"tiempo agotado ({self.limits['max_seconds']:.0f}s)"
+        return self.stopped
+
+    def steps_exhausted(self) -> str:
+        self.stopped = f"límite de pasos alcanzado ({self.limits['max_steps']})"
+        return self.stopped
+
+    def summary(self) -> dict:
+        """Estado del presupuesto para las estadísticas del agente."""
+        return {
+            "limits": self.limits,
+            "tokens": self.tokens,
+            "turns": self.turns,
+            "repeated_calls": {key: count for key, count in self.calls.items() if count > 1},
+        }
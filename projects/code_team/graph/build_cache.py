@@ -0,0 +1,185 @@
+"""
+Build Cache - Memoización de etapas por hash de contenido (estilo make).
+
+Antes, Product Manager y Scrum Master se saltaban si su directorio de salida
+tenía cualquier .md: no detectaban cambios en las entradas y, si faltaba un
+solo archivo, igual había que borrar todo para regenerar.
+
+Cada etapa guarda un manifest en {main_output}/.build_cache/<stage>.json con:
+- input_hash: hash del prompt, de los artefactos upstream, del stack y del modelo
+- outputs: hash de cada archivo que generó
+
+Una etapa se reejecuta solo si cambia su input_hash o falta alguno de sus
+archivos de salida (un archivo editado a mano se conserva, no invalida la etapa). Como el input_hash de cada etapa incluye el
+contenido de los artefactos upstream, regenerar una etapa invalida en cascada únicamente a
+las etapas cuyas entradas realmente cambiaron.
+"""
+
+import hashlib
+import json
+import os
+from datetime import datetime
+from pathlib import Path
+from dotenv import load_dotenv
+from graph.agents import AGENT_MODEL
+
+load_dotenv()
+
+BUILD_CACHE_ENABLED = os.getenv("BUILD_CACHE", "1").lower() not in ("0", "false", "no")
+CACHE_DIR = ".build_cache"
+IGNORED_DIRS = {CACHE_DIR, "node_modules", "__pycache__", ".pytest_cache"}
+
+
+def hash_text(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def hash_file(path: Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 16), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def list_files(path: Path) -> list[Path]:
+    """Archivos bajo `path` (un archivo o un directorio recorrido recursivamente, sin IGNORED_DIRS)."""
+    if path.is_file():
+        return [path]
+    if path.is_dir():
+        return [
+            file for file in sorted(path.rglob("*"))
+            if file.is_file() and not IGNORED_DIRS.intersection(file.relative_to(path).parts)
+        ]
+    return []
+
+
+def hash_paths(paths: list, root: Path) -> dict[str, str]:
+    """
+    Hash de cada archivo bajo `paths` (archivos o directorios), con claves
+    relativas a `root`. Los directorios se recorren recursivamente.
+    """
+    hashes = {}
+    for path in paths:
+        for file in list_files(Path(path)):
+            key = file.resolve().relative_to(root) if file.resolve().is_relative_to(root) else file.resolve()
+            hashes[str(key)] = hash_file(file)
+    return hashes
+
+
+def hash_sources(*paths: Path) -> str:
+    """Hash del código (prompts y lógica) de una etapa: archivos .py en `paths`."""
+    hashes = {}
+    for path in map(Path, paths):
+        files = [path] if path.is_file() else sorted(path.rglob("*.py"))
+        for file in files:
+            if "__pycache__" not in file.parts:
+                key = file.relative_to(path.parent if path.is_file() else path)
+                hashes[f"{path.name}/{key}"] = hash_file(file)
+    return hash_text(json.dumps(hashes, sort_keys=True))
+
+
+class StageCache:
+    """
+    Manifest de una etapa del grafo.
+
+    Uso:
+        cache = StageCache(main_output, "scrum_master")
+        input_hash = cache.input_hash(prompt, [user_stories_dir], stage_config(state))
+        if cache.is_fresh(input_hash):
+            return ...  # salida reutilizada
+        cache.clean_outputs()
+        ... ejecutar agente ...
+        cache.record(input_hash, [output_dir])
+    """
+
+    def __init__(self, main_output: str, stage: str):
+        self.root = Path(main_output).resolve()
+        self.stage = stage
+        self.path = self.root / CACHE_DIR / f"{stage}.json"
+        self.manifest = self._load()
+        self.inputs = {}
+        self.reason = ""
+
+    def _load(self) -> dict:
+        if not self.path.exists():
+            return {}
+        try:
+            return json.loads(self.path.read_text(encoding="utf-8"))
+        except json.JSONDecodeError:
+            return {}
+
+    def input_hash(self, prompt: str, upstream: list, config: dict) -> str:
+        """Hash de las entradas: prompt, contenido de los artefactos upstream y configuración."""
+        self.inputs = {
+            "prompt": hash_text(prompt),
+            "upstream": hash_paths([path for path in upstream if path], self.root),
+            "config": config,
+        }
+        return hash_text(json.dumps(self.inputs, sort_keys=True))
+
+    def is_fresh(self, input_hash: str) -> bool:
+        """
+        Indica si la salida registrada sigue siendo válida para estas entradas.
+        El motivo queda en self.reason.
+        """
+        if not BUILD_CACHE_ENABLED:
+            self.reason = "cache deshabilitado (BUILD_CACHE=0)"
+            return False
+        if not self.manifest:
+            self.reason = "sin ejecución previa"
+            return False
+        if self.manifest.get("input_hash") != input_hash:
+            self.reason = "cambiaron las entradas"
+            return False
+        outputs = self.manifest.get("outputs", {})
+        if not outputs:
+            self.reason = "la ejecución previa no generó archivos"
+            return False
+        missing = [name for name in outputs if not (self.root / name).is_file()]
+        if missing:
+            self.reason = f"faltan {len(missing)} archivo(s) de salida: {', '.join(missing[:3])}"
+            return False
+        # Un archivo editado a mano no invalida la etapa: se conserva y solo se avisa
+        modified = [name for name, digest in outputs.items() if hash_file(self.root / name) != digest]
+        self.reason = f"entradas sin cambios, {len(outputs)} archivo(s) reutilizados"
+        if modified:
+            self.reason += f" ({len(modified)} editado(s) a mano y conservado(s): {', '.join(modified[:3])})"
+        return True
+
+    def clean_outputs(self):
+        """
+        Borra los archivos generados en la ejecución previa antes de regenerar.
+
+        Solo se borran archivos listados en el manifest y que siguen como la
+        etapa los dejó: sin manifest no se borra nada, y un archivo editado a
+        mano se conserva.
+        """
+        for name, digest in self.manifest.get("outputs", {}).items():
+            path = self.root / name
+            if path.is_file() and hash_file(path) == digest:
+                path.unlink()
+
+    def record(self, input_hash: str, outputs: list):
+        """Guarda el manifest con las entradas y los hashes de salida actuales."""
+        self.manifest = {
+            "stage": self.stage,
+            "input_hash": input_hash,
+            "inputs": self.inputs,
+            "outputs": hash_paths(outputs, self.root),
+            "updated_at": datetime.now().isoformat(timespec="seconds"),
+        }
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix(".json.tmp")
+        tmp_path.write_text(json.dumps(self.manifest, indent=2, ensure_ascii=False), encoding="utf-8")
+        tmp_path.replace(self.path)
+
+
+def stage_config(state: dict) -> dict:
+    """Configuración que afecta la salida de cualquier etapa."""
+    return {
+        "model": AGENT_MODEL,
+        "project_name": state.get("project_name"),
+        "backend_stack": state.get("backend_stack"),
+        "frontend_stack": state.get("frontend_stack"),
+    }
@@ -2,32 +2,53 @@ from langgraph.graph import StateGraph, END
 from graph.state import GraphState
 from graph.nodes.product_manager import product_manager_node_async
 from graph.nodes.scrum_master import scrum_master_node_async
+from graph.nodes.api_contract import api_contract_node_async
 from graph.nodes.backend_developer import backend_developer_node_async
+from graph.nodes.frontend_developer import frontend_developer_node_async
+from graph.nodes.contract_check import contract_check_node
+from graph.nodes.qa_engineer import qa_engineer_node_async
+from graph.checkpoint import timed_node
 
 
-def build_graph() -> StateGraph:
+def build_graph(checkpointer=None) -> StateGraph:
     """
     Crea el workflow del equipo de desarrollo.
 
-    Flujo secuencial:
-    PM → SM → Backend → Frontend → QA → Review
+    Flujo contract-first:
+    PM → SM → API Contract → (Backend ‖ Frontend) → (Contract Check ‖ QA)
 
-    Backend y Frontend se ejecutan secuencialmente porque
-    Frontend necesita saber los endpoints del Backend.
+    El contrato OpenAPI fija los endpoints antes de implementar, así que
+    Backend y Frontend se ejecutan como ramas paralelas contra el mismo
+    contrato. Cuando ambas terminan, Contract Check reconcilia el resultado
+    y QA genera la suite de tests, también en paralelo.
+
+    Con un checkpointer (ver graph/checkpoint.py) cada paso queda persistido
+    bajo el thread_id del config y la ejecución se puede retomar.
     """
 
     workflow = StateGraph(GraphState)
 
-    workflow.add_node("product_manager", product_manager_node_async)
-    workflow.add_node("scrum_master", scrum_master_node_async)
-    workflow.add_node("backend_developer", backend_developer_node_async)
+    workflow.add_node("product_manager", timed_node("product_manager", product_manager_node_async))
+    workflow.add_node("scrum_master", timed_node("scrum_master", scrum_master_node_async))
+    workflow.add_node("api_contract", timed_node("api_contract", api_contract_node_async))
+    workflow.add_node("backend_developer", timed_node("backend_developer", backend_developer_node_async))
+    workflow.add_node("frontend_developer", timed_node("frontend_developer", frontend_developer_node_async))
+    workflow.add_node("contract_check", timed_node("contract_check", contract_check_node))
+    workflow.add_node("qa_engineer", timed_node("qa_engineer", qa_engineer_node_async))
 
     workflow.set_entry_point("product_manager")
     workflow.add_edge("product_manager", "scrum_master")
-    workflow.add_edge("scrum_master", "backend_developer")
-    workflow.add_edge("backend_developer", END)
+    workflow.add_edge("scrum_master", "api_contract")
+    # Backend y Frontend en paralelo contra el contrato
+    workflow.add_edge("api_contract", "backend_developer")
+    workflow.add_edge("api_contract", "frontend_developer")
+    # Contract Check y QA esperan a ambas ramas y corren en paralelo entre sí
+    workflow.add_edge(["backend_developer", "frontend_developer"], "contract_check")
+    workflow.add_edge(["backend_developer", "frontend_developer"], "qa_engineer")
+    workflow.add_edge("contract_check", END)
+    workflow.add_edge("qa_engineer", END)
 
-    graph = workflow.compile()
+    graph = workflow.compile(checkpointer=checkpointer)
     return graph
 
 
@@ -63,52 +84,38 @@ WORKFLOW_DIAGRAM = """
               │         │
               v         v
       ┌────────────────┐ END
-      │Backend Developer│
-      │  🔧 FastAPI    │
+      │  API Contract   │
+      │  📜 OpenAPI     │
       └───────┬────────┘
               │
-        [Backend OK?]
-              │
-         Yes  │  No
-         ┌────┴────┐
-         │         │
-         v         v
-   ┌─────────────────┐ END
-   │Frontend Developer│
-   │  🎨 React       │
-   └────────┬────────┘
-            │
-      [Frontend OK?]
-            │
-       Yes  │  No
-       ┌────┴────┐
-       │         │
-       v         v
-   ┌─────────┐  END
-   │   QA    │
-   │  🧪Tests │
-   └────┬────┘
-        │
-    [QA OK?]
-        │
-   Yes  │  No
-   ┌────┴────┐
-   │         │
-   v         v
-┌─────────┐ END
-│ Review  │
-│📋Summary│
-└────┬────┘
-     │
-     v
-    END
+       ┌──────┴───────┐      (en paralelo)
+       │              │
+       v              v
+┌──────────────┐ ┌──────────────────┐
+│   Backend    │ │ Frontend Developer│
+│  🔧 FastAPI  │ │  🎨 React         │
+│ units→verify │ │  features ‖       │
+└──────┬───────┘ └────────┬─────────┘
+       │                  │
+       └────────┬─────────┘
+       ┌────────┴─────────┐   (en paralelo)
+       │                  │
+       v                  v
+┌────────────────┐ ┌──────────────┐
+│ Contract Check │ │      QA      │
+│ 🤝 Reconciliar │ │ 🧪 Tests ‖   │
+└───────┬────────┘ └──────┬───────┘
+        │                 │
+        └────────┬────────┘
+                 v
+                END
 
 Características:
-✨ Flujo secuencial coordinado
-✨ Cada nodo usa Claude Agent SDK
+✨ Contrato API primero, Backend y Frontend en paralelo
+✨ Backend, Frontend y QA son subgrafos con unidades en paralelo
 ✨ MCPs para filesystem access
 ✨ Validación en cada paso
-✨ Resumen ejecutivo al final
+✨ Verificación automática del backend y reporte de QA
 """
 
 
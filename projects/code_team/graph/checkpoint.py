@@ -0,0 +1,190 @@
+"""
+Checkpoint - Persistencia en SQLite para retomar ejecuciones largas.
+
+El grafo principal y el subgrafo backend se compilan con el mismo
+checkpointer SQLite. Cada ejecución usa un run_id como thread_id:
+
+- grafo principal: thread "<run_id>"
+- subgrafo backend: thread "<run_id>:backend"
+
+Si algo falla a mitad del subgrafo backend, `python main.py --resume <run_id>`
+retoma el grafo principal desde el último nodo completado y el subgrafo
+backend desde su última unidad terminada, sin volver al Product Manager.
+
+Además, cada nodo envuelto con timed_node registra su duración en
+`node_durations`, que se copia a la metadata de cada checkpoint.
+"""
+
+import inspect
+import os
+import time
+from contextlib import asynccontextmanager, contextmanager
+from pathlib import Path
+from langchain_core.runnables import RunnableConfig
+from langchain_core.runnables.config import var_child_runnable_config
+from graph.events import emit, stream_writer
+
+CHECKPOINT_DB = os.getenv(
+    "CHECKPOINT_DB", str(Path(__file__).resolve().parent.parent / "output" / ".checkpoints.sqlite")
+)
+
+# Checkpointer activo (lo abre main.py con open_checkpointer)
+_checkpointer = None
+
+
+def get_checkpointer():
+    """Retorna el checkpointer activo, o None si la ejecución no es persistente."""
+    return _checkpointer
+
+
+def _timed_saver_class():
+    from langgraph.checkpoint.sqlite.aio import AsyncSqliteSaver
+
+    class TimedSqliteSaver(AsyncSqliteSaver):
+        """AsyncSqliteSaver que copia node_durations del estado a la metadata del checkpoint."""
+
+        async def aput(self, config, checkpoint, metadata, new_versions):
+            durations = checkpoint.get("channel_values", {}).get("node_durations")
+            if durations:
+                metadata = {**metadata, "node_durations": durations}
+            return await super().aput(config, checkpoint, metadata, new_versions)
+
+    return TimedSqliteSaver
+
+
+@asynccontextmanager
+async def open_checkpointer(path: str = CHECKPOINT_DB):
+    """
+    Abre el checkpointer SQLite para toda la ejecución.
+
+    Requiere langgraph-checkpoint-sqlite; si no está instalado la ejecución
+    continúa sin persistencia (no se podrá retomar).
+    """
+    global _checkpointer
+    try:
+        saver_class = _timed_saver_class()
+    except ImportError:
+        print("⚠️  langgraph-checkpoint-sqlite no está instalado: la ejecución no se podrá retomar")
+        yield None
+        return
+
+    Path(path).parent.mkdir(parents=True, exist_ok=True)
+    async with saver_class.from_conn_string(path) as saver:
+        _checkpointer = saver
+        try:
+            yield saver
+        finally:
+            _checkpointer = None
+
+
+@contextmanager
+def detached_run():
+    """
+    Invoca un grafo dentro de un nodo sin heredar el config interno del grafo
+    padre (checkpoint_ns, task id), para que use su propio thread_id.
+    """
+    token = var_child_runnable_config.set(None)
+    try:
+        yield
+    finally:
+        var_child_runnable_config.reset(token)
+
+
+class SubgraphRun:
+    """
+    Ejecución de un subgrafo dentro de un nodo, persistida bajo el thread
+    "<run_id>:<name>" cuando hay checkpointer activo.
+
+    El thread solo se reutiliza para retomar nodos pendientes: si ya existe
+    una ejecución terminada con el mismo run_id (--run-id repetido), load()
+    lo borra, porque los reducers (completed_units, agent_stats, messages,
+    node_durations) acumularían sobre el estado anterior.
+
+    Uso:
+        run = SubgraphRun(create_backend_subgraph, config, "backend", BACKEND_MAX_CONCURRENCY)
+        if not await run.load():
+            cache.clean_outputs()   # solo si no se retoma una ejecución a medias
+        result = await run.invoke(subgraph_state)
+    """
+
+    def __init__(self, create_subgraph, config: RunnableConfig | None, name: str, max_concurrency: int):
+        self.checkpointer = get_checkpointer()
+        self.subgraph = create_subgraph(self.checkpointer)
+        run_id = (config or {}).get("configurable", {}).get("thread_id")
+        self.config = {"max_concurrency": max_concurrency, "recursion_limit": 100}
+        if self.checkpointer and run_id:
+            self.config["configurable"] = {"thread_id": f"{run_id}:{name}"}
+        self.pending = ()
+
+    async def load(self) -> tuple:
+        """
+        Nodos pendientes de una ejecución previa interrumpida (vacío si no hay).
+
+        Si no hay nada pendiente pero el thread tiene una ejecución terminada,
+        se borra para que la nueva empiece con estado limpio.
+        """
+        if "configurable" in self.config:
+            with detached_run():
+                snapshot = await self.subgraph.aget_state(self.config)
+            self.pending = tuple(snapshot.next)
+            if not self.pending and snapshot.values:
+                await self.checkpointer.adelete_thread(self.config["configurable"]["thread_id"])
+        return self.pending
+
+    async def invoke(self, state: dict) -> dict:
+        """
+        Ejecuta el subgrafo; si hay nodos pendientes, retoma desde el último checkpoint.
+
+        Los eventos del subgrafo (graph/events.py) se reenvían al stream del
+        grafo padre, que no los ve porque el subgrafo corre desacoplado.
+        """
+        parent_writer = stream_writer()
+        result = None
+        with detached_run():
+            async for mode, chunk in self.subgraph.astream(
+                None if self.pending else state, self.config, stream_mode=["custom", "values"]
+            ):
+                if mode == "custom":
+                    parent_writer(chunk)
+                else:
+                    result = chunk
+        return result
+
+
+def merge_durations(left: dict | None, right: dict | None) -> dict:
+    """Reducer de node_durations: combina duraciones de nodos (y de ramas paralelas)."""
+    return {**(left or {}), **(right or {})}
+
+
+def timed_node(name: str, node):
+    """
+    Envuelve un nodo para registrar su duración en node_durations.
+
+    Para las ramas despachadas con Send la clave incluye la unidad o el
+    archivo reparado.
+    """
+    accepts_config = "config" in inspect.signature(node).parameters
+
+    async def wrapper(state: dict, config: RunnableConfig):
+        unit = state.get("unit")
+        repair_target = state.get("repair_target")
+        key = unit["id"] if unit else f"{name}:{repair_target['target']}" if repair_target else name
+        emit("node_start", node=key)
+        start = time.perf_counter()
+        result = node(state, config) if accepts_config else node(state)
+        if inspect.isawaitable(result):
+            result = await result
+        durations = {key: round(time.perf_counter() - start, 2)}
+        emit("node_end", node=key, seconds=durations[key])
+        return {**(result or {}), "node_durations": merge_durations((result or {}).get("node_durations"), durations)}
+
+    wrapper.__name__ = getattr(node, "__name__", name)
+    return wrapper
+
+
+def format_durations(durations: dict) -> str:
+    """Tabla de duración por nodo, de mayor a menor."""
+    lines = [f"{'nodo':<32}{'duración':>10}"]
+    for name, seconds in sorted(durations.items(), key=lambda item: -item[1]):
+        lines.append(f"{name:<32}{seconds:>9.1f}s")
+    return "\n".join(lines)
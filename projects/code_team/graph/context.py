@@ -0,0 +1,194 @@
+"""
+Context - Bundles de contexto precargado para los nodos de implementación.
+
+Sin bundle, cada prompt dice "Lee contexto de: {user_stories_dir}/ y
+{sprint_planning_dir}/" y el agente ReAct gasta varios turnos de LLM listando
+directorios y leyendo archivos uno a uno (cada turno es una llamada completa
+al modelo).
+
+build_context_bundle reúne las tareas de la planificación, el contrato API,
+los archivos ya generados que la etapa necesita y las user stories, los
+recorta a un presupuesto de tokens y los entrega como texto para inyectar
+directamente en el prompt.
+"""
+
+import math
+import os
+from pathlib import Path
+from dotenv import load_dotenv
+
+load_dotenv()
+
+CONTEXT_BUNDLE_ENABLED = os.getenv("CONTEXT_BUNDLE", "1").lower() not in ("0", "false", "no")
+CONTEXT_BUNDLE_TOKENS = int(os.getenv("CONTEXT_BUNDLE_TOKENS", "12000"))
+
+# Archivos de sprint_planning_dir que lee cada etapa (default: backend_tasks.md)
+STAGE_PLANNING_FILES = {
+    "api_contract": ["sprint_plan.md", "backend_tasks.md", "frontend_tasks.md"],
+    "frontend_setup": ["frontend_tasks.md"],
+    "frontend_feature": ["frontend_tasks.md"],
+    "frontend_wiring": ["frontend_tasks.md"],
+    "qa_setup": ["frontend_tasks.md", "backend_tasks.md"],
+    "qa_frontend": ["frontend_tasks.md"],
+}
+
+# Etapas que implementan o consumen el contrato API (api_contract_path)
+CONTRACT_CONSUMERS = {
+    "backend_schemas", "backend_api", "backend_wiring",
+    "frontend_setup", "frontend_feature",
+    "qa_setup", "qa_contract",
+}
+
+# Directorio del estado contra el que se resuelven STAGE_GENERATED_FILES
+STAGE_OUTPUT_KEYS = {
+    "frontend_setup": "frontend_output_dir",
+    "frontend_feature": "frontend_output_dir",
+    "frontend_wiring": "frontend_output_dir",
+    "qa_setup": "frontend_output_dir",
+    "qa_frontend": "frontend_output_dir",
+}
+
+# Archivos ya generados (relativos al directorio de STAGE_OUTPUT_KEYS) que necesita cada etapa
+STAGE_GENERATED_FILES = {
+    "backend_setup": [],
+    "backend_models": ["app/core/database.py", "app/models/*.py"],
+    "backend_schemas": ["app/models/*.py", "app/schemas/*.py"],
+    "backend_crud": ["app/core/database.py", "app/models/*.py", "app/schemas/*.py", "app/crud/*.py"],
+    "backend_api": [
+        "app/main.py",
+        "app/core/security.py",
+        "app/api/deps.py",
+        "app/schemas/*.py",
+        "app/crud/*.py",
+        "app/api/**/*.py",
+    ],
+    "backend_wiring": ["app/main.py", "app/**/__init__.py", "app/api/v1/endpoints/*.py"],
+    "backend_tests": ["app/**/*.py"],
+    # Frontend y QA (relativos a frontend_output_dir, salvo qa_contract)
+    "frontend_setup": [],
+    "frontend_feature": ["src/api/client.ts", "src/types/*.ts", "src/store/*.ts", "src/components/ui/*.tsx"],
+    "frontend_wiring": ["src/App.tsx", "src/main.tsx", "src/components/layout/*.tsx"],
+    "qa_setup": ["package.json", "vite.config.ts", "src/api/client.ts"],
+    "qa_frontend": ["src/test/*.ts", "src/types/*.ts"],
+    "qa_contract": ["app/api/v1/endpoints/*.py", "app/schemas/*.py"],
+}
+
+CONTEXT_HEADER = """
+CONTEXTO PRECARGADO
+Los siguientes archivos ya están incluidos en este mensaje: NO los vuelvas a leer,
+empieza a escribir código directamente. Usa read_file solo para archivos listados
+como omitidos.
+"""
+
+
+def estimate_tokens(text: str) -> int:
+    """Cantidad aproximada de tokens (~4 caracteres por token)."""
+    return max(1, math.ceil(len(text) / 4))
+
+
+def _truncate(text: str, max_tokens: int) -> str:
+    """Corta el texto a ~max_tokens en un salto de línea."""
+    max_chars = max_tokens * 4
+    if len(text) <= max_chars:
+        return text
+    cut = text[:max_chars].rsplit("\n", 1)[0]
+    return cut + "\n... [recortado]"
+
+
+def _collect(base: Path, patterns: list[str], exclude_dirs: tuple[str, ...] = ()) -> list[Path]:
+    """Archivos no vacíos que coinciden con los patrones, sin duplicados y en orden."""
+    files = []
+    for pattern in patterns:
+        for path in sorted(base.glob(pattern)):
+            if path in files or not path.is_file() or path.stat().st_size == 0:
+                continue
+            if any(part in exclude_dirs for part in path.relative_to(base).parts):
+                continue
+            files.append(path)
+    return files
+
+
+def context_files(state: dict, stage: str) -> list[Path]:
+    """
+    Archivos que forman el bundle de una etapa, en orden de prioridad:
+    tareas de la planificación, contrato API, archivos generados por etapas
+    anteriores y user stories.
+    """
+    files = []
+
+    sprint_planning_dir = state.get("sprint_planning_dir")
+    if sprint_planning_dir:
+        files += _collect(Path(sprint_planning_dir), STAGE_PLANNING_FILES.get(stage, ["backend_tasks.md"]))
+
+    contract_file = state.get("api_contract_path")
+    if stage in CONTRACT_CONSUMERS and contract_file and Path(contract_file).is_file():
+        files.append(Path(contract_file))
+
+    output_dir = state.get(STAGE_OUTPUT_KEYS.get(stage, "backend_output_dir"))
+    if output_dir:
+        files += _collect(
+            Path(output_dir), STAGE_GENERATED_FILES.get(stage, []), exclude_dirs=("tests", "__pycache__", "node_modules")
+        )
+
+    user_stories_dir = state.get("user_stories_dir")
+    if user_stories_dir:
+        files += _collect(Path(user_stories_dir), ["backlog.md", "user_story_*.md", "*.md"])
+
+    return files
+
+
+def build_context_bundle(state: dict, stage: str, token_budget: int = CONTEXT_BUNDLE_TOKENS) -> str:
+    """
+    Construye el bundle de contexto de una etapa dentro de un presupuesto de tokens.
+
+    Los archivos se agregan en orden de prioridad; el último que no entra
+    completo se recorta y los siguientes se listan como omitidos para que el
+    agente pueda leerlos si realmente los necesita.
+
+    Args:
+        state: Estado del grafo (sprint_planning_dir, api_contract_path, directorios de salida, user_stories_dir)
+        stage: Nombre del nodo (clave de STAGE_GENERATED_FILES)
+        token_budget: Máximo aproximado de tokens del bundle
+
+    Returns:
+        Texto listo para agregar al prompt (vacío si no hay archivos)
+    """
+    files = context_files(state, stage)
+    if not files:
+        return ""
+
+    sections = []
+    omitted = []
+    used = estimate_tokens(CONTEXT_HEADER)
+    for path in files:
+        header = f"\n### {path}\n```\n"
+        remaining = token_budget - used - estimate_tokens(header) - 1
+        if remaining < 200:
+            omitted.append(str(path))
+            continue
+        content = _truncate(path.read_text(encoding="utf-8", errors="replace"), remaining)
+        section = f"{header}{content}\n```"
+        sections.append(section)
+        used += estimate_tokens(section)
+
+    bundle = CONTEXT_HEADER + "".join(sections)
+    if omitted:
+        bundle += "\n\nArchivos omitidos por presupuesto (léelos si los necesitas):\n"
+        bundle += "\n".join(f"- {path}" for path in omitted)
+    return bundle
+
+
+def with_context_bundle(prompt: str, state: dict, stage: str) -> str:
+    """
+    Agrega el bundle de contexto al prompt si está habilitado.
+
+    Se controla con CONTEXT_BUNDLE (variable de entorno) o con el campo
+    `context_bundle` del estado, que tiene prioridad.
+    """
+    enabled = state.get("context_bundle", CONTEXT_BUNDLE_ENABLED)
+    if not enabled:
+        return prompt
+    bundle = build_context_bundle(state, stage)
+    if bundle:
+        print(f"   📎 Contexto precargado: ~{estimate_tokens(bundle)} tokens")
+    return prompt + bundle
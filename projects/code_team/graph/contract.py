@@ -0,0 +1,163 @@
+"""
+Contract - Contrato API compartido entre backend y frontend.
+
+El nodo api_contract escribe un OpenAPI (JSON) en {main_output}/contract/ a
+partir de la planificación. Backend y frontend se generan en paralelo contra
+ese contrato y, al final, contract_check compara:
+
+- operaciones del contrato vs rutas FastAPI del backend (decoradores @router.*)
+- llamadas HTTP del frontend (axios/api.get(...), fetch(...)) vs el contrato
+
+La comparación es estática y aproximada: normaliza parámetros de ruta
+({id}, :id, ${id}) y el prefijo /api/vN.
+"""
+
+import json
+import re
+from pathlib import Path
+
+CONTRACT_DIR = "contract"
+CONTRACT_FILE = "openapi.json"
+HTTP_METHODS = ("get", "post", "put", "patch", "delete")
+
+CONTRACT_INSTRUCTIONS = """
+CONTRATO API (fuente de verdad compartida con el {counterpart}):
+- Archivo: {contract_path}
+- Respeta EXACTAMENTE sus rutas, métodos, parámetros, request bodies y schemas de respuesta
+- NO inventes endpoints fuera del contrato ni cambies nombres de campos
+"""
+
+ROUTE_DECORATOR_PATTERN = re.compile(
+    r"@(\w+)\.(get|post|put|patch|delete)\(\s*[\"']([^\"']*)[\"']"
+)
+ROUTER_PREFIX_PATTERN = re.compile(r"APIRouter\([^)]*prefix\s*=\s*[\"']([^\"']+)[\"']")
+INCLUDE_ROUTER_PATTERN = re.compile(
+    r"include_router\(\s*([\w\.]+?)(?:\.router)?\s*,[^)]*prefix\s*=\s*[\"']([^\"']+)[\"']"
+)
+CLIENT_CALL_PATTERN = re.compile(
+    r"\.(get|post|put|patch|delete)\s*(?:<[^>]*>)?\(\s*[`\"']([^`\"']+)[`\"']"
+)
+FETCH_CALL_PATTERN = re.compile(
+    r"fetch\(\s*[`\"']([^`\"']+)[`\"'](?:\s*,\s*\{[^}]*method\s*:\s*[\"'](\w+)[\"'])?"
+)
+
+
+def contract_path(state: dict) -> Path:
+    """Ruta del contrato dentro de main_output."""
+    return Path(state.get("main_output", "output")) / CONTRACT_DIR / CONTRACT_FILE
+
+
+def with_api_contract(prompt: str, state: dict, counterpart: str) -> str:
+    """Agrega al prompt la referencia al contrato API, si fue generado."""
+    path = state.get("api_contract_path")
+    if not path or not Path(path).exists():
+        return prompt
+    return prompt + CONTRACT_INSTRUCTIONS.format(contract_path=path, counterpart=counterpart)
+
+
+def normalize_path(path: str) -> str:
+    """
+    Normaliza una ruta para comparar contrato, backend y frontend.
+
+    /api/v1/tasks/{task_id}/ -> /tasks/{}
+    ${API_URL}/tasks/${id}   -> /tasks/{}
+    """
+    path = path.split("?", 1)[0].strip()
+    path = re.sub(r"^https?://[^/]+", "", path)
+    path = re.sub(r"^\$\{[^}]+\}", "", path)
+    path = re.sub(r"\$\{[^}]+\}", "{}", path)
+    path = re.sub(r"\{[^}]*\}", "{}", path)
+    path = re.sub(r"/:\w+", "/{}", path)
+    path = re.sub(r"^/?api/v\d+", "", path)
+    path = "/" + path.strip("/")
+    return re.sub(r"/+", "/", path).lower()
+
+
+def load_contract_operations(path: Path) -> set[tuple[str, str]]:
+    """Operaciones (MÉTODO, ruta normalizada) declaradas en el OpenAPI."""
+    spec = json.loads(Path(path).read_text(encoding="utf-8"))
+    operations = set()
+    for route, item in spec.get("paths", {}).items():
+        for method in item:
+            if method.lower() in HTTP_METHODS:
+                operations.add((method.upper(), normalize_path(route)))
+    return operations
+
+
+def contract_resources(path: Path) -> list[str]:
+    """
+    Recursos del contrato: primer segmento de cada ruta, en orden de aparición.
+
+    /auth/login, /tasks, /tasks/{} -> ["auth", "tasks"]
+    """
+    spec = json.loads(Path(path).read_text(encoding="utf-8"))
+    resources = []
+    for route in spec.get("paths", {}):
+        segment = normalize_path(route).strip("/").split("/")[0]
+        if not segment or segment in ("{}", "health"):
+            continue
+        resource = re.sub(r"[^a-z0-9_]", "_", segment)
+        if resource not in resources:
+            resources.append(resource)
+    return resources
+
+
+def backend_operations(backend_dir: Path) -> set[tuple[str, str]]:
+    """
+    Rutas FastAPI del backend.
+
+    El prefijo de cada router sale de APIRouter(prefix=...) en el propio archivo
+    o de include_router(modulo.router, prefix=...) en cualquier otro archivo.
+    """
+    backend_dir = Path(backend_dir)
+    files = [path for path in backend_dir.rglob("*.py") if "tests" not in path.parts]
+    sources = {path: path.read_text(encoding="utf-8", errors="replace") for path in files}
+
+    include_prefixes: dict[str, str] = {}
+    for source in sources.values():
+        for module, prefix in INCLUDE_ROUTER_PATTERN.findall(source):
+            include_prefixes[module.split(".")[-1]] = prefix
+
+    operations = set()
+    for path, source in sources.items():
+        own_prefix = ROUTER_PREFIX_PATTERN.search(source)
+        prefix = (own_prefix.group(1) if own_prefix else "") + include_prefixes.get(path.stem, "")
+        for _, method, route in ROUTE_DECORATOR_PATTERN.findall(source):
+            operations.add((method.upper(), normalize_path(prefix + route)))
+    return operations
+
+
+def frontend_operations(frontend_dir: Path) -> set[tuple[str, str]]:
+    """Llamadas HTTP del frontend (cliente axios/api y fetch)."""
+    operations = set()
+    for path in Path(frontend_dir).rglob("*"):
+        if path.suffix not in (".ts", ".tsx", ".js", ".jsx") or "node_modules" in path.parts:
+            continue
+        source = path.read_text(encoding="utf-8", errors="replace")
+        for method, url in CLIENT_CALL_PATTERN.findall(source):
+            if url.startswith(("/", "$", "http")):
+                operations.add((method.upper(), normalize_path(url)))
+        for url, method in FETCH_CALL_PATTERN.findall(source):
+            if url.startswith(("/", "$", "http")):
+                operations.add(((method or "get").upper(), normalize_path(url)))
+    return operations
+
+
+def reconcile(contract: set, backend: set, frontend: set) -> dict[str, list[str]]:
+    """
+    Diferencias entre contrato, backend y frontend.
+
+    Returns:
+        dict con listas "MÉTODO /ruta" para:
+            missing_in_backend: en el contrato pero no implementadas
+            extra_in_backend: implementadas pero fuera del contrato
+            frontend_outside_contract: llamadas del frontend que el contrato no declara
+    """
+    def render(operations):
+        return [f"{method} {path}" for method, path in sorted(operations, key=lambda op: (op[1], op[0]))]
+
+    return {
+        "missing_in_backend": render(contract - backend),
+        "extra_in_backend": render(backend - contract),
+        "frontend_outside_contract": render(frontend - contract),
+    }
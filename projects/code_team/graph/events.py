@@ -0,0 +1,140 @@
+"""
+Events - Eventos de progreso en vivo (modo streaming de main.py).
+
+Con `graph.ainvoke` solo se ve el resultado al final de una ejecución de
+varios minutos. En modo streaming el grafo se ejecuta con
+`astream(stream_mode=["custom", "values"], subgraphs=True)` y los nodos
+emiten eventos estructurados con el stream writer de LangGraph:
+
+- node_start / node_end: cada nodo (y cada unidad despachada con Send)
+- tool_call: cada tool call de un agente, con los paths que toca
+- file_written: cada archivo escrito por un agente
+- agent_start / agent_end: inicio y métricas finales de cada agente (graph/agents.py)
+- llm_turn: tokens de cada respuesta del modelo
+- agent_stopped: agente cortado por presupuesto o loop (graph/budget.py)
+
+Los subgrafos corren con su propio thread (graph/checkpoint.py) y
+SubgraphRun reenvía sus eventos al stream del grafo principal. Los eventos se
+escriben como JSONL en {main_output}/reports/<run_id>.events.jsonl y se
+muestran en consola; los agentes sin actividad reciente (ni tool calls ni
+respuestas del modelo) se reportan como posiblemente trabados.
+"""
+
+import asyncio
+import json
+import time
+from pathlib import Path
+from langgraph.config import get_stream_writer
+
+WRITE_TOOLS = {"write_file", "edit_file"}
+PATH_ARGS = ("path", "paths", "source", "destination")
+# Segundos sin eventos de un agente en curso antes de avisar en consola
+STALL_SECONDS = 90
+
+
+def stream_writer():
+    """Stream writer del grafo en curso; fuera de una ejecución, uno que descarta."""
+    try:
+        return get_stream_writer()
+    except RuntimeError:
+        return lambda chunk: None
+
+
+def emit(event: str, **data):
+    """Emite un evento al stream del grafo; no hace nada fuera de una ejecución."""
+    stream_writer()({"event": event, "ts": round(time.time(), 3), **data})
+
+
+def tool_paths(args: dict) -> list[str]:
+    """Paths que aparecen en los argumentos de una tool call."""
+    paths = []
+    for key in PATH_ARGS:
+        value = args.get(key)
+        if isinstance(value, str):
+            paths.append(value)
+        elif isinstance(value, list):
+            paths += [item for item in value if isinstance(item, str)]
+    return paths
+
+
+class EventLog:
+    """Escribe los eventos en JSONL y los muestra en consola."""
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.file = open(self.path, "a", encoding="utf-8")
+        self.start = time.perf_counter()
+        # agente en curso -> última actividad (perf_counter)
+        self.agents: dict[str, float] = {}
+        self.tokens = 0
+
+    def close(self):
+        self.file.close()
+
+    def elapsed(self) -> str:
+        return f"[{time.perf_counter() - self.start:7.1f}s]"
+
+    def record(self, event: dict):
+        self.file.write(json.dumps(event, ensure_ascii=False, default=str) + "\n")
+        self.file.flush()
+
+        stage = event.get("node") or event.get("stage")
+        kind = event["event"]
+        if stage in self.agents:
+            self.agents[stage] = time.perf_counter()
+
+        if kind == "node_start":
+            print(f"{self.elapsed()} ▶  {stage}")
+        elif kind == "node_end":
+            print(f"{self.elapsed()} ✔  {stage} ({event['seconds']:.1f}s)")
+        elif kind == "agent_start":
+            self.agents[stage] = time.perf_counter()
+        elif kind == "tool_call":
+            print(f"{self.elapsed()}    🔧 {stage}: {event['tool']} {', '.join(event.get('paths', []))}")
+        elif kind == "file_written":
+            print(f"{self.elapsed()}    📝 {stage}: {event['path']}")
+        elif kind == "llm_turn":
+            self.tokens += event.get("input_tokens", 0) + event.get("output_tokens", 0)
+        elif kind == "agent_stopped":
+            print(f"{self.elapsed()}    ⛔ {stage}: {event['reason']}")
+        elif kind == "agent_end":
+            self.agents.pop(stage, None)
+            print(
+                f"{self.elapsed()}    📊 {stage}: {event['llm_turns']} turnos, {event['tool_calls']} tool calls "
+                f"({self.tokens} tokens en la ejecución)"
+            )
+
+    async def watch_stalls(self):
+        """Avisa periódicamente de los agentes sin eventos recientes."""
+        while True:
+            await asyncio.sleep(STALL_SECONDS / 3)
+            now = time.perf_counter()
+            for stage, last in list(self.agents.items()):
+                if now - last > STALL_SECONDS:
+                    print(f"{self.elapsed()} ⏳ {stage}: sin actividad hace {now - last:.0f}s")
+
+
+async def stream_run(graph, graph_input, config: dict, events_path: Path) -> dict:
+    """
+    Ejecuta el grafo en modo streaming y retorna el estado final.
+
+    Los chunks "custom" son eventos de los nodos; "values" del grafo raíz
+    (namespace vacío) es el estado, cuyo último valor es el resultado.
+    """
+    log = EventLog(events_path)
+    watcher = asyncio.create_task(log.watch_stalls())
+    result = None
+    try:
+        async for namespace, mode, chunk in graph.astream(
+            graph_input, config, stream_mode=["custom", "values"], subgraphs=True
+        ):
+            if mode == "custom" and isinstance(chunk, dict) and "event" in chunk:
+                log.record(chunk)
+            elif mode == "values" and not namespace:
+                result = chunk
+    finally:
+        watcher.cancel()
+        log.close()
+    print(f"\n🛰️  Eventos guardados en: {events_path}")
+    return result
@@ -0,0 +1,121 @@
+"""
+API Contract - Nodo que define el contrato OpenAPI antes de implementar.
+
+Este nodo:
+1. Lee user stories y la planificación (backend_tasks.md, frontend_tasks.md)
+2. Escribe un OpenAPI 3.1 en JSON con todos los endpoints del sprint
+3. Permite que Backend y Frontend se implementen en paralelo contra el mismo contrato
+"""
+
+import json
+from langchain_core.messages import SystemMessage
+from dotenv import load_dotenv
+from graph.state import GraphState
+from graph.tools import get_filesystem_tools
+from graph.agents import run_agent, stopped_update
+from graph.context import with_context_bundle
+from graph.contract import contract_path, load_contract_operations
+from graph.build_cache import StageCache, stage_config
+
+load_dotenv()
+
+
+API_CONTRACT_PROMPT = """Eres un Software Architect. Define el contrato API entre backend y frontend ANTES de implementar.
+
+Proyecto: {project_name}
+Stack Backend: {backend_tech_stack}
+Stack Frontend: {frontend_tech_stack}
+
+UBICACIÓN:
+- Lee user stories de: {user_stories_dir}/
+- Lee planificación de: {sprint_planning_dir}/ (backend_tasks.md, frontend_tasks.md)
+- Escribe el contrato en: {contract_file}
+
+TAREA: Crear una especificación OpenAPI 3.1 en formato JSON (no YAML)
+
+Incluye:
+- info (title, version) y servers con url "/api/v1"
+- paths para TODOS los endpoints que necesita el frontend según las tareas
+  (auth: register/login/me, y CRUD de cada entidad: list con paginación, create, read, update, delete)
+- Rutas relativas a /api/v1 (ej: "/tasks/{{task_id}}"), parámetros de ruta y query
+- requestBody y responses con status codes (200, 201, 204, 400, 401, 404, 422)
+- components.schemas con Create / Update / Read por entidad (tipos, required, formatos)
+- components.securitySchemes con bearer JWT y security en los endpoints protegidos
+
+Usa write_file con la ruta completa. El JSON debe ser válido. NO uses placeholders.
+"""
+
+
+async def api_contract_node_async(state: GraphState):
+    """
+    Nodo API Contract - Genera el contrato OpenAPI compartido.
+
+    Retorna:
+        dict: Update al state con messages y api_contract_path
+    """
+
+    print("\n📜 API Contract - Definiendo contrato OpenAPI...")
+
+    project_name = state.get("project_name", "test_project")
+    backend_tech_stack = state.get("backend_stack", "FastAPI, PostgreSQL, SQLAlchemy")
+    frontend_tech_stack = state.get("frontend_stack", "React, TailwindCSS, Zustand")
+    main_output = state.get("main_output")
+
+    contract_file = contract_path(state).resolve()
+    contract_file.parent.mkdir(parents=True, exist_ok=True)
+
+    prompt = API_CONTRACT_PROMPT.format(
+        project_name=project_name,
+        backend_tech_stack=backend_tech_stack,
+        frontend_tech_stack=frontend_tech_stack,
+        user_stories_dir=state.get("user_stories_dir", ""),
+        sprint_planning_dir=state.get("sprint_planning_dir", ""),
+        contract_file=contract_file,
+    )
+
+    # Reutilizar el contrato previo si las entradas no cambiaron
+    cache = StageCache(main_output, "api_contract")
+    upstream = [state.get("user_stories_dir"), state.get("sprint_planning_dir")]
+    input_hash = cache.input_hash(prompt, upstream, stage_config(state))
+    if cache.is_fresh(input_hash):
+        skip_msg = f"API Contract - Contrato reutilizado ({cache.reason}): {contract_file}"
+        print(f"♻️  {skip_msg}")
+        return {"messages": [SystemMessage(content=skip_msg)], "api_contract_path": str(contract_file)}
+
+    print(f"   🔁 Ejecutando API Contract: {cache.reason}")
+    cache.clean_outputs()
+    prompt = with_context_bundle(prompt, state, "api_contract")
+
+    try:
+        tools = await get_filesystem_tools(main_output, state.get("filesystem_backend"))
+
+        print("   🤖 Agente escribiendo el contrato...")
+        _, stats = await run_agent("api_contract", prompt, tools)
+        if stopped := stopped_update("API Contract", stats):
+            return stopped
+
+        operations = load_contract_operations(contract_file)
+        summary = (
+            f"API Contract - Contrato OpenAPI creado:\n"
+            f"- Archivo: {contract_file}\n"
+            f"- Operaciones: {len(operations)}"
+        )
+        print(f"✅ {summary}")
+        cache.record(input_hash, [contract_file])
+
+        return {
+            "messages": [SystemMessage(content=summary)],
+            "api_contract_path": str(contract_file),
+            "agent_stats": [stats],
+        }
+
+    except (FileNotFoundError, json.JSONDecodeError) as e:
+        # Sin contrato válido backend y frontend siguen, pero sin referencia común
+        error_msg = f"API Contract - Contrato inválido o ausente ({type(e).__name__}: {e}); se continúa sin contrato"
+        print(f"⚠️  {error_msg}")
+        return {"messages": [SystemMessage(content=error_msg)]}
+
+    except Exception as e:
+        error_msg = f"API Contract - Error: {type(e).__name__}: {str(e)}"
+        print(f"❌ {error_msg}")
+        return {"messages": [SystemMessage(content=error_msg)]}
@@ -5,26 +5,31 @@ Este nodo:
 1. Prepara el estado con paths necesarios
 2. Verifica que existan los archivos de entrada
 3. Invoca el subgrafo backend que construye el código paso a paso
+4. Reporta la verificación automática (compile, import, pytest) del subgrafo
 """
 
 from pathlib import Path
 from langchain_core.messages import SystemMessage
+from langchain_core.runnables import RunnableConfig
 from graph.state import GraphState
-from .backend_subgraph import create_backend_subgraph
+from graph.build_cache import StageCache, stage_config, hash_sources
+from graph.checkpoint import SubgraphRun
+from graph.verify import format_verification
+from .backend_subgraph import create_backend_subgraph, BACKEND_MAX_CONCURRENCY
 
 
-async def backend_developer_node_async(state: GraphState):
+async def backend_developer_node_async(state: GraphState, config: RunnableConfig):
     """
     Nodo del Backend Developer - Orquesta la construcción del backend.
 
-    Este nodo prepara el estado y delega al subgrafo backend para
-    dividir el trabajo en 6 pasos especializados:
-    1. Setup (estructura base)
-    2. Models (SQLAlchemy)
-    3. Schemas (Pydantic)
-    4. CRUD (operaciones)
-    5. API (endpoints)
-    6. Tests (pytest)
+    Este nodo prepara el estado y delega al subgrafo backend, que
+    construye la estructura base y luego ejecuta en paralelo las unidades
+    (models / schemas / crud / api por entidad) cuyas dependencias ya
+    terminaron, con a lo sumo BACKEND_MAX_CONCURRENCY agentes a la vez.
+
+    Con checkpointer activo el subgrafo usa el thread "<run_id>:backend": si
+    una ejecución previa quedó a medias, se retoma desde la última unidad
+    terminada en vez de empezar de nuevo.
 
     Retorna:
         dict: Update al state con messages y paths configurados
@@ -70,20 +75,50 @@ async def backend_developer_node_async(state: GraphState):
     print(f"   📖 Leyendo contexto de: {user_stories_absolute}")
     print(f"   📁 Generando código en: {output_dir_absolute}")
 
+    # Reutilizar el backend previo si planificación, contrato y prompts del subgrafo no cambiaron
+    cache = StageCache(main_output, "backend_developer")
+    upstream = [user_stories_absolute, sprint_planning_absolute, state.get("api_contract_path")]
+    subgraph_sources = hash_sources(Path(__file__).parent / "backend_subgraph")
+    input_hash = cache.input_hash(subgraph_sources, upstream, stage_config(state))
+    if cache.is_fresh(input_hash):
+        skip_msg = f"Backend Developer - Salida reutilizada ({cache.reason}): {output_dir_absolute}"
+        print(f"♻️  {skip_msg}")
+        return {
+            "messages": [SystemMessage(content=skip_msg)],
+            "user_stories_dir": str(user_stories_absolute),
+            "sprint_planning_dir": str(sprint_planning_absolute),
+            "backend_output_dir": str(output_dir_absolute),
+        }
+
+    # Subgrafo persistido bajo su propio thread, derivado del run_id del grafo principal
+    subgraph_run = SubgraphRun(create_backend_subgraph, config, "backend", BACKEND_MAX_CONCURRENCY)
+    pending = await subgraph_run.load()
+    if pending:
+        # No limpiar: los archivos de las unidades ya terminadas se conservan
+        print(f"   ⏯️  Retomando subgrafo backend desde: {', '.join(pending)}")
+    else:
+        print(f"   🔁 Ejecutando Backend Developer: {cache.reason}")
+        cache.clean_outputs()
+
     # Preparar estado para el subgrafo
     subgraph_state = {
         **state,
         "user_stories_dir": str(user_stories_absolute),
         "sprint_planning_dir": str(sprint_planning_absolute),
         "backend_output_dir": str(output_dir_absolute),
+        # El subgrafo solo acumula sus propias métricas, unidades y duraciones
+        "agent_stats": [],
+        "completed_units": [],
+        "node_durations": {},
+        "repair_rounds": 0,
     }
 
-    print("\n   🏗️  Ejecutando subgrafo backend (6 pasos)...")
+    print(f"\n   🏗️  Ejecutando subgrafo backend (hasta {BACKEND_MAX_CONCURRENCY} agentes en paralelo)...")
 
     try:
-        # Crear y ejecutar el subgrafo
-        backend_subgraph = create_backend_subgraph()
-        await backend_subgraph.ainvoke(subgraph_state)
+        # Crear y ejecutar el subgrafo (o retomarlo desde su último checkpoint)
+        subgraph_result = await subgraph_run.invoke(subgraph_state)
+        agent_stats = subgraph_result.get("agent_stats", [])
 
         print("\n🔧 Backend Developer - Proceso completado.")
 
@@ -104,11 +139,25 @@ async def backend_developer_node_async(state: GraphState):
             f"- Proyecto: {project_name}\n"
             f"- Archivos Python generados: {files_count}\n"
             f"- Directorio: {output_dir_absolute}\n"
-            f"- Subgrafo ejecutado: setup → models → schemas → crud → api → tests\n"
+            f"- Subgrafo ejecutado: setup → {len(subgraph_result.get('completed_units', []))} unidades → wiring → tests → verify\n"
             f"- Stack: {backend_stack}"
         )
+        verification = subgraph_result.get("backend_verification")
+        if verification:
+            rounds = subgraph_result.get("repair_rounds", 0)
+            summary += (
+                f"\n- Verificación: {'OK' if verification['ok'] else 'con fallos'}"
+                f" ({rounds} ronda(s) con fallos)\n{format_verification(verification)}"
+            )
+
+        stopped = [stats["stage"] for stats in agent_stats if stats.get("stopped")]
+        if stopped:
+            summary += f"\n- Agentes detenidos por presupuesto: {', '.join(stopped)}"
 
         print(f"\n✅ {summary}")
+        # Un backend que no pasó la verificación o quedó a medias se regenera en la próxima ejecución
+        if not stopped and (not verification or verification["ok"]):
+            cache.record(input_hash, [output_dir_absolute])
 
         # Actualizar estado con paths para otros nodos
         return {
@@ -116,6 +165,9 @@ async def backend_developer_node_async(state: GraphState):
             "user_stories_dir": str(user_stories_absolute),
             "sprint_planning_dir": str(sprint_planning_absolute),
             "backend_output_dir": str(output_dir_absolute),
+            "agent_stats": agent_stats,
+            "node_durations": subgraph_result.get("node_durations", {}),
+            "backend_verification": verification,
         }
 
     except Exception as e:
@@ -8,7 +8,11 @@ from .backend_schemas import backend_schemas_node_async
 from .backend_crud import backend_crud_node_async
 from .backend_api import backend_api_node_async
 from .backend_tests import backend_tests_node_async
-from .subgraph import create_backend_subgraph
+from .backend_wiring import backend_wiring_node_async
+from .backend_verify import backend_verify_node_async
+from .backend_repair import backend_repair_node_async
+from .planner import backend_planner_node
+from .subgraph import create_backend_subgraph, BACKEND_MAX_CONCURRENCY
 
 __all__ = [
     "backend_setup_node_async",
@@ -17,5 +21,10 @@ __all__ = [
     "backend_crud_node_async",
     "backend_api_node_async",
     "backend_tests_node_async",
+    "backend_wiring_node_async",
+    "backend_verify_node_async",
+    "backend_repair_node_async",
+    "backend_planner_node",
     "create_backend_subgraph",
+    "BACKEND_MAX_CONCURRENCY",
 ]
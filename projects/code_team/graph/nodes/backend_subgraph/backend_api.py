@@ -5,11 +5,14 @@ Lee CRUD y schemas para crear endpoints REST API.
 """
 
 from pathlib import Path
-from langchain_mcp_adapters.client import MultiServerMCPClient
-from langgraph.prebuilt import create_react_agent
 from langchain_core.messages import SystemMessage
 from dotenv import load_dotenv
 from graph.state import GraphState
+from graph.tools import get_filesystem_tools
+from graph.agents import run_agent, stopped_update
+from graph.context import with_context_bundle
+from graph.contract import with_api_contract
+from .planner import with_unit_scope, unit_label
 
 load_dotenv()
 
@@ -78,33 +81,22 @@ async def backend_api_node_async(state: GraphState):
         sprint_planning_dir=sprint_planning_dir,
         output_dir=output_dir,
     )
-
-    parent_dir = Path(main_output).resolve()
-    client = MultiServerMCPClient(
-        {
-            "filesystem": {
-                "command": "npx",
-                "args": [
-                    "-y",
-                    "@modelcontextprotocol/server-filesystem",
-                    str(parent_dir),
-                ],
-                "transport": "stdio",
-            }
-        }
-    )
+    prompt = with_context_bundle(prompt, state, "backend_api")
+    prompt = with_api_contract(prompt, state, "frontend")
+    prompt = with_unit_scope(prompt, state)
 
     try:
-        tools = await client.get_tools()
-        agent = create_react_agent("openai:gpt-4.1", tools)
+        tools = await get_filesystem_tools(main_output, state.get("filesystem_backend"))
 
         print("   🤖 Agente creando endpoints...")
-        await agent.ainvoke({"messages": prompt}, {"recursion_limit": 100})
+        _, stats = await run_agent(unit_label(state, "backend_api"), prompt, tools)
+        if stopped := stopped_update("Backend API", stats):
+            return stopped
 
         summary = "Backend API - Endpoints FastAPI creados en app/api/v1/endpoints/"
         print(f"✅ {summary}")
 
-        return {"messages": [SystemMessage(content=summary)]}
+        return {"messages": [SystemMessage(content=summary)], "agent_stats": [stats]}
 
     except Exception as e:
         error_msg = f"Backend API - Error: {type(e).__name__}: {str(e)}"
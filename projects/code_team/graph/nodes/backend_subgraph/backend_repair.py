@@ -0,0 +1,95 @@
+"""
+Backend Repair Node - Corrige un archivo a partir de los fallos de verificación.
+
+Cada rama recibe un solo archivo (repair_target) con sus errores de compile,
+import o pytest, así varias reparaciones corren en paralelo sin pisarse y el
+agente no necesita recorrer todo el proyecto.
+"""
+
+from pathlib import Path
+from langchain_core.messages import SystemMessage
+from dotenv import load_dotenv
+from graph.state import GraphState
+from graph.tools import get_filesystem_tools
+from graph.agents import run_agent, stopped_update
+
+load_dotenv()
+
+# Caracteres del archivo afectado que se incluyen en el prompt
+MAX_TARGET_CHARS = 12000
+
+BACKEND_REPAIR_PROMPT = """Eres un Senior Backend Developer. La verificación automática del backend falló.
+
+Proyecto: {project_name}
+Stack: {backend_tech_stack}
+Código en: {output_dir}/
+
+ARCHIVO CON FALLOS: {output_dir}/{target}
+PASO: {step} (compile = sintaxis, import = `import app.main`, pytest = tests con SQLite)
+
+ERRORES:
+{errors}
+{target_content}
+TAREA: Corregir la causa de estos errores
+
+- Empieza por el archivo indicado; si la causa está en un módulo que importa, corrige ese módulo
+- Si un test falla por un bug de app/, corrige app/ (no debilites el test para que pase)
+- No reescribas archivos que no estén relacionados con estos errores
+- Los tests corren con DATABASE_URL=sqlite:///...: el código debe funcionar con SQLite
+
+Usa read_file / write_file con rutas completas. NO uses placeholders.
+"""
+
+
+def format_errors(failures: list[dict]) -> str:
+    lines = []
+    for failure in failures:
+        lines.append(f"- {failure['error']}")
+        if failure.get("output"):
+            lines.append(f"```\n{failure['output'].strip()}\n```")
+    return "\n".join(lines)
+
+
+async def backend_repair_node_async(state: GraphState):
+    """
+    Nodo Backend Repair - Repara el archivo de repair_target.
+    """
+
+    repair_target = state["repair_target"]
+    target = repair_target["target"]
+    failures = repair_target["failures"]
+    print(f"\n🩹 Backend Repair - Corrigiendo {target} ({len(failures)} fallo(s))...")
+
+    output_dir = state.get("backend_output_dir", "")
+    main_output = state.get("main_output")
+
+    target_path = Path(output_dir) / target
+    target_content = ""
+    if target_path.is_file():
+        content = target_path.read_text(encoding="utf-8", errors="replace")[:MAX_TARGET_CHARS]
+        target_content = f"\nCONTENIDO ACTUAL DE {target}:\n```python\n{content}\n```\n"
+
+    prompt = BACKEND_REPAIR_PROMPT.format(
+        project_name=state.get("project_name", "test_project"),
+        backend_tech_stack=state.get("backend_stack", "FastAPI, PostgreSQL, SQLAlchemy"),
+        output_dir=output_dir,
+        target=target,
+        step=failures[0]["step"],
+        errors=format_errors(failures),
+        target_content=target_content,
+    )
+
+    try:
+        tools = await get_filesystem_tools(main_output, state.get("filesystem_backend"))
+        _, stats = await run_agent(f"backend_repair:{target}", prompt, tools)
+        if stopped := stopped_update("Backend Repair", stats):
+            return stopped
+
+        summary = f"Backend Repair - {target} corregido ({len(failures)} fallo(s))"
+        print(f"✅ {summary}")
+        return {"messages": [SystemMessage(content=summary)], "agent_stats": [stats]}
+
+    except Exception as e:
+        error_msg = f"Backend Repair - Error en {target}: {type(e).__name__}: {str(e)}"
+        print(f"❌ {error_msg}")
+        return {"messages": [SystemMessage(content=error_msg)]}
@@ -5,11 +5,14 @@ Lee los modelos creados y las tareas para crear schemas de validación.
 """
 
 from pathlib import Path
-from langchain_mcp_adapters.client import MultiServerMCPClient
-from langgraph.prebuilt import create_react_agent
 from langchain_core.messages import SystemMessage
 from dotenv import load_dotenv
 from graph.state import GraphState
+from graph.tools import get_filesystem_tools
+from graph.agents import run_agent, stopped_update
+from graph.context import with_context_bundle
+from graph.contract import with_api_contract
+from .planner import with_unit_scope, unit_label
 
 load_dotenv()
 
@@ -71,33 +74,22 @@ async def backend_schemas_node_async(state: GraphState):
         sprint_planning_dir=sprint_planning_dir,
         output_dir=output_dir,
     )
-
-    parent_dir = Path(main_output).resolve()
-    client = MultiServerMCPClient(
-        {
-            "filesystem": {
-                "command": "npx",
-                "args": [
-                    "-y",
-                    "@modelcontextprotocol/server-filesystem",
-                    str(parent_dir),
-                ],
-                "transport": "stdio",
-            }
-        }
-    )
+    prompt = with_context_bundle(prompt, state, "backend_schemas")
+    prompt = with_api_contract(prompt, state, "frontend")
+    prompt = with_unit_scope(prompt, state)
 
     try:
-        tools = await client.get_tools()
-        agent = create_react_agent("openai:gpt-4.1", tools)
+        tools = await get_filesystem_tools(main_output, state.get("filesystem_backend"))
 
         print("   🤖 Agente creando schemas...")
-        await agent.ainvoke({"messages": prompt}, {"recursion_limit": 100})
+        _, stats = await run_agent(unit_label(state, "backend_schemas"), prompt, tools)
+        if stopped := stopped_update("Backend Schemas", stats):
+            return stopped
 
         summary = "Backend Schemas - Schemas Pydantic creados en app/schemas/"
         print(f"✅ {summary}")
 
-        return {"messages": [SystemMessage(content=summary)]}
+        return {"messages": [SystemMessage(content=summary)], "agent_stats": [stats]}
 
     except Exception as e:
         error_msg = f"Backend Schemas - Error: {type(e).__name__}: {str(e)}"
@@ -9,11 +9,12 @@ Crea:
 """
 
 from pathlib import Path
-from langchain_mcp_adapters.client import MultiServerMCPClient
-from langgraph.prebuilt import create_react_agent
 from langchain_core.messages import SystemMessage
 from dotenv import load_dotenv
 from graph.state import GraphState
+from graph.tools import get_filesystem_tools
+from graph.agents import run_agent, stopped_update
+from graph.context import with_context_bundle
 
 load_dotenv()
 
@@ -99,34 +100,20 @@ async def backend_setup_node_async(state: GraphState):
         sprint_planning_dir=sprint_planning_dir,
         output_dir=output_dir,
     )
-
-    # MCP client
-    parent_dir = Path(main_output).resolve()
-    client = MultiServerMCPClient(
-        {
-            "filesystem": {
-                "command": "npx",
-                "args": [
-                    "-y",
-                    "@modelcontextprotocol/server-filesystem",
-                    str(parent_dir),
-                ],
-                "transport": "stdio",
-            }
-        }
-    )
+    prompt = with_context_bundle(prompt, state, "backend_setup")
 
     try:
-        tools = await client.get_tools()
-        agent = create_react_agent("openai:gpt-4.1", tools)
+        tools = await get_filesystem_tools(main_output, state.get("filesystem_backend"))
 
         print("   🤖 Agente creando estructura base...")
-        await agent.ainvoke({"messages": prompt}, {"recursion_limit": 100})
+        _, stats = await run_agent("backend_setup", prompt, tools)
+        if stopped := stopped_update("Backend Setup", stats):
+            return stopped
 
         summary = "Backend Setup - Estructura base creada: main.py, core/, deps.py, requirements.txt"
         print(f"✅ {summary}")
 
-        return {"messages": [SystemMessage(content=summary)]}
+        return {"messages": [SystemMessage(content=summary)], "agent_stats": [stats]}
 
     except Exception as e:
         error_msg = f"Backend Setup - Error: {type(e).__name__}: {str(e)}"
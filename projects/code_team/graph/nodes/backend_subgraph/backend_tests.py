@@ -5,11 +5,12 @@ Lee todo el código y crea tests unitarios e integración.
 """
 
 from pathlib import Path
-from langchain_mcp_adapters.client import MultiServerMCPClient
-from langgraph.prebuilt import create_react_agent
 from langchain_core.messages import SystemMessage
 from dotenv import load_dotenv
 from graph.state import GraphState
+from graph.tools import get_filesystem_tools
+from graph.agents import run_agent, stopped_update
+from graph.context import with_context_bundle
 
 load_dotenv()
 
@@ -72,6 +73,7 @@ async def backend_tests_node_async(state: GraphState):
         backend_tech_stack = state.get("backend_stack", "FastAPI, PostgreSQL, SQLAlchemy")
         sprint_planning_dir = state.get("sprint_planning_dir", "")
         output_dir = state.get("backend_output_dir", "")
+        main_output = state.get("main_output", str(Path("output").resolve()))
 
         print(f"   📖 Leyendo código a testear...")
 
@@ -81,26 +83,19 @@ async def backend_tests_node_async(state: GraphState):
             sprint_planning_dir=sprint_planning_dir,
             output_dir=output_dir,
         )
+        prompt = with_context_bundle(prompt, state, "backend_tests")
 
-        parent_dir = Path("output").resolve()
-        client = MultiServerMCPClient({
-            "filesystem": {
-                "command": "npx",
-                "args": ["-y", "@modelcontextprotocol/server-filesystem", str(parent_dir)],
-                "transport": "stdio",
-            }
-        })
-
-        tools = await client.get_tools()
-        agent = create_react_agent("openai:gpt-4.1", tools)
+        tools = await get_filesystem_tools(main_output, state.get("filesystem_backend"))
 
         print("   🤖 Agente creando tests...")
-        await agent.ainvoke({"messages": prompt})
+        _, stats = await run_agent("backend_tests", prompt, tools)
+        if stopped := stopped_update("Backend Tests", stats):
+            return stopped
 
         summary = "Backend Tests - Tests con pytest creados en app/tests/"
         print(f"✅ {summary}")
 
-        return {"messages": [SystemMessage(content=summary)]}
+        return {"messages": [SystemMessage(content=summary)], "agent_stats": [stats]}
 
     except Exception as e:
         error_msg = f"Backend Tests - Error: {type(e).__name__}: {str(e)}"
@@ -0,0 +1,62 @@
+"""
+Backend Verify Node - Verifica el backend generado y decide si hay que repararlo.
+
+Ejecuta graph/verify.py (compile → import → pytest en un sandbox) y, si hay
+fallos, despacha con Send una rama backend_repair por archivo afectado.
+Después de cada ronda de reparación se vuelve a verificar, hasta
+BACKEND_REPAIR_ROUNDS rondas.
+"""
+
+import os
+from langchain_core.messages import SystemMessage
+from langgraph.graph import END
+from langgraph.types import Send
+from graph.state import GraphState
+from graph.verify import verify_backend, failures_by_target, format_verification
+
+# Rondas de reparación antes de aceptar los fallos restantes
+BACKEND_REPAIR_ROUNDS = int(os.getenv("BACKEND_REPAIR_ROUNDS", "2"))
+# Archivos reparados por ronda (el resto queda para la siguiente verificación)
+MAX_REPAIR_TARGETS = int(os.getenv("MAX_REPAIR_TARGETS", "8"))
+
+
+async def backend_verify_node_async(state: GraphState):
+    """
+    Nodo Backend Verify - Compila, importa la app y corre los tests generados.
+    """
+
+    repair_rounds = state.get("repair_rounds", 0)
+    print(f"\n🔍 Backend Verify - Verificando código generado{f' (después de {repair_rounds} reparación/es)' if repair_rounds else ''}...")
+
+    report = await verify_backend(state.get("backend_output_dir", ""))
+    print(format_verification(report))
+
+    if report["ok"]:
+        summary = "Backend Verify - compile, import y tests OK"
+    else:
+        failed_step = next(step for step, result in report["steps"].items() if not result["ok"])
+        targets = failures_by_target(report["failures"])
+        summary = (
+            f"Backend Verify - Error en {failed_step}: {len(report['failures'])} fallo(s) "
+            f"en {len(targets)} archivo(s): {', '.join(list(targets)[:5])}"
+        )
+    print(f"{'✅' if report['ok'] else '⚠️ '} {summary}")
+
+    return {
+        "messages": [SystemMessage(content=summary)],
+        "backend_verification": report,
+        "repair_rounds": repair_rounds + (0 if report["ok"] else 1),
+    }
+
+
+def route_verification(state: GraphState):
+    """Reparar en paralelo los archivos con fallos, o terminar."""
+    report = state.get("backend_verification", {})
+    if report.get("ok", True) or state.get("repair_rounds", 0) > BACKEND_REPAIR_ROUNDS:
+        return END
+
+    targets = list(failures_by_target(report["failures"]).items())[:MAX_REPAIR_TARGETS]
+    return [
+        Send("backend_repair", {**state, "repair_target": {"target": target, "failures": failures}})
+        for target, failures in targets
+    ]
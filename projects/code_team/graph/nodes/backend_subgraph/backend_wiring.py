@@ -0,0 +1,85 @@
+"""
+Backend Wiring Node - Integra los archivos generados en paralelo por entidad.
+
+Las unidades por entidad no tocan __init__.py ni routers para no pisarse entre
+sí. Este nodo actualiza los __init__.py, crea el router v1 y lo registra en
+main.py con todas las entidades.
+"""
+
+from langchain_core.messages import SystemMessage
+from dotenv import load_dotenv
+from graph.state import GraphState
+from graph.tools import get_filesystem_tools
+from graph.agents import run_agent, stopped_update
+from graph.context import with_context_bundle
+from graph.contract import with_api_contract
+
+load_dotenv()
+
+
+BACKEND_WIRING_PROMPT = """Eres un Senior Backend Developer especializado en FastAPI.
+
+Proyecto: {project_name}
+Stack: {backend_tech_stack}
+
+UBICACIÓN:
+- Código en: {output_dir}/app/
+
+CONTEXTO: Varios agentes generaron en paralelo los archivos de cada entidad
+({entities}) en app/models/, app/schemas/, app/crud/ y app/api/v1/endpoints/.
+
+TAREA: Integrar esos archivos, sin reescribir su lógica
+
+- app/models/__init__.py: importa Base y todos los modelos
+- app/schemas/__init__.py: exporta todos los schemas
+- app/crud/__init__.py: exporta los objetos/funciones CRUD de cada entidad
+- app/api/v1/router.py: APIRouter que incluye el router de cada endpoint con prefix y tags
+- app/main.py: incluye api_router con prefix /api/v1 (conserva CORS y health check)
+
+Corrige imports rotos entre entidades si los encuentras. NO uses placeholders.
+"""
+
+
+async def backend_wiring_node_async(state: GraphState):
+    """
+    Nodo Backend Wiring - Registra modelos, schemas, CRUD y routers de todas las entidades.
+    """
+
+    entities = sorted({unit["class_name"] for unit in state.get("units", []) if unit.get("entity")})
+    if not entities:
+        # Flujo secuencial: cada etapa ya actualizó sus __init__.py y routers
+        return {}
+
+    print("\n🔌 Backend Wiring - Integrando entidades generadas en paralelo...")
+
+    project_name = state.get("project_name", "test_project")
+    backend_tech_stack = state.get("backend_stack", "FastAPI, PostgreSQL, SQLAlchemy")
+    output_dir = state.get("backend_output_dir", "")
+    main_output = state.get("main_output")
+
+    prompt = BACKEND_WIRING_PROMPT.format(
+        project_name=project_name,
+        backend_tech_stack=backend_tech_stack,
+        output_dir=output_dir,
+        entities=", ".join(entities),
+    )
+    prompt = with_context_bundle(prompt, state, "backend_wiring")
+    prompt = with_api_contract(prompt, state, "frontend")
+
+    try:
+        tools = await get_filesystem_tools(main_output, state.get("filesystem_backend"))
+
+        print("   🤖 Agente integrando entidades...")
+        _, stats = await run_agent("backend_wiring", prompt, tools)
+        if stopped := stopped_update("Backend Wiring", stats):
+            return stopped
+
+        summary = f"Backend Wiring - Entidades integradas: {', '.join(entities)}"
+        print(f"✅ {summary}")
+
+        return {"messages": [SystemMessage(content=summary)], "agent_stats": [stats]}
+
+    except Exception as e:
+        error_msg = f"Backend Wiring - Error: {type(e).__name__}: {str(e)}"
+        print(f"❌ {error_msg}")
+        return {"messages": [SystemMessage(content=error_msg)]}
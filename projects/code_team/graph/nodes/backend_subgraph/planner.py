@@ -0,0 +1,252 @@
+"""
+Backend Planner - Deriva el DAG de unidades del subgrafo backend.
+
+Lee los archivos del Scrum Master:
+- backend_tasks.md: entidades a implementar (archivos app/models/*.py y clases `class X(Base)`)
+- dependencies_map.md: diagrama mermaid con dependencias entre tareas
+
+y genera una unidad por (etapa, entidad):
+
+    backend_models:<e>  → backend_setup
+    backend_schemas:<e> → backend_models:<e> (+ schemas de las entidades de las que depende)
+    backend_crud:<e>    → backend_models:<e>, backend_schemas:<e> (+ crud de sus dependencias)
+    backend_api:<e>     → backend_crud:<e>, backend_schemas:<e> (+ api de sus dependencias)
+
+Los modelos de distintas entidades no dependen entre sí (las relationships se
+declaran por nombre), así que se generan todos en paralelo.
+
+Si no se detectan entidades, el plan vuelve al flujo secuencial original
+(una unidad por etapa: models → schemas → crud → api).
+"""
+
+import re
+from pathlib import Path
+from langchain_core.messages import SystemMessage
+from graph.state import GraphState
+from graph.units import has_cycle
+
+ENTITY_STAGES = ["backend_models", "backend_schemas", "backend_crud", "backend_api"]
+
+# Dependencias dentro de la misma entidad
+STAGE_DEPENDENCIES = {
+    "backend_models": [],
+    "backend_schemas": ["backend_models"],
+    "backend_crud": ["backend_models", "backend_schemas"],
+    "backend_api": ["backend_crud", "backend_schemas"],
+}
+
+# Archivo que escribe cada etapa para una entidad (relativo a backend_output_dir)
+STAGE_TARGETS = {
+    "backend_models": "app/models/{entity}.py",
+    "backend_schemas": "app/schemas/{entity}.py",
+    "backend_crud": "app/crud/{entity}.py",
+    "backend_api": "app/api/v1/endpoints/{entity}.py",
+}
+
+# Solo referencias explícitas: rutas de modelos y declaraciones de clases SQLAlchemy.
+# Las menciones sueltas ("modelo de contenidos", títulos) generaban entidades falsas.
+MODEL_FILE_PATTERN = re.compile(r"\bmodels/(\w+)\.py\b")
+MODEL_CLASS_PATTERN = re.compile(r"\bclass\s+([A-Z]\w*)\s*\(\s*(?:Base|db\.Model)\b")
+HEADING_PATTERN = re.compile(r"^\s{0,3}#")
+MERMAID_NODE_PATTERN = re.compile(r"(\w+)\s*[\[\(\{]+\"?([^\]\)\}\"]+)")
+MERMAID_LABEL_PATTERN = re.compile(r"[\[\(\{]+[^\]\)\}]*[\]\)\}]+|\|[^|]*\|")
+MERMAID_ARROW_PATTERN = re.compile(r"\s*(?:--+>|-\.+->|==+>)\s*")
+
+IGNORED_NAMES = {"__init__", "base", "base_class", "mixins"}
+
+UNIT_SCOPE = """
+ALCANCE DE ESTA UNIDAD (otros agentes trabajan en paralelo en otras entidades):
+- Trabaja SOLO la entidad {class_name} ({entity})
+- Escribe únicamente: {output_dir}/{target}
+- NO modifiques __init__.py, routers ni archivos de otras entidades: se integran en un paso final
+"""
+
+
+def to_snake_case(name: str) -> str:
+    """TaskComment -> task_comment"""
+    return re.sub(r"(?<!^)(?=[A-Z])", "_", name).lower()
+
+
+def to_class_name(name: str) -> str:
+    """task_comment -> TaskComment"""
+    return "".join(part.capitalize() for part in name.split("_"))
+
+
+def singularize(name: str) -> str:
+    """users -> user, categories -> category, addresses -> address (solo la última palabra)."""
+    head, _, last = name.rpartition("_")
+    if last.endswith("ies") and len(last) > 4:
+        last = last[:-3] + "y"
+    elif last.endswith(("sses", "xes", "ches", "shes")):
+        last = last[:-2]
+    elif last.endswith("s") and not last.endswith(("ss", "us", "is")):
+        last = last[:-1]
+    return f"{head}_{last}" if head else last
+
+
+def parse_entities(backend_tasks: str) -> dict[str, str]:
+    """
+    Entidades de backend_tasks.md: rutas app/models/<x>.py y clases `class X(Base)`.
+
+    Los títulos se ignoran y los nombres se pasan a singular, así User y
+    users.py son la misma entidad.
+
+    Returns:
+        dict: nombre snake_case -> nombre de clase, en orden de aparición
+    """
+    names = []
+    for line in backend_tasks.splitlines():
+        if HEADING_PATTERN.match(line):
+            continue
+        names += MODEL_FILE_PATTERN.findall(line)
+        names += [to_snake_case(class_name) for class_name in MODEL_CLASS_PATTERN.findall(line)]
+
+    entities: dict[str, str] = {}
+    for name in names:
+        entity = singularize(name.lower())
+        if entity not in IGNORED_NAMES:
+            entities.setdefault(entity, to_class_name(entity))
+    return entities
+
+
+def parse_mermaid_edges(diagram: str) -> list[tuple[str, str]]:
+    """Aristas (origen, destino) de un diagrama mermaid, incluyendo cadenas A --> B --> C."""
+    edges = []
+    for line in diagram.splitlines():
+        parts = MERMAID_ARROW_PATTERN.split(MERMAID_LABEL_PATTERN.sub("", line))
+        if len(parts) < 2:
+            continue
+        ids = [part.strip().split()[-1] if part.strip() else "" for part in parts]
+        edges += [(source, target) for source, target in zip(ids, ids[1:]) if source and target]
+    return edges
+
+
+def _entity_of(text: str, entities: dict[str, str]) -> str | None:
+    """Primera entidad mencionada en un texto (por nombre de clase o snake_case)."""
+    for entity, class_name in entities.items():
+        if re.search(rf"\b({class_name}|{entity})s?\b", text, re.IGNORECASE):
+            return entity
+    return None
+
+
+def parse_entity_dependencies(
+    dependencies_map: str, backend_tasks: str, entities: dict[str, str]
+) -> dict[str, set[str]]:
+    """
+    Dependencias entre entidades a partir del diagrama mermaid.
+
+    Cada nodo del diagrama se asocia a una entidad por su etiqueta o, si no la
+    menciona, por la línea de backend_tasks.md que contiene su ID. Una arista
+    A --> B entre tareas de entidades distintas significa que B depende de A.
+
+    Returns:
+        dict: entidad -> entidades de las que depende
+    """
+    node_entities: dict[str, str] = {}
+    for node_id, label in MERMAID_NODE_PATTERN.findall(dependencies_map):
+        entity = _entity_of(label, entities)
+        if entity:
+            node_entities.setdefault(node_id, entity)
+
+    task_lines = backend_tasks.splitlines()
+    for node_id in set(re.findall(r"\w+", dependencies_map)) - set(node_entities):
+        for line in task_lines:
+            if re.search(rf"\b{re.escape(node_id)}\b", line):
+                entity = _entity_of(line, entities)
+                if entity:
+                    node_entities[node_id] = entity
+                    break
+
+    dependencies: dict[str, set[str]] = {entity: set() for entity in entities}
+    for source, target in parse_mermaid_edges(dependencies_map):
+        source_entity, target_entity = node_entities.get(source), node_entities.get(target)
+        if source_entity and target_entity and source_entity != target_entity:
+            dependencies[target_entity].add(source_entity)
+    return dependencies
+
+
+def build_backend_units(entities: dict[str, str], dependencies: dict[str, set[str]]) -> list[dict]:
+    """
+    Construye las unidades por (etapa, entidad).
+
+    Las dependencias entre entidades que formarían un ciclo se descartan.
+    """
+    if not entities:
+        # Flujo secuencial original: una unidad por etapa
+        units = []
+        previous = "backend_setup"
+        for stage in ENTITY_STAGES:
+            units.append({"id": stage, "stage": stage, "entity": None, "depends_on": [previous]})
+            previous = stage
+        return units
+
+    units = []
+    for entity, class_name in entities.items():
+        for stage in ENTITY_STAGES:
+            depends_on = [f"{dep}:{entity}" for dep in STAGE_DEPENDENCIES[stage]] or ["backend_setup"]
+            if stage != "backend_models":
+                depends_on += [f"{stage}:{dep}" for dep in sorted(dependencies.get(entity, ()))]
+            units.append(
+                {
+                    "id": f"{stage}:{entity}",
+                    "stage": stage,
+                    "entity": entity,
+                    "class_name": class_name,
+                    "depends_on": depends_on,
+                }
+            )
+
+    if has_cycle(units):
+        print("   ⚠️  Dependencias circulares entre entidades: se ignoran las dependencias cruzadas")
+        return build_backend_units(entities, {})
+    return units
+
+
+def with_unit_scope(prompt: str, state: dict) -> str:
+    """Limita el prompt de una etapa a la entidad de la unidad en curso (si la hay)."""
+    unit = state.get("unit")
+    if not unit or not unit.get("entity"):
+        return prompt
+    return prompt + UNIT_SCOPE.format(
+        class_name=unit["class_name"],
+        entity=unit["entity"],
+        output_dir=state.get("backend_output_dir", ""),
+        target=STAGE_TARGETS[unit["stage"]].format(entity=unit["entity"]),
+    )
+
+
+def unit_label(state: dict, stage: str) -> str:
+    """Nombre de la etapa para reportes: backend_models o backend_models:task."""
+    unit = state.get("unit")
+    return unit["id"] if unit else stage
+
+
+def backend_planner_node(state: GraphState):
+    """
+    Nodo Backend Planner - Genera el plan de unidades del subgrafo backend.
+    """
+
+    print("\n🗺️  Backend Planner - Derivando dependencias entre tareas...")
+
+    sprint_planning_dir = Path(state.get("sprint_planning_dir", ""))
+    tasks_file = sprint_planning_dir / "backend_tasks.md"
+    map_file = sprint_planning_dir / "dependencies_map.md"
+
+    backend_tasks = tasks_file.read_text(encoding="utf-8") if tasks_file.exists() else ""
+    dependencies_map = map_file.read_text(encoding="utf-8") if map_file.exists() else ""
+
+    entities = parse_entities(backend_tasks)
+    dependencies = parse_entity_dependencies(dependencies_map, backend_tasks, entities)
+    units = build_backend_units(entities, dependencies)
+
+    if entities:
+        cross = {entity: sorted(deps) for entity, deps in dependencies.items() if deps}
+        summary = (
+            f"Backend Planner - {len(entities)} entidades ({', '.join(entities.values())}), "
+            f"{len(units)} unidades; dependencias entre entidades: {cross or 'ninguna'}"
+        )
+    else:
+        summary = "Backend Planner - No se detectaron entidades, se usa el flujo secuencial"
+    print(f"✅ {summary}")
+
+    return {"messages": [SystemMessage(content=summary)], "units": units}
@@ -3,29 +3,82 @@ Backend Subgraph - Define el flujo de trabajo para construir el backend.
 
 Flujo:
 1. backend_setup → Estructura base
-2. backend_models → Modelos SQLAlchemy
-3. backend_schemas → Schemas Pydantic
-4. backend_crud → CRUD operations
-5. backend_api → Endpoints FastAPI
-6. backend_tests → Tests con pytest
+2. backend_planner → DAG de unidades (etapa, entidad) desde backend_tasks.md y dependencies_map.md
+3. backend_unit (en paralelo) → models / schemas / crud / api de cada entidad
+   a medida que sus dependencias terminan
+4. backend_wiring → __init__.py, router y main.py con todas las entidades
+5. backend_tests → tests con pytest
+6. backend_verify → compile, import de la app y pytest en un sandbox; si algo
+   falla, backend_repair corrige en paralelo cada archivo afectado y se
+   vuelve a verificar (hasta BACKEND_REPAIR_ROUNDS rondas)
+
+Si el planner no detecta entidades, las unidades son las etapas completas y
+se ejecutan en secuencia: models → schemas → crud → api (flujo original).
 """
 
+import os
+from langchain_core.messages import SystemMessage
 from langgraph.graph import StateGraph, END
 from graph.state import GraphState
+from graph.units import route_units
+from graph.checkpoint import timed_node
 from .backend_setup import backend_setup_node_async
 from .backend_models import backend_models_node_async
 from .backend_schemas import backend_schemas_node_async
 from .backend_crud import backend_crud_node_async
 from .backend_api import backend_api_node_async
 from .backend_tests import backend_tests_node_async
+from .backend_wiring import backend_wiring_node_async
+from .backend_verify import backend_verify_node_async, route_verification
+from .backend_repair import backend_repair_node_async
+from .planner import backend_planner_node
+
+# Máximo de agentes backend ejecutándose a la vez (max_concurrency del config)
+BACKEND_MAX_CONCURRENCY = int(os.getenv("BACKEND_MAX_CONCURRENCY", "4"))
+
+STAGE_NODES = {
+    "backend_models": backend_models_node_async,
+    "backend_schemas": backend_schemas_node_async,
+    "backend_crud": backend_crud_node_async,
+    "backend_api": backend_api_node_async,
+}
+
+
+async def backend_unit_node_async(state: GraphState):
+    """
+    Ejecuta una unidad del plan con el nodo de su etapa y la marca como completada.
+
+    La unidad se marca completada aunque falle, para no bloquear el resto del
+    plan; el error queda en los mensajes.
+    """
+    unit = state["unit"]
+    try:
+        update = await STAGE_NODES[unit["stage"]](state)
+    except Exception as e:
+        update = {"messages": [SystemMessage(content=f"{unit['id']} - Error: {type(e).__name__}: {e}")]}
+    return {**update, "completed_units": [unit["id"]]}
+
+
+def backend_scheduler_node(state: GraphState):
+    """Punto de sincronización entre oleadas de unidades paralelas."""
+    return {}
+
 
+def route_backend_units(state: GraphState):
+    return route_units(state, "backend_unit", "backend_wiring")
 
-def create_backend_subgraph():
+
+def create_backend_subgraph(checkpointer=None):
     """
     Crea el subgrafo para desarrollo backend.
 
-    El subgrafo divide el trabajo en 6 pasos secuenciales para evitar
-    GraphRecursionError al generar muchos archivos.
+    Las unidades listas se despachan con Send como ramas paralelas; los
+    resultados se combinan con reducers (messages, agent_stats,
+    completed_units). Invocar con {"max_concurrency": BACKEND_MAX_CONCURRENCY}
+    en el config para limitar los agentes simultáneos.
+
+    Con un checkpointer, cada oleada queda persistida y una ejecución
+    interrumpida se retoma desde la última unidad terminada.
 
     Returns:
         Compiled subgraph
@@ -35,21 +88,27 @@ def create_backend_subgraph():
     subgraph = StateGraph(GraphState)
 
     # Agregar nodos
-    subgraph.add_node("backend_setup", backend_setup_node_async)
-    subgraph.add_node("backend_models", backend_models_node_async)
-    subgraph.add_node("backend_schemas", backend_schemas_node_async)
-    subgraph.add_node("backend_crud", backend_crud_node_async)
-    subgraph.add_node("backend_api", backend_api_node_async)
-    # subgraph.add_node("backend_tests", backend_tests_node_async)
-
-    # Definir flujo secuencial
+    subgraph.add_node("backend_setup", timed_node("backend_setup", backend_setup_node_async))
+    subgraph.add_node("backend_planner", timed_node("backend_planner", backend_planner_node))
+    subgraph.add_node("backend_scheduler", backend_scheduler_node)
+    subgraph.add_node("backend_unit", timed_node("backend_unit", backend_unit_node_async))
+    subgraph.add_node("backend_wiring", timed_node("backend_wiring", backend_wiring_node_async))
+    subgraph.add_node("backend_tests", timed_node("backend_tests", backend_tests_node_async))
+    subgraph.add_node("backend_verify", timed_node("backend_verify", backend_verify_node_async))
+    subgraph.add_node("backend_repair", timed_node("backend_repair", backend_repair_node_async))
+
+    # Definir flujo: setup → planner → oleadas de unidades → wiring → tests → verify ⇄ repair
     subgraph.set_entry_point("backend_setup")
 
-    subgraph.add_edge("backend_setup", "backend_models")
-    subgraph.add_edge("backend_models", "backend_schemas")
-    subgraph.add_edge("backend_schemas", "backend_crud")
-    subgraph.add_edge("backend_crud", "backend_api")
-    # subgraph.add_edge("backend_api", "backend_tests")
-    subgraph.add_edge("backend_api", END)
+    subgraph.add_edge("backend_setup", "backend_planner")
+    subgraph.add_edge("backend_planner", "backend_scheduler")
+    subgraph.add_conditional_edges(
+        "backend_scheduler", route_backend_units, ["backend_unit", "backend_wiring"]
+    )
+    subgraph.add_edge("backend_unit", "backend_scheduler")
+    subgraph.add_edge("backend_wiring", "backend_tests")
+    subgraph.add_edge("backend_tests", "backend_verify")
+    subgraph.add_conditional_edges("backend_verify", route_verification, ["backend_repair", END])
+    subgraph.add_edge("backend_repair", "backend_verify")
 
-    return subgraph.compile()
+    return subgraph.compile(checkpointer=checkpointer)
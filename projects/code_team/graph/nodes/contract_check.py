@@ -0,0 +1,72 @@
+"""
+Contract Check - Nodo de reconciliación tras la implementación en paralelo.
+
+Compara el contrato OpenAPI con las rutas del backend y las llamadas del
+frontend, y escribe el resultado en {main_output}/contract/reconciliation.md.
+"""
+
+from pathlib import Path
+from langchain_core.messages import SystemMessage
+from graph.state import GraphState
+from graph.contract import (
+    load_contract_operations,
+    backend_operations,
+    frontend_operations,
+    reconcile,
+)
+
+SECTION_TITLES = {
+    "missing_in_backend": "Operaciones del contrato sin implementar en el backend",
+    "extra_in_backend": "Rutas del backend fuera del contrato",
+    "frontend_outside_contract": "Llamadas del frontend que el contrato no declara",
+}
+
+
+def contract_check_node(state: GraphState):
+    """
+    Nodo Contract Check - Reconciliación contrato / backend / frontend.
+
+    Retorna:
+        dict: Update al state con messages y contract_mismatches
+    """
+
+    print("\n🤝 Contract Check - Reconciliando backend y frontend con el contrato...")
+
+    contract_file = state.get("api_contract_path")
+    if not contract_file or not Path(contract_file).exists():
+        warning_msg = "Contract Check - No hay contrato API, se omite la reconciliación"
+        print(f"⚠️  {warning_msg}")
+        return {"messages": [SystemMessage(content=warning_msg)]}
+
+    contract = load_contract_operations(Path(contract_file))
+    backend_dir = state.get("backend_output_dir")
+    frontend_dir = state.get("frontend_output_dir")
+    backend = backend_operations(Path(backend_dir)) if backend_dir else set()
+    frontend = frontend_operations(Path(frontend_dir)) if frontend_dir else set()
+
+    differences = reconcile(contract, backend, frontend)
+    mismatches = differences["missing_in_backend"] + differences["frontend_outside_contract"]
+
+    lines = [
+        "# Reconciliación del contrato API",
+        "",
+        f"- Operaciones en el contrato: {len(contract)}",
+        f"- Rutas en el backend: {len(backend)}",
+        f"- Llamadas en el frontend: {len(frontend)}",
+    ]
+    for key, title in SECTION_TITLES.items():
+        lines += ["", f"## {title}", ""]
+        lines += [f"- [ ] {operation}" for operation in differences[key]] or ["Ninguna"]
+    report_file = Path(contract_file).parent / "reconciliation.md"
+    report_file.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+    summary = (
+        f"Contract Check - {len(contract)} operaciones en el contrato:\n"
+        f"- Sin implementar en backend: {len(differences['missing_in_backend'])}\n"
+        f"- Backend fuera del contrato: {len(differences['extra_in_backend'])}\n"
+        f"- Frontend fuera del contrato: {len(differences['frontend_outside_contract'])}\n"
+        f"- Reporte: {report_file}"
+    )
+    print(f"{'✅' if not mismatches else '⚠️ '} {summary}")
+
+    return {"messages": [SystemMessage(content=summary)], "contract_mismatches": mismatches}
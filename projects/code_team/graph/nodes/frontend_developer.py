@@ -1,296 +1,132 @@
 """
-Frontend Developer - Nodo que implementa el código frontend con React.
+Frontend Developer - Nodo orquestador que invoca el subgrafo frontend.
 
 Este nodo:
-1. Lee las tareas asignadas a frontend
-2. Crea la estructura del proyecto React
-3. Implementa componentes, páginas, state management
-4. Integra con el backend API
+1. Verifica que existan las tareas de frontend (frontend_tasks.md)
+2. Prepara el directorio de salida (no espera al backend: se ejecuta en paralelo con él)
+3. Invoca el subgrafo frontend, que genera la base del proyecto y luego cada
+   feature del contrato API en paralelo
 """
 
-import asyncio
-import json
-import os
 from pathlib import Path
-from typing import List
+from langchain_core.messages import SystemMessage
+from langchain_core.runnables import RunnableConfig
+from dotenv import load_dotenv
+from graph.state import GraphState
+from graph.build_cache import StageCache, stage_config, hash_sources
+from graph.checkpoint import SubgraphRun
+from .frontend_subgraph import create_frontend_subgraph, FRONTEND_MAX_CONCURRENCY
 
-from claude_agent_sdk import ClaudeSDKClient, ClaudeAgentOptions
+load_dotenv()
 
-from src.state import DevelopmentState, Task, CodeFile
 
-
-FRONTEND_DEVELOPER_PROMPT = """Eres un Senior Frontend Developer especializado en React y TypeScript.
-
-Expertise:
-- React 18+: hooks, context, custom hooks, performance optimization
-- TypeScript: tipos avanzados, generics, utility types
-- TailwindCSS: utility classes, responsive design, custom themes
-- Redux Toolkit: slices, async thunks, RTK Query
-- React Router: routing, navigation, protected routes
-- Axios: API integration, interceptors, error handling
-
-Tech Stack:
-- React 18+ con TypeScript
-- TailwindCSS para styling
-- Redux Toolkit para state management
-- React Router para routing
-- Axios para HTTP requests
-- Vite como build tool
-
-Estructura de proyecto estándar:
-```
-frontend/
-├── src/
-│   ├── main.tsx             # Entry point
-│   ├── App.tsx              # Root component
-│   ├── components/          # Reusable components
-│   │   └── common/
-│   ├── pages/               # Page components
-│   ├── features/            # Feature-based modules
-│   │   └── users/
-│   │       ├── usersSlice.ts
-│   │       ├── usersAPI.ts
-│   │       └── Users.tsx
-│   ├── store/               # Redux store
-│   │   └── index.ts
-│   ├── api/                 # API configuration
-│   │   └── axios.ts
-│   ├── hooks/               # Custom hooks
-│   ├── types/               # TypeScript types
-│   └── utils/               # Utility functions
-├── public/
-├── index.html
-├── package.json
-├── tsconfig.json
-├── tailwind.config.js
-└── vite.config.ts
-```
-
-Principios de código:
-- TypeScript estricto
-- Componentes funcionales con hooks
-- Props typing completo
-- Code splitting cuando sea apropiado
-- Responsive design (mobile-first)
-- Accesibilidad (a11y)
-- Error boundaries
-- Loading states
-- Código limpio y mantenible
-
-Tu trabajo es escribir código production-ready, no prototipos.
-"""
-
-
-def load_mcp_config():
-    """Carga configuración de MCPs"""
-    return {
-        "filesystem": {
-            "type": "stdio",
-            "command": "npx",
-            "args": ["-y", "@modelcontextprotocol/server-filesystem", "/workspace"]
-        }
-    }
-
-
-async def frontend_developer_node_async(state: DevelopmentState) -> DevelopmentState:
-    """
-    Nodo del Frontend Developer - Implementa código React.
+async def frontend_developer_node_async(state: GraphState, config: RunnableConfig):
     """
-    
-    print("\n🎨 Frontend Developer - Implementando UI...")
-    
-    # Filtrar tareas de frontend
-    all_tasks = state['tasks']
-    frontend_tasks = [t for t in all_tasks if t['assigned_to'] == 'frontend']
-    
-    if not frontend_tasks:
-        print("   ℹ️  No hay tareas de frontend asignadas")
-        return {
-            **state,
-            'frontend_completed': True
-        }
-    
-    workspace = Path(state['workspace_path'])
-    frontend_dir = workspace / state['project_name'] / 'frontend'
-    
-    # Preparar contexto de tareas
-    tasks_summary = "\n".join([
-        f"[{task['id']}] {task['title']}\n  Descripción: {task['description']}\n  Dependencias: {task['dependencies']}"
-        for task in frontend_tasks
-    ])
-    
-    # Información del backend (para integración API)
-    backend_info = ""
-    if state.get('backend_files'):
-        backend_info = f"""
-Backend API disponible:
-- Archivos backend: {len(state['backend_files'])} archivos creados
-- Integra con estos endpoints al crear componentes
-"""
-    
-    context = f"""
-Proyecto: {state['project_name']}
-Workspace: {frontend_dir}
-
-Tareas asignadas a Frontend:
-{tasks_summary}
-
-{backend_info}
-
-User Stories de referencia:
-{json.dumps(state['user_stories'], indent=2)}
-"""
-    
-    # Configurar Claude Agent con filesystem MCP
-    mcp_servers = load_mcp_config()
-    mcp_servers["filesystem"]["args"][-1] = str(workspace)
-    
-    options = ClaudeAgentOptions(
-        mcp_servers=mcp_servers,
-        system_prompt=FRONTEND_DEVELOPER_PROMPT,
-        allowed_tools=["mcp__filesystem__*"],
-        model=os.getenv("CLAUDE_MODEL", "claude-sonnet-4-5-20250929"),
-        max_tokens=8000,
-    )
-    
-    query = f"""{context}
-
-Por favor, implementa el frontend completo del proyecto usando React + TypeScript.
-
-Pasos:
-1. Crea la estructura de directorios estándar en: {frontend_dir}
-2. Implementa los archivos necesarios para cada tarea:
-   - main.tsx como entry point
-   - App.tsx con routing
-   - components/ con componentes reutilizables
-   - pages/ con páginas principales
-   - features/ con features Redux
-   - store/ con configuración Redux
-   - api/ con configuración Axios
-   - types/ con tipos TypeScript
+    Nodo del Frontend Developer - Orquesta la construcción del frontend.
 
-3. El código debe:
-   - Usar TypeScript estricto
-   - Implementar state management con Redux Toolkit
-   - Integrar con backend API usando Axios
-   - Ser responsive con TailwindCSS
-   - Incluir loading states y error handling
-   - Tener componentes reutilizables
+    Delega al subgrafo frontend: setup → features en paralelo (a lo sumo
+    FRONTEND_MAX_CONCURRENCY agentes a la vez) → wiring. Con checkpointer
+    activo el subgrafo usa el thread "<run_id>:frontend".
 
-4. Configuración:
-   - package.json con todas las dependencias
-   - tsconfig.json con configuración strict
-   - tailwind.config.js
-   - vite.config.ts
+    Retorna:
+        dict: Update al state con messages y frontend_output_dir
+    """
 
-5. Features importantes:
-   - Routing con React Router
-   - Forms con validación
-   - API integration con error handling
-   - Loading spinners
-   - Toast notifications (si es necesario)
+    print("\n🎨 Frontend Developer - Implementando UI...")
 
-Usa el filesystem MCP para crear todos los archivos necesarios.
+    project_name = state.get("project_name", "test_project")
+    frontend_stack = state.get("frontend_stack", "React, TailwindCSS, Zustand")
+    user_stories_dir = state.get("user_stories_dir", "")
+    sprint_planning_dir = state.get("sprint_planning_dir")
+    main_output = state.get("main_output")
+
+    if not sprint_planning_dir:
+        error_msg = "Frontend Developer - Error: sprint_planning_dir no encontrado en el estado. Ejecuta Scrum Master primero."
+        print(f"❌ {error_msg}")
+        return {"messages": [SystemMessage(content=error_msg)]}
+
+    # Directorio de salida para el código frontend
+    output_dir = Path(main_output) / "app/frontend"
+    output_dir.mkdir(parents=True, exist_ok=True)
+    output_dir_absolute = output_dir.resolve()
+
+    print(f"   📖 Leyendo tareas de: {sprint_planning_dir}/frontend_tasks.md")
+    print(f"   📁 Generando código en: {output_dir_absolute}")
+
+    # Reutilizar el frontend previo si planificación, contrato y prompts del subgrafo no cambiaron
+    cache = StageCache(main_output, "frontend_developer")
+    upstream = [user_stories_dir, sprint_planning_dir, state.get("api_contract_path")]
+    subgraph_sources = hash_sources(Path(__file__).parent / "frontend_subgraph")
+    input_hash = cache.input_hash(subgraph_sources, upstream, stage_config(state))
+    if cache.is_fresh(input_hash):
+        skip_msg = f"Frontend Developer - Salida reutilizada ({cache.reason}): {output_dir_absolute}"
+        print(f"♻️  {skip_msg}")
+        return {"messages": [SystemMessage(content=skip_msg)], "frontend_output_dir": str(output_dir_absolute)}
+
+    subgraph_run = SubgraphRun(create_frontend_subgraph, config, "frontend", FRONTEND_MAX_CONCURRENCY)
+    pending = await subgraph_run.load()
+    if pending:
+        print(f"   ⏯️  Retomando subgrafo frontend desde: {', '.join(pending)}")
+    else:
+        print(f"   🔁 Ejecutando Frontend Developer: {cache.reason}")
+        cache.clean_outputs()
+
+    subgraph_state = {
+        **state,
+        "frontend_output_dir": str(output_dir_absolute),
+        # El subgrafo solo acumula sus propias métricas, unidades y duraciones
+        "agent_stats": [],
+        "completed_units": [],
+        "node_durations": {},
+    }
 
-Al final, responde con un JSON:
-{{
-  "files_created": ["path/to/Component.tsx", "path/to/page.tsx", ...],
-  "summary": "Resumen de lo implementado",
-  "pages": [
-    {{"name": "Home", "route": "/", "description": "..."}}
-  ],
-  "components": ["Header", "Footer", "UserCard", ...]
-}}
+    print(f"\n   🏗️  Ejecutando subgrafo frontend (hasta {FRONTEND_MAX_CONCURRENCY} agentes en paralelo)...")
 
-¡Adelante! Crea el frontend completo.
-"""
-    
     try:
-        async with ClaudeSDKClient(options=options) as client:
-            print("   🤖 Escribiendo código frontend...")
-            print("   ⏳ Esto puede tomar varios minutos...")
-            
-            await client.query(query)
-            
-            full_response = ""
-            async for message in client.receive_response():
-                if hasattr(message, 'text'):
-                    text = message.text
-                    full_response += text
-                    # Mostrar progreso
-                    if "Creating" in text or "created" in text:
-                        preview = text[:60].replace('\n', ' ')
-                        print(f"      {preview}...", end='\r')
-                else:
-                    full_response += str(message)
-            
-            print("\n   ✅ Código frontend generado")
-            
-            # Parsear respuesta
-            files_created = []
-            try:
-                start = full_response.find('{')
-                end = full_response.rfind('}') + 1
-                
-                if start != -1 and end > start:
-                    json_str = full_response[start:end]
-                    data = json.loads(json_str)
-                    
-                    files_created = data.get('files_created', [])
-                    summary = data.get('summary', '')
-                    pages = data.get('pages', [])
-                    components = data.get('components', [])
-                    
-                    print(f"\n   📄 Archivos creados: {len(files_created)}")
-                    print(f"   📱 Páginas: {len(pages)}")
-                    print(f"   🧩 Componentes: {len(components)}")
-                    
-                    # Mostrar algunas páginas
-                    if pages:
-                        print("\n   Páginas principales:")
-                        for page in pages[:5]:
-                            print(f"      {page.get('route', 'N/A')} - {page.get('name', 'N/A')}")
-                    
-                    print(f"\n   📝 {summary[:150]}...")
-                    
-            except json.JSONDecodeError:
-                # Si no hay JSON válido, buscar archivos mencionados
-                if "App.tsx" in full_response:
-                    files_created.append("frontend/src/App.tsx")
-                if "main.tsx" in full_response:
-                    files_created.append("frontend/src/main.tsx")
-            
-            # Crear lista de CodeFile
-            frontend_files: List[CodeFile] = []
-            for file_path in files_created:
-                # Determinar el lenguaje
-                ext = Path(file_path).suffix
-                language = "typescript" if ext in ['.ts', '.tsx'] else "javascript"
-                
-                frontend_files.append(CodeFile(
-                    path=file_path,
-                    content="[Generated by Claude Agent]",
-                    language=language,
-                    created_by="frontend_developer"
-                ))
-            
-            return {
-                **state,
-                'frontend_files': frontend_files,
-                'frontend_completed': True,
-                'updated_at': str(asyncio.get_event_loop().time())
-            }
-            
-    except Exception as e:
-        print(f"   ❌ Error en Frontend Developer: {e}")
-        
+        subgraph_result = await subgraph_run.invoke(subgraph_state)
+        agent_stats = subgraph_result.get("agent_stats", [])
+
+        created_files = [
+            path for path in output_dir.rglob("*")
+            if path.suffix in (".ts", ".tsx", ".js", ".jsx") and "node_modules" not in path.parts
+        ]
+        if not created_files:
+            error_msg = (
+                f"Frontend Developer - Error: No se crearon archivos en {output_dir_absolute}\n"
+                "El subgrafo no generó código. Verifica los prompts o intenta nuevamente."
+            )
+            print(f"\n❌ {error_msg}")
+            return {"messages": [SystemMessage(content=error_msg)], "agent_stats": agent_stats}
+
+        summary = (
+            f"Frontend Developer - Implementación completada exitosamente:\n"
+            f"- Proyecto: {project_name}\n"
+            f"- Archivos TS/JS generados: {len(created_files)}\n"
+            f"- Directorio: {output_dir_absolute}\n"
+            f"- Subgrafo ejecutado: setup → {len(subgraph_result.get('completed_units', []))} features → wiring\n"
+            f"- Stack: {frontend_stack}"
+        )
+        stopped = [stats["stage"] for stats in agent_stats if stats.get("stopped")]
+        if stopped:
+            summary += f"\n- Agentes detenidos por presupuesto: {', '.join(stopped)}"
+        print(f"\n✅ {summary}")
+        # Con agentes detenidos el frontend quedó a medias: se regenera en la próxima ejecución
+        if not stopped:
+            cache.record(input_hash, [output_dir_absolute])
+
         return {
-            **state,
-            'frontend_completed': False,
-            'errors': state['errors'] + [f"Frontend Developer failed: {e}"]
+            "messages": [SystemMessage(content=summary)],
+            "frontend_output_dir": str(output_dir_absolute),
+            "agent_stats": agent_stats,
+            "node_durations": subgraph_result.get("node_durations", {}),
         }
 
-
-def frontend_developer_node(state: DevelopmentState) -> DevelopmentState:
-    """Wrapper sincrónico"""
-    return asyncio.run(frontend_developer_node_async(state))
\ No newline at end of file
+    except Exception as e:
+        error_msg = (
+            f"Frontend Developer - Error en la implementación:\n"
+            f"Tipo: {type(e).__name__}\n"
+            f"Detalle: {str(e)}\n"
+            f"El proceso no pudo completarse correctamente."
+        )
+        print(f"\n❌ {error_msg}")
+        return {"messages": [SystemMessage(content=error_msg)]}
@@ -0,0 +1,19 @@
+"""
+Frontend Subgraph - Nodos especializados para construir el frontend por features.
+"""
+
+from .frontend_setup import frontend_setup_node_async
+from .frontend_feature import frontend_feature_node_async
+from .frontend_wiring import frontend_wiring_node_async
+from .frontend_planner import frontend_planner_node, build_feature_units
+from .subgraph import create_frontend_subgraph, FRONTEND_MAX_CONCURRENCY
+
+__all__ = [
+    "frontend_setup_node_async",
+    "frontend_feature_node_async",
+    "frontend_wiring_node_async",
+    "frontend_planner_node",
+    "build_feature_units",
+    "create_frontend_subgraph",
+    "FRONTEND_MAX_CONCURRENCY",
+]
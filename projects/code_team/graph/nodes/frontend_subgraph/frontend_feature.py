@@ -0,0 +1,83 @@
+"""
+Frontend Feature Node - Implementa una feature (recurso del contrato) del frontend.
+
+Cada unidad del plan es un recurso (auth, tasks, ...). Las features son
+independientes entre sí: se generan en paralelo y solo escriben sus propios
+archivos; App.tsx y la navegación se integran en frontend_wiring.
+"""
+
+from langchain_core.messages import SystemMessage
+from dotenv import load_dotenv
+from graph.state import GraphState
+from graph.tools import get_filesystem_tools
+from graph.agents import run_agent, stopped_update
+from graph.context import with_context_bundle
+from graph.contract import with_api_contract
+from .frontend_planner import with_feature_scope, feature_label
+
+load_dotenv()
+
+
+FRONTEND_FEATURE_PROMPT = """Eres un Senior Frontend Developer especializado en React y TypeScript.
+
+Proyecto: {project_name}
+Stack: {frontend_tech_stack}
+
+UBICACIÓN:
+- Lee tareas: {sprint_planning_dir}/frontend_tasks.md
+- Código base en: {output_dir}/src/ (api/client.ts, types/, store/, components/ui/, components/layout/)
+- Escribe código en: {output_dir}/src/
+
+TAREA: Implementar {feature}
+
+Para la feature crea:
+- src/api/<recurso>.ts: un método por operación del contrato, usando api/client.ts
+- src/hooks/: hooks de datos (loading, error, refetch)
+- src/store/: state de la feature si hace falta
+- src/pages/<Recurso>/: páginas (listado con paginación, detalle, formularios crear/editar)
+- src/components/<recurso>/: componentes propios de la feature
+
+El código debe:
+- Usar los tipos de src/types/ y los componentes de src/components/ui/
+- Ser responsive, con loading states, manejo de errores y formularios con validación
+
+NO uses placeholders. Código production-ready.
+"""
+
+
+async def frontend_feature_node_async(state: GraphState):
+    """
+    Nodo Frontend Feature - Implementa la feature de la unidad en curso.
+    """
+
+    unit = state.get("unit") or {}
+    feature = f"la feature '{unit['entity']}'" if unit.get("entity") else "todas las features de frontend_tasks.md"
+    print(f"\n🧩 Frontend Feature - Implementando {feature}...")
+
+    prompt = FRONTEND_FEATURE_PROMPT.format(
+        project_name=state.get("project_name", "test_project"),
+        frontend_tech_stack=state.get("frontend_stack", "React, TailwindCSS, Zustand"),
+        sprint_planning_dir=state.get("sprint_planning_dir", ""),
+        output_dir=state.get("frontend_output_dir", ""),
+        feature=feature,
+    )
+    prompt = with_feature_scope(prompt, state)
+    prompt = with_context_bundle(prompt, state, "frontend_feature")
+    prompt = with_api_contract(prompt, state, "backend")
+
+    try:
+        tools = await get_filesystem_tools(state.get("main_output"), state.get("filesystem_backend"))
+
+        _, stats = await run_agent(feature_label(state, "frontend_feature"), prompt, tools)
+        if stopped := stopped_update("Frontend Feature", stats):
+            return stopped
+
+        summary = f"Frontend Feature - {feature} implementada"
+        print(f"✅ {summary}")
+
+        return {"messages": [SystemMessage(content=summary)], "agent_stats": [stats]}
+
+    except Exception as e:
+        error_msg = f"Frontend Feature - Error en {feature}: {type(e).__name__}: {str(e)}"
+        print(f"❌ {error_msg}")
+        return {"messages": [SystemMessage(content=error_msg)]}
@@ -0,0 +1,93 @@
+"""
+Frontend Planner - Divide el frontend en features independientes.
+
+Cada recurso del contrato API (primer segmento de sus rutas: auth, tasks,
+...) es una unidad "frontend_feature:<recurso>" que depende solo de
+frontend_setup, así que todas las features se generan en paralelo. Sin
+contrato se usan las entidades de backend_tasks.md; si tampoco hay, el plan es
+una sola unidad con todo el frontend.
+"""
+
+import json
+from pathlib import Path
+from langchain_core.messages import SystemMessage
+from graph.state import GraphState
+from graph.contract import contract_resources
+from graph.nodes.backend_subgraph.planner import parse_entities
+
+FEATURE_SCOPE = """
+ALCANCE DE ESTA UNIDAD (otros agentes implementan otras features en paralelo):
+- Trabaja SOLO la feature '{resource}'
+- Escribe únicamente: src/api/{resource}.ts, src/pages/{component}/, src/components/{resource}/,
+  src/hooks/use{component}*.ts y src/store/{resource}Store.ts
+- NO modifiques App.tsx, main.tsx, src/types/, src/components/ui/ ni src/components/layout/:
+  las rutas y la navegación se integran en un paso final
+"""
+
+
+def to_component_name(resource: str) -> str:
+    """task_comments -> TaskComments"""
+    return "".join(part.capitalize() for part in resource.split("_"))
+
+
+def plan_resources(state: dict) -> list[str]:
+    """Recursos del contrato o, sin contrato, entidades de backend_tasks.md."""
+    contract_file = state.get("api_contract_path")
+    if contract_file and Path(contract_file).exists():
+        try:
+            return contract_resources(Path(contract_file))
+        except json.JSONDecodeError:
+            pass
+    tasks_file = Path(state.get("sprint_planning_dir", "")) / "backend_tasks.md"
+    if tasks_file.exists():
+        return list(parse_entities(tasks_file.read_text(encoding="utf-8")))
+    return []
+
+
+def build_feature_units(resources: list[str], stage: str, depends_on: list[str]) -> list[dict]:
+    """Una unidad por recurso (o una sola unidad sin recursos), todas con las mismas dependencias."""
+    if not resources:
+        return [{"id": stage, "stage": stage, "entity": None, "depends_on": depends_on}]
+    return [
+        {
+            "id": f"{stage}:{resource}",
+            "stage": stage,
+            "entity": resource,
+            "class_name": to_component_name(resource),
+            "depends_on": depends_on,
+        }
+        for resource in resources
+    ]
+
+
+def with_feature_scope(prompt: str, state: dict) -> str:
+    """Limita el prompt a la feature de la unidad en curso (si la hay)."""
+    unit = state.get("unit")
+    if not unit or not unit.get("entity"):
+        return prompt
+    return prompt + FEATURE_SCOPE.format(resource=unit["entity"], component=unit["class_name"])
+
+
+def feature_label(state: dict, stage: str) -> str:
+    """Nombre de la etapa para reportes: frontend_feature o frontend_feature:tasks."""
+    unit = state.get("unit")
+    return unit["id"] if unit else stage
+
+
+def frontend_planner_node(state: GraphState):
+    """
+    Nodo Frontend Planner - Genera las unidades (features) del subgrafo frontend.
+    """
+
+    print("\n🗺️  Frontend Planner - Dividiendo el frontend en features...")
+
+    resources = plan_resources(state)
+    units = build_feature_units(resources, "frontend_feature", ["frontend_setup"])
+
+    if resources:
+        summary = f"Frontend Planner - {len(units)} features en paralelo: {', '.join(resources)}"
+    else:
+        summary = "Frontend Planner - No se detectaron recursos, se implementa el frontend en una sola unidad"
+    print(f"✅ {summary}")
+
+    return {"messages": [SystemMessage(content=summary)], "units": units}
@@ -0,0 +1,92 @@
+"""
+Frontend Setup Node - Crea la base del proyecto React compartida por todas las features.
+
+Crea:
+- Configuración (package.json, tsconfig.json, vite.config.ts, tailwind.config.js, index.html)
+- src/main.tsx, src/App.tsx con el router (las rutas de cada feature se agregan en frontend_wiring)
+- src/api/client.ts, src/types/ (desde components.schemas del contrato), src/store/ de auth
+- Componentes compartidos: src/components/ui/ y src/components/layout/
+"""
+
+from langchain_core.messages import SystemMessage
+from dotenv import load_dotenv
+from graph.state import GraphState
+from graph.tools import get_filesystem_tools
+from graph.agents import run_agent, stopped_update
+from graph.context import with_context_bundle
+from graph.contract import with_api_contract
+
+load_dotenv()
+
+
+FRONTEND_SETUP_PROMPT = """Eres un Senior Frontend Developer especializado en React y TypeScript.
+
+Proyecto: {project_name}
+Stack: {frontend_tech_stack}
+
+UBICACIÓN:
+- Lee tareas: {sprint_planning_dir}/frontend_tasks.md
+- Lee contexto: {user_stories_dir}/
+- Escribe código en: {output_dir}/
+
+TAREA: Crear la base del proyecto React + TypeScript (Vite) que usarán todas las features
+
+ESTRUCTURA A CREAR:
+```
+frontend/
+├── src/
+│   ├── main.tsx             # Entry point
+│   ├── App.tsx              # Router (React Router) con Layout y ProtectedRoute, sin rutas de features todavía
+│   ├── api/client.ts        # Cliente HTTP (baseURL /api/v1, token JWT, manejo de 401)
+│   ├── types/               # Tipos TypeScript equivalentes a components.schemas del contrato
+│   ├── store/authStore.ts   # Estado de autenticación
+│   ├── components/ui/       # Button, Input, Modal, Spinner, ErrorMessage
+│   └── components/layout/   # Layout, Navbar, ProtectedRoute
+├── index.html
+├── package.json
+├── tsconfig.json
+├── tailwind.config.js
+└── vite.config.ts
+```
+
+Otros agentes implementarán en paralelo cada feature (api/<recurso>.ts, pages/, hooks/)
+sobre esta base: los tipos y componentes compartidos deben estar completos.
+
+NO uses placeholders. Código production-ready.
+"""
+
+
+async def frontend_setup_node_async(state: GraphState):
+    """
+    Nodo Frontend Setup - Crea la base compartida del proyecto React.
+    """
+
+    print("\n🎨 Frontend Setup - Creando base del proyecto React...")
+
+    prompt = FRONTEND_SETUP_PROMPT.format(
+        project_name=state.get("project_name", "test_project"),
+        frontend_tech_stack=state.get("frontend_stack", "React, TailwindCSS, Zustand"),
+        sprint_planning_dir=state.get("sprint_planning_dir", ""),
+        user_stories_dir=state.get("user_stories_dir", ""),
+        output_dir=state.get("frontend_output_dir", ""),
+    )
+    prompt = with_context_bundle(prompt, state, "frontend_setup")
+    prompt = with_api_contract(prompt, state, "backend")
+
+    try:
+        tools = await get_filesystem_tools(state.get("main_output"), state.get("filesystem_backend"))
+
+        print("   🤖 Agente creando base del frontend...")
+        _, stats = await run_agent("frontend_setup", prompt, tools)
+        if stopped := stopped_update("Frontend Setup", stats):
+            return stopped
+
+        summary = "Frontend Setup - Base del proyecto React creada (config, api/client, types, ui, layout)"
+        print(f"✅ {summary}")
+
+        return {"messages": [SystemMessage(content=summary)], "agent_stats": [stats]}
+
+    except Exception as e:
+        error_msg = f"Frontend Setup - Error: {type(e).__name__}: {str(e)}"
+        print(f"❌ {error_msg}")
+        return {"messages": [SystemMessage(content=error_msg)]}
@@ -0,0 +1,73 @@
+"""
+Frontend Wiring Node - Integra las features generadas en paralelo.
+
+Las features no tocan App.tsx ni la navegación para no pisarse entre sí. Este
+nodo registra las rutas de todas las páginas y los links del Navbar.
+"""
+
+from langchain_core.messages import SystemMessage
+from dotenv import load_dotenv
+from graph.state import GraphState
+from graph.tools import get_filesystem_tools
+from graph.agents import run_agent, stopped_update
+from graph.context import with_context_bundle
+
+load_dotenv()
+
+
+FRONTEND_WIRING_PROMPT = """Eres un Senior Frontend Developer especializado en React y TypeScript.
+
+Proyecto: {project_name}
+
+UBICACIÓN:
+- Código en: {output_dir}/src/
+
+CONTEXTO: Varios agentes generaron en paralelo las features ({features}) en
+src/api/, src/pages/, src/components/<feature>/, src/hooks/ y src/store/.
+
+TAREA: Integrar esas features, sin reescribir su lógica
+
+- src/App.tsx: una ruta por página de cada feature (protegidas salvo login/registro)
+- src/components/layout/Navbar.tsx: links a las páginas principales de cada feature
+- Corrige imports rotos entre features y src/types/ si los encuentras
+
+NO uses placeholders.
+"""
+
+
+async def frontend_wiring_node_async(state: GraphState):
+    """
+    Nodo Frontend Wiring - Registra rutas y navegación de todas las features.
+    """
+
+    features = [unit["entity"] for unit in state.get("units", []) if unit.get("entity")]
+    if not features:
+        # Una sola unidad: ya implementó App.tsx y la navegación completas
+        return {}
+
+    print("\n🔌 Frontend Wiring - Integrando features generadas en paralelo...")
+
+    prompt = FRONTEND_WIRING_PROMPT.format(
+        project_name=state.get("project_name", "test_project"),
+        output_dir=state.get("frontend_output_dir", ""),
+        features=", ".join(features),
+    )
+    prompt = with_context_bundle(prompt, state, "frontend_wiring")
+
+    try:
+        tools = await get_filesystem_tools(state.get("main_output"), state.get("filesystem_backend"))
+
+        print("   🤖 Agente integrando features...")
+        _, stats = await run_agent("frontend_wiring", prompt, tools)
+        if stopped := stopped_update("Frontend Wiring", stats):
+            return stopped
+
+        summary = f"Frontend Wiring - Features integradas: {', '.join(features)}"
+        print(f"✅ {summary}")
+
+        return {"messages": [SystemMessage(content=summary)], "agent_stats": [stats]}
+
+    except Exception as e:
+        error_msg = f"Frontend Wiring - Error: {type(e).__name__}: {str(e)}"
+        print(f"❌ {error_msg}")
+        return {"messages": [SystemMessage(content=error_msg)]}
@@ -0,0 +1,75 @@
+"""
+Frontend Subgraph - Define el flujo de trabajo para construir el frontend.
+
+Flujo:
+1. frontend_setup → configuración, cliente HTTP, tipos y componentes compartidos
+2. frontend_planner → una unidad por recurso del contrato (auth, tasks, ...)
+3. frontend_feature (en paralelo) → api, hooks, store, páginas y componentes de cada feature
+4. frontend_wiring → rutas de App.tsx y navegación con todas las features
+"""
+
+import os
+from langchain_core.messages import SystemMessage
+from langgraph.graph import StateGraph, END
+from graph.state import GraphState
+from graph.units import route_units
+from graph.checkpoint import timed_node
+from .frontend_setup import frontend_setup_node_async
+from .frontend_feature import frontend_feature_node_async
+from .frontend_planner import frontend_planner_node
+from .frontend_wiring import frontend_wiring_node_async
+
+# Máximo de agentes frontend ejecutándose a la vez (max_concurrency del config)
+FRONTEND_MAX_CONCURRENCY = int(os.getenv("FRONTEND_MAX_CONCURRENCY", "4"))
+
+
+async def frontend_unit_node_async(state: GraphState):
+    """Ejecuta una feature del plan y la marca como completada (aunque falle)."""
+    unit = state["unit"]
+    try:
+        update = await frontend_feature_node_async(state)
+    except Exception as e:
+        update = {"messages": [SystemMessage(content=f"{unit['id']} - Error: {type(e).__name__}: {e}")]}
+    return {**update, "completed_units": [unit["id"]]}
+
+
+def frontend_scheduler_node(state: GraphState):
+    """Punto de sincronización entre oleadas de features."""
+    return {}
+
+
+def route_frontend_units(state: GraphState):
+    return route_units(state, "frontend_unit", "frontend_wiring")
+
+
+def create_frontend_subgraph(checkpointer=None):
+    """
+    Crea el subgrafo para desarrollo frontend.
+
+    Invocar con {"max_concurrency": FRONTEND_MAX_CONCURRENCY} en el config
+    para limitar los agentes simultáneos.
+
+    Returns:
+        Compiled subgraph
+    """
+
+    subgraph = StateGraph(GraphState)
+
+    subgraph.add_node("frontend_setup", timed_node("frontend_setup", frontend_setup_node_async))
+    subgraph.add_node("frontend_planner", timed_node("frontend_planner", frontend_planner_node))
+    subgraph.add_node("frontend_scheduler", frontend_scheduler_node)
+    subgraph.add_node("frontend_unit", timed_node("frontend_unit", frontend_unit_node_async))
+    subgraph.add_node("frontend_wiring", timed_node("frontend_wiring", frontend_wiring_node_async))
+
+    # Definir flujo: setup → planner → features en paralelo → wiring
+    subgraph.set_entry_point("frontend_setup")
+
+    subgraph.add_edge("frontend_setup", "frontend_planner")
+    subgraph.add_edge("frontend_planner", "frontend_scheduler")
+    subgraph.add_conditional_edges(
+        "frontend_scheduler", route_frontend_units, ["frontend_unit", "frontend_wiring"]
+    )
+    subgraph.add_edge("frontend_unit", "frontend_scheduler")
+    subgraph.add_edge("frontend_wiring", END)
+
+    return subgraph.compile(checkpointer=checkpointer)
@@ -9,11 +9,12 @@ Este nodo:
 """
 
 from pathlib import Path
-from langchain_mcp_adapters.client import MultiServerMCPClient
-from langgraph.prebuilt import create_react_agent
 from langchain_core.messages import SystemMessage, HumanMessage
 from dotenv import load_dotenv
 from graph.state import GraphState
+from graph.tools import get_filesystem_tools
+from graph.agents import run_agent, stopped_update
+from graph.build_cache import StageCache, stage_config
 
 load_dotenv()
 
@@ -89,23 +90,6 @@ async def product_manager_node_async(state: GraphState):
 
     print(f"   📁 Directorio de salida: {output_dir_absolute}")
 
-    # Validar si ya existen archivos en el directorio
-    existing_files = list(output_dir.rglob("*.md"))
-    if existing_files:
-        warning_msg = (
-            f"Product Manager - El directorio ya contiene archivos:\n"
-            f"- Proyecto: {project_name}\n"
-            f"- Archivos existentes: {len(existing_files)}\n"
-            f"- Directorio: {output_dir_absolute}\n"
-            f"- User stories ya fueron generados previamente"
-        )
-        print(f"\n⚠️  {warning_msg}")
-
-        return {
-            "messages": [SystemMessage(content=warning_msg)],
-            "user_stories_dir": str(output_dir_absolute),
-        }
-
     prompt = QUERY.format(
         project_name=project_name,
         user_requirement=user_requirement,
@@ -114,25 +98,30 @@ async def product_manager_node_async(state: GraphState):
         output_dir_absolute=output_dir_absolute,
     )
 
-    client = MultiServerMCPClient(
-        {
-            "filesystem": {
-                "command": "npx",
-                "args": [
-                    "-y",
-                    "@modelcontextprotocol/server-filesystem",
-                    str(output_dir),
-                ],
-                "transport": "stdio",
-            }
+    # Reutilizar la salida previa si las entradas no cambiaron (ver graph/build_cache.py)
+    cache = StageCache(main_output, "product_manager")
+    input_hash = cache.input_hash(prompt, [], stage_config(state))
+    if cache.is_fresh(input_hash):
+        skip_msg = (
+            f"Product Manager - Salida reutilizada ({cache.reason}):\n"
+            f"- Proyecto: {project_name}\n"
+            f"- Directorio: {output_dir_absolute}"
+        )
+        print(f"\n♻️  {skip_msg}")
+        return {
+            "messages": [SystemMessage(content=skip_msg)],
+            "user_stories_dir": str(output_dir_absolute),
         }
-    )
+
+    print(f"   🔁 Ejecutando Product Manager: {cache.reason}")
+    cache.clean_outputs()
 
     try:
-        tools = await client.get_tools()
-        agent = create_react_agent("openai:gpt-4.1", tools)
+        tools = await get_filesystem_tools(main_output, state.get("filesystem_backend"))
 
-        await agent.ainvoke({"messages": prompt}, {"recursion_limit": 100})
+        _, stats = await run_agent("product_manager", prompt, tools)
+        if stopped := stopped_update("Product Manager", stats):
+            return stopped
 
         print("👔 Product Manager - Proceso completado.")
 
@@ -157,10 +146,12 @@ async def product_manager_node_async(state: GraphState):
         )
 
         print(f"\n✅ {summary}")
+        cache.record(input_hash, [output_dir_absolute])
 
         return {
             "messages": [SystemMessage(content=summary)],
             "user_stories_dir": str(output_dir_absolute),
+            "agent_stats": [stats],
         }
 
     except Exception as e:
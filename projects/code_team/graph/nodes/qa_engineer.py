@@ -1,302 +1,114 @@
 """
-QA Engineer - Nodo que crea tests unitarios para el proyecto.
+QA Engineer - Nodo orquestador que invoca el subgrafo QA.
 
 Este nodo:
-1. Analiza el código backend y frontend
-2. Crea tests unitarios comprehensivos
-3. Configura pytest para backend
-4. Configura Jest/Vitest para frontend
-5. Calcula cobertura esperada
+1. Espera a que Backend y Frontend terminen (se ejecuta en paralelo con Contract Check)
+2. Invoca el subgrafo QA, que configura Vitest/MSW y las fixtures de pytest y
+   luego escribe en paralelo un archivo de test por (tipo, recurso del contrato)
+   y vuelve a correr los tests del backend, ahora con los contract tests
+3. Deja el resumen de la suite en {main_output}/qa/qa_report.md
 """
 
-import asyncio
-import json
-import os
 from pathlib import Path
-from typing import List
+from langchain_core.messages import SystemMessage
+from langchain_core.runnables import RunnableConfig
+from dotenv import load_dotenv
+from graph.state import GraphState
+from graph.build_cache import StageCache, CACHE_DIR, stage_config, hash_sources
+from graph.checkpoint import SubgraphRun
+from .qa_subgraph import create_qa_subgraph, QA_MAX_CONCURRENCY
 
-from claude_agent_sdk import ClaudeSDKClient, ClaudeAgentOptions
+load_dotenv()
 
-from src.state import DevelopmentState, TestFile
 
-
-QA_ENGINEER_PROMPT = """Eres un QA Engineer senior especializado en automated testing.
-
-Expertise:
-- Backend testing: pytest, pytest-asyncio, pytest-cov, factories
-- Frontend testing: Jest, Vitest, React Testing Library
-- Test patterns: AAA (Arrange-Act-Assert), mocking, fixtures
-- Coverage: análisis de code coverage, edge cases
-- Best practices: tests legibles, mantenibles, rápidos
-
-Para Backend (Python/FastAPI):
-- pytest para unit tests
-- pytest-asyncio para async tests
-- factories para test data
-- mocking con unittest.mock
-- fixtures para setup/teardown
-- Test endpoints, CRUD, validaciones, edge cases
-
-Para Frontend (React/TypeScript):
-- Vitest o Jest para unit tests
-- React Testing Library para component tests
-- Mock Service Worker (MSW) para API mocking
-- Test componentes, hooks, state, user interactions
-
-Estructura de tests:
-```
-Backend tests:
-backend/tests/
-├── conftest.py          # Pytest fixtures
-├── test_models.py
-├── test_crud.py
-├── test_routers.py
-└── test_integration.py
-
-Frontend tests:
-frontend/src/
-├── components/
-│   └── Component.test.tsx
-├── features/
-│   └── feature.test.ts
-└── __tests__/
-    └── integration.test.tsx
-```
-
-Principios:
-- Tests deben ser independientes
-- Usar descriptive test names
-- Test happy path y edge cases
-- Mock dependencies externas
-- Fast execution
-- High coverage (>80% target)
-"""
-
-
-def load_mcp_config():
-    """Carga configuración de MCPs"""
-    return {
-        "filesystem": {
-            "type": "stdio",
-            "command": "npx",
-            "args": ["-y", "@modelcontextprotocol/server-filesystem", "/workspace"]
-        }
-    }
-
-
-async def qa_engineer_node_async(state: DevelopmentState) -> DevelopmentState:
+async def qa_engineer_node_async(state: GraphState, config: RunnableConfig):
     """
-    Nodo del QA Engineer - Crea tests unitarios.
-    """
-    
-    print("\n🧪 QA Engineer - Creando tests...")
-    
-    workspace = Path(state['workspace_path'])
-    project_dir = workspace / state['project_name']
-    
-    # Preparar contexto
-    backend_files_summary = "\n".join([
-        f"- {f['path']}" for f in state.get('backend_files', [])[:10]
-    ])
-    
-    frontend_files_summary = "\n".join([
-        f"- {f['path']}" for f in state.get('frontend_files', [])[:10]
-    ])
-    
-    context = f"""
-Proyecto: {state['project_name']}
-Workspace: {project_dir}
+    Nodo del QA Engineer - Orquesta la generación de la suite de tests.
 
-Backend files:
-{backend_files_summary}
-{f"... y {len(state.get('backend_files', [])) - 10} más" if len(state.get('backend_files', [])) > 10 else ""}
+    Con checkpointer activo el subgrafo usa el thread "<run_id>:qa".
 
-Frontend files:
-{frontend_files_summary}
-{f"... y {len(state.get('frontend_files', [])) - 10} más" if len(state.get('frontend_files', [])) > 10 else ""}
-
-User Stories implementadas:
-{json.dumps(state['user_stories'], indent=2)}
-"""
-    
-    # Configurar Claude Agent con filesystem MCP
-    mcp_servers = load_mcp_config()
-    mcp_servers["filesystem"]["args"][-1] = str(workspace)
-    
-    options = ClaudeAgentOptions(
-        mcp_servers=mcp_servers,
-        system_prompt=QA_ENGINEER_PROMPT,
-        allowed_tools=["mcp__filesystem__*"],
-        model=os.getenv("CLAUDE_MODEL", "claude-sonnet-4-5-20250929"),
-        max_tokens=8000,
-    )
-    
-    query = f"""{context}
-
-Por favor, crea una suite completa de tests para este proyecto.
-
-Tareas:
-
-**Backend Tests (pytest):**
-1. Crear estructura de tests en backend/tests/
-2. conftest.py con fixtures:
-   - Database fixtures (in-memory SQLite para tests)
-   - Client fixture (TestClient de FastAPI)
-   - Sample data factories
-3. Tests para:
-   - Modelos SQLAlchemy (test_models.py)
-   - Operaciones CRUD (test_crud.py)
-   - Endpoints API (test_routers.py)
-   - Validaciones y edge cases
-4. pytest.ini para configuración
-
-**Frontend Tests (Vitest):**
-1. Configurar Vitest en vitest.config.ts
-2. Setup file para React Testing Library
-3. Tests para:
-   - Componentes React (*.test.tsx)
-   - Redux slices (*.test.ts)
-   - Custom hooks
-   - API integration (mocked)
-4. MSW para mock API calls
-
-**Configuración:**
-- Backend: requirements-dev.txt con pytest, pytest-asyncio, pytest-cov, faker
-- Frontend: package.json con vitest, @testing-library/react, @testing-library/jest-dom
-
-**Coverage target: 80%+**
+    Retorna:
+        dict: Update al state con messages
+    """
 
-Tests deben:
-- Ser completos y robustos
-- Usar AAA pattern (Arrange-Act-Assert)
-- Tener nombres descriptivos
-- Cubrir happy path y edge cases
-- Ser rápidos de ejecutar
-- Ser mantenibles
+    print("\n🧪 QA Engineer - Creando tests...")
 
-Usa el filesystem MCP para crear todos los archivos de tests.
+    backend_output_dir = state.get("backend_output_dir")
+    frontend_output_dir = state.get("frontend_output_dir")
+    main_output = state.get("main_output")
+
+    if not backend_output_dir or not frontend_output_dir:
+        error_msg = "QA Engineer - Error: falta backend_output_dir o frontend_output_dir. Ejecuta Backend y Frontend primero."
+        print(f"❌ {error_msg}")
+        return {"messages": [SystemMessage(content=error_msg)]}
+
+    # Los tests se escriben dentro de backend y frontend: como entradas se usan
+    # los manifests de esas etapas (cambian solo cuando se regeneran), no sus directorios
+    cache = StageCache(main_output, "qa_engineer")
+    cache_dir = Path(main_output) / CACHE_DIR
+    upstream = [
+        state.get("api_contract_path"),
+        cache_dir / "backend_developer.json",
+        cache_dir / "frontend_developer.json",
+    ]
+    subgraph_sources = hash_sources(Path(__file__).parent / "qa_subgraph")
+    input_hash = cache.input_hash(subgraph_sources, upstream, stage_config(state))
+    if cache.is_fresh(input_hash):
+        skip_msg = f"QA Engineer - Tests reutilizados ({cache.reason})"
+        print(f"♻️  {skip_msg}")
+        return {"messages": [SystemMessage(content=skip_msg)]}
+
+    # Salidas del QA dentro de backend y frontend (solo estas se registran)
+    test_outputs = [
+        Path(frontend_output_dir) / "src/__tests__",
+        Path(frontend_output_dir) / "src/test",
+        Path(frontend_output_dir) / "vitest.config.ts",
+        Path(backend_output_dir) / "app/tests/contract",
+        Path(main_output) / "qa",
+    ]
+    subgraph_run = SubgraphRun(create_qa_subgraph, config, "qa", QA_MAX_CONCURRENCY)
+    pending = await subgraph_run.load()
+    if pending:
+        print(f"   ⏯️  Retomando subgrafo QA desde: {', '.join(pending)}")
+    else:
+        print(f"   🔁 Ejecutando QA Engineer: {cache.reason}")
+        cache.clean_outputs()
+
+    subgraph_state = {
+        **state,
+        "agent_stats": [],
+        "completed_units": [],
+        "node_durations": {},
+    }
 
-Al final, responde con un JSON:
-{{
-  "test_files_created": ["backend/tests/test_models.py", ...],
-  "backend_tests_count": 0,
-  "frontend_tests_count": 0,
-  "estimated_coverage": 0.85,
-  "summary": "Resumen de la test suite"
-}}
+    print(f"\n   🏗️  Ejecutando subgrafo QA (hasta {QA_MAX_CONCURRENCY} agentes en paralelo)...")
 
-¡Adelante! Crea una test suite comprehensiva.
-"""
-    
     try:
-        async with ClaudeSDKClient(options=options) as client:
-            print("   🤖 Escribiendo tests unitarios...")
-            print("   ⏳ Esto puede tomar varios minutos...")
-            
-            await client.query(query)
-            
-            full_response = ""
-            async for message in client.receive_response():
-                if hasattr(message, 'text'):
-                    text = message.text
-                    full_response += text
-                    # Mostrar progreso
-                    if "test" in text.lower() or "Creating" in text:
-                        preview = text[:60].replace('\n', ' ')
-                        print(f"      {preview}...", end='\r')
-                else:
-                    full_response += str(message)
-            
-            print("\n   ✅ Tests creados")
-            
-            # Parsear respuesta
-            test_files_created = []
-            backend_tests = 0
-            frontend_tests = 0
-            coverage = 0.0
-            
-            try:
-                start = full_response.find('{')
-                end = full_response.rfind('}') + 1
-                
-                if start != -1 and end > start:
-                    json_str = full_response[start:end]
-                    data = json.loads(json_str)
-                    
-                    test_files_created = data.get('test_files_created', [])
-                    backend_tests = data.get('backend_tests_count', 0)
-                    frontend_tests = data.get('frontend_tests_count', 0)
-                    coverage = data.get('estimated_coverage', 0.0)
-                    summary = data.get('summary', '')
-                    
-                    print(f"\n   📄 Archivos de test: {len(test_files_created)}")
-                    print(f"   🔧 Backend tests: {backend_tests}")
-                    print(f"   🎨 Frontend tests: {frontend_tests}")
-                    print(f"   📊 Coverage estimado: {coverage*100:.1f}%")
-                    
-                    # Mostrar algunos archivos de test
-                    if test_files_created:
-                        print("\n   Archivos de test creados:")
-                        for test_file in test_files_created[:5]:
-                            print(f"      ✓ {test_file}")
-                    
-                    if len(test_files_created) > 5:
-                        print(f"      ... y {len(test_files_created) - 5} más")
-                    
-                    print(f"\n   📝 {summary[:150]}...")
-                    
-            except json.JSONDecodeError:
-                # Si no hay JSON válido, estimar
-                if "test_" in full_response:
-                    test_files_created = ["backend/tests/test_models.py", "frontend/src/components/Component.test.tsx"]
-                    coverage = 0.75
-            
-            # Crear lista de TestFile
-            test_files: List[TestFile] = []
-            for test_path in test_files_created:
-                test_type = "unit"
-                if "integration" in test_path:
-                    test_type = "integration"
-                elif "e2e" in test_path:
-                    test_type = "e2e"
-                
-                test_files.append(TestFile(
-                    path=test_path,
-                    content="[Generated by Claude Agent]",
-                    test_type=test_type,
-                    coverage_target=coverage
-                ))
-            
-            # Detectar bugs potenciales (análisis simple)
-            bugs_found = []
-            if coverage < 0.7:
-                bugs_found.append("Coverage menor al 70% - revisar tests faltantes")
-            
-            if backend_tests == 0 and len(state.get('backend_files', [])) > 0:
-                bugs_found.append("No hay tests para el backend")
-            
-            if frontend_tests == 0 and len(state.get('frontend_files', [])) > 0:
-                bugs_found.append("No hay tests para el frontend")
-            
-            return {
-                **state,
-                'test_files': test_files,
-                'test_coverage': coverage,
-                'qa_completed': True,
-                'bugs_found': bugs_found,
-                'updated_at': str(asyncio.get_event_loop().time())
-            }
-            
-    except Exception as e:
-        print(f"   ❌ Error en QA Engineer: {e}")
-        
+        subgraph_result = await subgraph_run.invoke(subgraph_state)
+
+        summary = (
+            f"QA Engineer - Suite de tests generada:\n"
+            f"- Unidades de test: {len(subgraph_result.get('completed_units', []))}\n"
+            f"- Reporte: {Path(main_output) / 'qa' / 'qa_report.md'}"
+        )
+        verification = subgraph_result.get("backend_verification")
+        if verification:
+            summary += f"\n- Tests del backend con contract tests: {'OK' if verification['ok'] else 'con fallos'}"
+        stopped = [stats["stage"] for stats in subgraph_result.get("agent_stats", []) if stats.get("stopped")]
+        if stopped:
+            summary += f"\n- Agentes detenidos por presupuesto: {', '.join(stopped)}"
+        print(f"\n✅ {summary}")
+        # Con agentes detenidos la suite quedó a medias: se regenera en la próxima ejecución
+        if not stopped:
+            cache.record(input_hash, [path for path in test_outputs if path.exists()])
+
         return {
-            **state,
-            'qa_completed': False,
-            'errors': state['errors'] + [f"QA Engineer failed: {e}"]
+            "messages": [SystemMessage(content=summary)],
+            "agent_stats": subgraph_result.get("agent_stats", []),
+            "node_durations": subgraph_result.get("node_durations", {}),
         }
 
-
-def qa_engineer_node(state: DevelopmentState) -> DevelopmentState:
-    """Wrapper sincrónico"""
-    return asyncio.run(qa_engineer_node_async(state))
\ No newline at end of file
+    except Exception as e:
+        error_msg = f"QA Engineer - Error: {type(e).__name__}: {str(e)}"
+        print(f"\n❌ {error_msg}")
+        return {"messages": [SystemMessage(content=error_msg)]}
@@ -0,0 +1,20 @@
+"""
+QA Subgraph - Nodos especializados para generar la suite de tests en paralelo.
+"""
+
+from .qa_setup import qa_setup_node_async
+from .qa_planner import qa_planner_node
+from .qa_tests import qa_test_node_async
+from .qa_verify import qa_verify_node_async
+from .qa_report import qa_report_node
+from .subgraph import create_qa_subgraph, QA_MAX_CONCURRENCY
+
+__all__ = [
+    "qa_setup_node_async",
+    "qa_planner_node",
+    "qa_test_node_async",
+    "qa_verify_node_async",
+    "qa_report_node",
+    "create_qa_subgraph",
+    "QA_MAX_CONCURRENCY",
+]
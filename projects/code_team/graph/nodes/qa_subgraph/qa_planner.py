@@ -0,0 +1,29 @@
+"""
+QA Planner - Divide la suite de tests en unidades independientes.
+
+Por cada recurso del contrato (ver frontend_planner.plan_resources) genera
+qa_frontend:<recurso> y qa_contract:<recurso>, que solo dependen de qa_setup y
+se escriben en paralelo.
+"""
+
+from langchain_core.messages import SystemMessage
+from graph.state import GraphState
+from graph.nodes.frontend_subgraph.frontend_planner import plan_resources, build_feature_units
+
+QA_STAGES = ["qa_frontend", "qa_contract"]
+
+
+def qa_planner_node(state: GraphState):
+    """
+    Nodo QA Planner - Genera las unidades del subgrafo QA.
+    """
+
+    print("\n🗺️  QA Planner - Dividiendo la suite de tests...")
+
+    resources = plan_resources(state)
+    units = [unit for stage in QA_STAGES for unit in build_feature_units(resources, stage, ["qa_setup"])]
+
+    summary = f"QA Planner - {len(units)} archivos de test en paralelo ({', '.join(resources) or 'sin recursos'})"
+    print(f"✅ {summary}")
+
+    return {"messages": [SystemMessage(content=summary)], "units": units}
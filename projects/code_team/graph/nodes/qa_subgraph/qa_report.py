@@ -0,0 +1,47 @@
+"""
+QA Report Node - Resume la suite de tests generada (sin LLM).
+
+Escribe {main_output}/qa/qa_report.md con los archivos de test creados por
+unidad y el resultado de la verificación del backend con los contract tests
+(qa_verify).
+"""
+
+from pathlib import Path
+from langchain_core.messages import SystemMessage
+from graph.state import GraphState
+from graph.verify import format_verification
+from .qa_tests import QA_TARGETS
+
+
+def qa_report_node(state: GraphState):
+    """
+    Nodo QA Report - Lista los tests generados y los archivos faltantes.
+    """
+
+    print("\n📋 QA Report - Resumiendo la suite de tests...")
+
+    created, missing = [], []
+    for unit in state.get("units", []):
+        output_key, target = QA_TARGETS[unit["stage"]]
+        path = Path(state.get(output_key, "")) / target.format(resource=unit.get("entity") or "app")
+        (created if path.is_file() else missing).append(f"{unit['id']}: {path}")
+
+    lines = ["# QA Report", "", f"## Archivos de test ({len(created)})", ""]
+    lines += [f"- {item}" for item in created] or ["- (ninguno)"]
+    if missing:
+        lines += ["", f"## Unidades sin archivo de test ({len(missing)})", ""]
+        lines += [f"- {item}" for item in missing]
+    verification = state.get("backend_verification")
+    if verification:
+        lines += ["", "## Verificación del backend (con contract tests)", "", "```", format_verification(verification), "```"]
+
+    report_file = Path(state.get("main_output", "output")) / "qa" / "qa_report.md"
+    report_file.parent.mkdir(parents=True, exist_ok=True)
+    report_file.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+    summary = (
+        f"QA Report - {len(created)} archivos de test generados, {len(missing)} unidades sin archivo\n"
+        f"- Reporte: {report_file}"
+    )
+    print(f"{'✅' if not missing else '⚠️ '} {summary}")
+    return {"messages": [SystemMessage(content=summary)]}
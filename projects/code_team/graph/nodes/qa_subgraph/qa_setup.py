@@ -0,0 +1,78 @@
+"""
+QA Setup Node - Configura la infraestructura de tests que comparten las unidades de QA.
+
+Crea:
+- Frontend: vitest.config.ts, src/test/setup.ts, mocks de la API con MSW
+  (src/test/handlers.ts, src/test/server.ts) a partir del contrato
+- Backend: app/tests/contract/conftest.py con el cliente y un usuario autenticado
+"""
+
+from langchain_core.messages import SystemMessage
+from dotenv import load_dotenv
+from graph.state import GraphState
+from graph.tools import get_filesystem_tools
+from graph.agents import run_agent, stopped_update
+from graph.context import with_context_bundle
+from graph.contract import with_api_contract
+
+load_dotenv()
+
+
+QA_SETUP_PROMPT = """Eres un QA Engineer senior especializado en automated testing.
+
+Proyecto: {project_name}
+
+UBICACIÓN:
+- Frontend: {frontend_dir}/
+- Backend: {backend_dir}/ (ya tiene app/tests/conftest.py con fixtures de pytest)
+
+TAREA: Configurar la infraestructura de tests que usarán otros agentes en paralelo
+
+Frontend (Vitest + React Testing Library + MSW):
+- vitest.config.ts (environment jsdom, setupFiles)
+- src/test/setup.ts (@testing-library/jest-dom, server MSW)
+- src/test/handlers.ts: un handler MSW por operación del contrato, con datos de ejemplo válidos
+- src/test/server.ts y src/test/utils.tsx (render con router y store)
+- devDependencies en package.json: vitest, jsdom, @testing-library/react,
+  @testing-library/jest-dom, @testing-library/user-event, msw
+
+Backend (pytest):
+- app/tests/contract/__init__.py y app/tests/contract/conftest.py: reutiliza las fixtures
+  de app/tests/conftest.py y agrega auth_headers para un usuario registrado
+
+NO escribas tests todavía. NO uses placeholders.
+"""
+
+
+async def qa_setup_node_async(state: GraphState):
+    """
+    Nodo QA Setup - Configura Vitest, MSW y las fixtures de contract tests.
+    """
+
+    print("\n🧪 QA Setup - Configurando infraestructura de tests...")
+
+    prompt = QA_SETUP_PROMPT.format(
+        project_name=state.get("project_name", "test_project"),
+        frontend_dir=state.get("frontend_output_dir", ""),
+        backend_dir=state.get("backend_output_dir", ""),
+    )
+    prompt = with_context_bundle(prompt, state, "qa_setup")
+    prompt = with_api_contract(prompt, state, "backend y el frontend")
+
+    try:
+        tools = await get_filesystem_tools(state.get("main_output"), state.get("filesystem_backend"))
+
+        print("   🤖 Agente configurando tests...")
+        _, stats = await run_agent("qa_setup", prompt, tools)
+        if stopped := stopped_update("QA Setup", stats):
+            return stopped
+
+        summary = "QA Setup - Vitest, MSW y fixtures de contract tests configurados"
+        print(f"✅ {summary}")
+
+        return {"messages": [SystemMessage(content=summary)], "agent_stats": [stats]}
+
+    except Exception as e:
+        error_msg = f"QA Setup - Error: {type(e).__name__}: {str(e)}"
+        print(f"❌ {error_msg}")
+        return {"messages": [SystemMessage(content=error_msg)]}
@@ -0,0 +1,101 @@
+"""
+QA Tests Nodes - Escriben los archivos de test de una unidad de QA.
+
+Dos tipos de unidad por recurso del contrato, independientes entre sí:
+- qa_frontend:<recurso> → tests de componentes, hooks y páginas con Vitest + MSW
+- qa_contract:<recurso> → tests pytest que verifican que el backend cumple el contrato
+
+Cada unidad escribe un solo archivo, así se generan todas en paralelo.
+"""
+
+from langchain_core.messages import SystemMessage
+from dotenv import load_dotenv
+from graph.state import GraphState
+from graph.tools import get_filesystem_tools
+from graph.agents import run_agent, stopped_update
+from graph.context import with_context_bundle
+from graph.contract import with_api_contract
+
+load_dotenv()
+
+# Archivo que escribe cada etapa (relativo a su directorio de salida)
+QA_TARGETS = {
+    "qa_frontend": ("frontend_output_dir", "src/__tests__/{resource}.test.tsx"),
+    "qa_contract": ("backend_output_dir", "app/tests/contract/test_{resource}_contract.py"),
+}
+
+QA_FRONTEND_PROMPT = """Eres un QA Engineer senior especializado en testing de React.
+
+Proyecto: {project_name}
+
+UBICACIÓN:
+- Frontend: {output_dir}/ (infraestructura en src/test/: setup, handlers MSW, utils)
+- Escribe: {output_dir}/{target}
+
+TAREA: Tests de {scope} con Vitest + React Testing Library
+
+- Páginas: render, loading, listado, estados vacío y de error (sobrescribe handlers MSW)
+- Formularios: validación, submit exitoso y error del servidor
+- Hooks y store de la feature
+- Patrón AAA, nombres descriptivos, sin dependencias entre tests
+
+Lee los archivos de la feature con read_file antes de escribir. NO uses placeholders.
+"""
+
+QA_CONTRACT_PROMPT = """Eres un QA Engineer senior especializado en testing de APIs.
+
+Proyecto: {project_name}
+
+UBICACIÓN:
+- Backend: {output_dir}/ (fixtures en app/tests/conftest.py y app/tests/contract/conftest.py)
+- Escribe: {output_dir}/{target}
+
+TAREA: Contract tests de {scope} con pytest
+
+Para cada operación del contrato del recurso:
+- status code documentado en el caso exitoso
+- la respuesta tiene exactamente los campos y tipos del schema del contrato
+- 401 sin token en endpoints protegidos, 404 para ids inexistentes, 422 con body inválido
+
+Los tests corren contra SQLite. NO uses placeholders.
+"""
+
+PROMPTS = {"qa_frontend": QA_FRONTEND_PROMPT, "qa_contract": QA_CONTRACT_PROMPT}
+
+
+async def qa_test_node_async(state: GraphState):
+    """
+    Nodo QA Tests - Escribe los tests de la unidad en curso (qa_frontend o qa_contract).
+    """
+
+    unit = state["unit"]
+    stage = unit["stage"]
+    resource = unit.get("entity")
+    output_key, target = QA_TARGETS[stage]
+    target = target.format(resource=resource or "app")
+    scope = f"la feature '{resource}'" if resource else "todas las features"
+    print(f"\n🧪 {unit['id']} - Escribiendo {target}...")
+
+    prompt = PROMPTS[stage].format(
+        project_name=state.get("project_name", "test_project"),
+        output_dir=state.get(output_key, ""),
+        target=target,
+        scope=scope,
+    )
+    prompt = with_context_bundle(prompt, state, stage)
+    prompt = with_api_contract(prompt, state, "backend y el frontend")
+
+    try:
+        tools = await get_filesystem_tools(state.get("main_output"), state.get("filesystem_backend"))
+        _, stats = await run_agent(unit["id"], prompt, tools)
+        if stopped := stopped_update("QA Tests", stats):
+            return stopped
+
+        summary = f"QA Tests - {unit['id']}: {target}"
+        print(f"✅ {summary}")
+        return {"messages": [SystemMessage(content=summary)], "agent_stats": [stats]}
+
+    except Exception as e:
+        error_msg = f"QA Tests - Error en {unit['id']}: {type(e).__name__}: {str(e)}"
+        print(f"❌ {error_msg}")
+        return {"messages": [SystemMessage(content=error_msg)]}
@@ -0,0 +1,36 @@
+"""
+QA Verify Node - Corre la verificación del backend con los contract tests de QA.
+
+backend_verify se ejecuta dentro del subgrafo backend, antes de que QA escriba
+app/tests/contract/, así que sin este paso los contract tests nunca se
+ejecutaban. Aquí se repite compile → import → pytest (graph/verify.py) con la
+suite completa; los fallos se informan en el reporte de QA, no se reparan.
+"""
+
+from langchain_core.messages import SystemMessage
+from graph.state import GraphState
+from graph.verify import verify_backend, failures_by_target, format_verification
+
+
+async def qa_verify_node_async(state: GraphState):
+    """
+    Nodo QA Verify - Ejecuta los tests del backend, incluidos los contract tests.
+    """
+
+    print("\n🔍 QA Verify - Ejecutando los tests del backend con los contract tests...")
+
+    report = await verify_backend(state.get("backend_output_dir", ""))
+    print(format_verification(report))
+
+    if report["ok"]:
+        summary = "QA Verify - compile, import y tests (con contract tests) OK"
+    else:
+        failed_step = next(step for step, result in report["steps"].items() if not result["ok"])
+        targets = failures_by_target(report["failures"])
+        summary = (
+            f"QA Verify - Error en {failed_step}: {len(report['failures'])} fallo(s) "
+            f"en {len(targets)} archivo(s): {', '.join(list(targets)[:5])}"
+        )
+    print(f"{'✅' if report['ok'] else '⚠️ '} {summary}")
+
+    return {"messages": [SystemMessage(content=summary)], "backend_verification": report}
@@ -0,0 +1,77 @@
+"""
+QA Subgraph - Define el flujo de trabajo para generar la suite de tests.
+
+Flujo:
+1. qa_setup → Vitest, MSW y fixtures de contract tests
+2. qa_planner → qa_frontend:<recurso> y qa_contract:<recurso> por recurso del contrato
+3. qa_unit (en paralelo) → un archivo de test por unidad
+4. qa_verify → corre los tests del backend, ahora con los contract tests
+5. qa_report → resumen en {main_output}/qa/qa_report.md
+"""
+
+import os
+from langchain_core.messages import SystemMessage
+from langgraph.graph import StateGraph, END
+from graph.state import GraphState
+from graph.units import route_units
+from graph.checkpoint import timed_node
+from .qa_setup import qa_setup_node_async
+from .qa_planner import qa_planner_node
+from .qa_tests import qa_test_node_async
+from .qa_verify import qa_verify_node_async
+from .qa_report import qa_report_node
+
+# Máximo de agentes QA ejecutándose a la vez (max_concurrency del config)
+QA_MAX_CONCURRENCY = int(os.getenv("QA_MAX_CONCURRENCY", "4"))
+
+
+async def qa_unit_node_async(state: GraphState):
+    """Escribe los tests de una unidad y la marca como completada (aunque falle)."""
+    unit = state["unit"]
+    try:
+        update = await qa_test_node_async(state)
+    except Exception as e:
+        update = {"messages": [SystemMessage(content=f"{unit['id']} - Error: {type(e).__name__}: {e}")]}
+    return {**update, "completed_units": [unit["id"]]}
+
+
+def qa_scheduler_node(state: GraphState):
+    """Punto de sincronización entre oleadas de unidades de QA."""
+    return {}
+
+
+def route_qa_units(state: GraphState):
+    return route_units(state, "qa_unit", "qa_verify")
+
+
+def create_qa_subgraph(checkpointer=None):
+    """
+    Crea el subgrafo de QA.
+
+    Invocar con {"max_concurrency": QA_MAX_CONCURRENCY} en el config para
+    limitar los agentes simultáneos.
+
+    Returns:
+        Compiled subgraph
+    """
+
+    subgraph = StateGraph(GraphState)
+
+    subgraph.add_node("qa_setup", timed_node("qa_setup", qa_setup_node_async))
+    subgraph.add_node("qa_planner", timed_node("qa_planner", qa_planner_node))
+    subgraph.add_node("qa_scheduler", qa_scheduler_node)
+    subgraph.add_node("qa_unit", timed_node("qa_unit", qa_unit_node_async))
+    subgraph.add_node("qa_verify", timed_node("qa_verify", qa_verify_node_async))
+    subgraph.add_node("qa_report", timed_node("qa_report", qa_report_node))
+
+    # Definir flujo: setup → planner → tests en paralelo → verify → report
+    subgraph.set_entry_point("qa_setup")
+
+    subgraph.add_edge("qa_setup", "qa_planner")
+    subgraph.add_edge("qa_planner", "qa_scheduler")
+    subgraph.add_conditional_edges("qa_scheduler", route_qa_units, ["qa_unit", "qa_verify"])
+    subgraph.add_edge("qa_unit", "qa_scheduler")
+    subgraph.add_edge("qa_verify", "qa_report")
+    subgraph.add_edge("qa_report", END)
+
+    return subgraph.compile(checkpointer=checkpointer)
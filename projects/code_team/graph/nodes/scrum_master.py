@@ -9,11 +9,12 @@ Este nodo:
 """
 
 from pathlib import Path
-from langchain_mcp_adapters.client import MultiServerMCPClient
-from langgraph.prebuilt import create_react_agent
 from langchain_core.messages import SystemMessage
 from dotenv import load_dotenv
 from graph.state import GraphState
+from graph.tools import get_filesystem_tools
+from graph.agents import run_agent, stopped_update
+from graph.build_cache import StageCache, stage_config
 
 load_dotenv()
 
@@ -88,23 +89,6 @@ async def scrum_master_node_async(state: GraphState):
     print(f"   📖 Leyendo user stories de: {input_dir_absolute}")
     print(f"   📁 Salida de planificación: {output_dir_absolute}")
 
-    # Validar si ya existen archivos en el directorio
-    existing_files = list(output_dir.rglob("*.md"))
-    if existing_files:
-        warning_msg = (
-            f"Scrum Master - El directorio ya contiene archivos:\n"
-            f"- Proyecto: {project_name}\n"
-            f"- Archivos existentes: {len(existing_files)}\n"
-            f"- Directorio: {output_dir_absolute}\n"
-            f"- Sprint planning ya fue generado previamente"
-        )
-        print(f"\n⚠️  {warning_msg}")
-
-        return {
-            "messages": [SystemMessage(content=warning_msg)],
-            "sprint_planning_dir": str(output_dir_absolute),
-        }
-
     # Crear prompt con variables
     prompt = SCRUM_MASTER_PROMPT.format(
         project_name=project_name,
@@ -114,31 +98,34 @@ async def scrum_master_node_async(state: GraphState):
         output_dir_absolute=output_dir_absolute,
     )
 
-    # Configurar MCP client con acceso a ambos directorios
-    # El agente necesita leer de input_dir y escribir en output_dir
-    client = MultiServerMCPClient(
-        {
-            "filesystem": {
-                "command": "npx",
-                "args": [
-                    "-y",
-                    "@modelcontextprotocol/server-filesystem",
-                    str(main_output),
-                ],
-                "transport": "stdio",
-            }
+    # Reutilizar la salida previa si las entradas no cambiaron (ver graph/build_cache.py)
+    cache = StageCache(main_output, "scrum_master")
+    input_hash = cache.input_hash(prompt, [input_dir_absolute], stage_config(state))
+    if cache.is_fresh(input_hash):
+        skip_msg = (
+            f"Scrum Master - Salida reutilizada ({cache.reason}):\n"
+            f"- Proyecto: {project_name}\n"
+            f"- Directorio: {output_dir_absolute}"
+        )
+        print(f"\n♻️  {skip_msg}")
+        return {
+            "messages": [SystemMessage(content=skip_msg)],
+            "sprint_planning_dir": str(output_dir_absolute),
         }
-    )
+
+    print(f"   🔁 Ejecutando Scrum Master: {cache.reason}")
+    cache.clean_outputs()
 
     try:
-        # Obtener tools y crear agente
-        tools = await client.get_tools()
-        agent = create_react_agent("openai:gpt-4.1", tools)
+        # Obtener tools
+        tools = await get_filesystem_tools(main_output, state.get("filesystem_backend"))
 
         print("   🤖 Agente Scrum Master ejecutando planificación...")
 
         # Invocar agente
-        await agent.ainvoke({"messages": prompt}, {"recursion_limit": 100})
+        _, stats = await run_agent("scrum_master", prompt, tools)
+        if stopped := stopped_update("Scrum Master", stats):
+            return stopped
 
         print("📋 Scrum Master - Proceso completado.")
 
@@ -164,10 +151,12 @@ async def scrum_master_node_async(state: GraphState):
         )
 
         print(f"\n✅ {summary}")
+        cache.record(input_hash, [output_dir_absolute])
 
         return {
             "messages": [SystemMessage(content=summary)],
             "sprint_planning_dir": str(output_dir_absolute),
+            "agent_stats": [stats],
         }
 
     except Exception as e:
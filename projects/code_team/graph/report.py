@@ -0,0 +1,67 @@
+"""
+Report - Reporte JSON por ejecución con tokens, costo y latencia por etapa.
+
+Combina las métricas de run_agent (agent_stats) con la duración de cada nodo
+(node_durations) y escribe {main_output}/reports/<run_id>.json. Las unidades
+del subgrafo backend ("backend_models:task") se agrupan también por etapa
+("backend_models") para ver qué etapa concentra el tiempo y los tokens.
+"""
+
+import json
+from collections import Counter
+from datetime import datetime
+from pathlib import Path
+
+REPORTS_DIR = "reports"
+
+METRICS = ("llm_turns", "tool_calls", "input_tokens", "output_tokens", "cost_usd", "seconds")
+
+
+def _sum_stats(stats_list: list[dict]) -> dict:
+    totals = {metric: sum(stats.get(metric, 0) for stats in stats_list) for metric in METRICS}
+    totals["cost_usd"] = round(totals["cost_usd"], 4)
+    totals["seconds"] = round(totals["seconds"], 2)
+    tool_names = Counter()
+    for stats in stats_list:
+        tool_names.update(stats.get("tool_calls_by_name", {}))
+    totals["tool_calls_by_name"] = dict(tool_names.most_common())
+    return totals
+
+
+def build_run_report(result: dict, run_id: str) -> dict:
+    """Arma el reporte de una ejecución a partir del estado final del grafo."""
+    agent_stats = result.get("agent_stats", [])
+
+    by_stage = {}
+    for stats in agent_stats:
+        by_stage.setdefault(stats["stage"].split(":")[0], []).append(stats)
+    stages = {
+        stage: {**_sum_stats(stats_list), "agent_runs": len(stats_list)}
+        for stage, stats_list in by_stage.items()
+    }
+
+    return {
+        "run_id": run_id,
+        "project_name": result.get("project_name"),
+        "generated_at": datetime.now().isoformat(timespec="seconds"),
+        "totals": _sum_stats(agent_stats),
+        # Etapas ordenadas de mayor a menor costo
+        "stages": dict(sorted(stages.items(), key=lambda item: -item[1]["cost_usd"])),
+        # Agentes cortados por presupuesto o loop (graph/budget.py)
+        "stopped_agents": [
+            {"stage": stats["stage"], "reason": stats["stopped"]} for stats in agent_stats if stats.get("stopped")
+        ],
+        "agent_runs": agent_stats,
+        "node_durations": result.get("node_durations", {}),
+    }
+
+
+def write_run_report(result: dict, run_id: str) -> Path:
+    """Escribe el reporte en {main_output}/reports/<run_id>.json y retorna su path."""
+    report = build_run_report(result, run_id)
+    path = Path(result["main_output"]) / REPORTS_DIR / f"{run_id}.json"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(".json.tmp")
+    tmp_path.write_text(json.dumps(report, indent=2, ensure_ascii=False), encoding="utf-8")
+    tmp_path.replace(path)
+    return path
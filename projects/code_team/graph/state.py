@@ -1,6 +1,8 @@
+import operator
 from langchain_core.messages import AnyMessage
 from typing_extensions import TypedDict, Annotated, NotRequired
 from langgraph.graph.message import add_messages
+from graph.checkpoint import merge_durations
 
 
 class GraphState(TypedDict):
@@ -20,3 +22,25 @@ class GraphState(TypedDict):
     backend_output_dir: NotRequired[str]
     frontend_output_dir: NotRequired[str]
     main_output: NotRequired[str]
+    # Contrato OpenAPI compartido por backend y frontend
+    api_contract_path: NotRequired[str]
+    # Operaciones que no coinciden con el contrato (backend faltante / frontend fuera del contrato)
+    contract_mismatches: NotRequired[list[str]]
+    # Backend de filesystem para los agentes: "mcp" (default) o "native"
+    filesystem_backend: NotRequired[str]
+    # Inyectar contexto precargado en los prompts del subgrafo backend
+    context_bundle: NotRequired[bool]
+    # Métricas por etapa (turnos LLM, tool calls, tiempo), acumuladas por los nodos
+    agent_stats: Annotated[list[dict], operator.add]
+    # Plan de unidades de un subgrafo (ver graph/units.py) y unidades terminadas
+    units: NotRequired[list[dict]]
+    completed_units: Annotated[list[str], operator.add]
+    # Unidad en curso (solo en el input de las ramas despachadas con Send)
+    unit: NotRequired[dict]
+    # Reporte de graph/verify.py del backend generado y rondas de reparación
+    backend_verification: NotRequired[dict]
+    repair_rounds: NotRequired[int]
+    # Archivo a reparar (solo en el input de las ramas backend_repair)
+    repair_target: NotRequired[dict]
+    # Duración (segundos) de cada nodo / unidad; se copia a la metadata de cada checkpoint
+    node_durations: Annotated[dict[str, float], merge_durations]
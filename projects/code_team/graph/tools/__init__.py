@@ -0,0 +1,24 @@
+"""
+Tools compartidas por los agentes del equipo (acceso al filesystem).
+"""
+
+from .mcp_session import (
+    MCPFilesystemSession,
+    get_mcp_filesystem_tools,
+    mcp_filesystem_session,
+    close_mcp_sessions,
+)
+from .native_fs import NativeFilesystem, get_native_filesystem_tools
+from .filesystem import FILESYSTEM_BACKEND, FILESYSTEM_BACKENDS, get_filesystem_tools
+
+__all__ = [
+    "MCPFilesystemSession",
+    "get_mcp_filesystem_tools",
+    "mcp_filesystem_session",
+    "close_mcp_sessions",
+    "NativeFilesystem",
+    "get_native_filesystem_tools",
+    "FILESYSTEM_BACKEND",
+    "FILESYSTEM_BACKENDS",
+    "get_filesystem_tools",
+]
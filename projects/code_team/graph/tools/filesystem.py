@@ -0,0 +1,37 @@
+"""
+Selección del backend de filesystem para los agentes.
+
+- "mcp": servidor @modelcontextprotocol/server-filesystem compartido (npx)
+- "native": tools en proceso (graph/tools/native_fs.py), sin subproceso ni IPC
+
+Se elige con la variable de entorno FILESYSTEM_BACKEND o con el campo
+`filesystem_backend` del estado del grafo (tiene prioridad).
+"""
+
+import os
+from dotenv import load_dotenv
+from .mcp_session import get_mcp_filesystem_tools
+from .native_fs import get_native_filesystem_tools
+
+load_dotenv()
+
+FILESYSTEM_BACKENDS = ("mcp", "native")
+FILESYSTEM_BACKEND = os.getenv("FILESYSTEM_BACKEND", "mcp").lower()
+
+
+async def get_filesystem_tools(root: str, backend: str | None = None) -> list:
+    """
+    Retorna las tools de filesystem confinadas a `root`.
+
+    Args:
+        root: Directorio raíz accesible por el agente (normalmente main_output)
+        backend: "mcp" o "native"; por defecto FILESYSTEM_BACKEND
+    """
+    backend = (backend or FILESYSTEM_BACKEND).lower()
+    if backend == "native":
+        return get_native_filesystem_tools(root)
+    if backend == "mcp":
+        return await get_mcp_filesystem_tools(root)
+    raise ValueError(
+        f"Backend de filesystem desconocido: {backend!r} (opciones: {', '.join(FILESYSTEM_BACKENDS)})"
+    )
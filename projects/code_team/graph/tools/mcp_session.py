@@ -0,0 +1,157 @@
+"""
+MCP Session - Servidor filesystem MCP compartido durante toda la ejecución.
+
+Antes cada nodo (Product Manager, Scrum Master y cada paso del subgrafo backend)
+creaba su propio MultiServerMCPClient, que lanzaba
+`npx -y @modelcontextprotocol/server-filesystem` en cada etapa: arranque de Node,
+resolución del paquete y handshake MCP repetidos.
+
+Este módulo arranca el servidor una sola vez por raíz (main_output), mantiene
+la sesión abierta y entrega las mismas tools a todos los nodos. Al final de la
+ejecución se cierra y se reporta el tiempo de arranque ahorrado.
+"""
+
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from pathlib import Path
+from langchain_mcp_adapters.client import MultiServerMCPClient
+from langchain_mcp_adapters.tools import load_mcp_tools
+
+
+class MCPFilesystemSession:
+    """
+    Sesión persistente con el servidor filesystem MCP.
+
+    La sesión vive en una tarea asyncio propia: el cliente stdio usa cancel
+    scopes de anyio que deben abrirse y cerrarse en la misma tarea, y los nodos
+    del grafo corren en tareas distintas.
+    """
+
+    def __init__(self, root: str):
+        self.root = Path(root).resolve()
+        self.tools = None
+        self.startup_seconds = 0.0
+        self.tool_requests = 0
+        self._task = None
+        self._ready = asyncio.Event()
+        self._closing = asyncio.Event()
+        self._lock = asyncio.Lock()
+
+    def covers(self, path: str) -> bool:
+        """Indica si `path` está dentro de la raíz servida por esta sesión."""
+        return Path(path).resolve().is_relative_to(self.root)
+
+    async def _run(self):
+        client = MultiServerMCPClient(
+            {
+                "filesystem": {
+                    "command": "npx",
+                    "args": [
+                        "-y",
+                        "@modelcontextprotocol/server-filesystem",
+                        str(self.root),
+                    ],
+                    "transport": "stdio",
+                }
+            }
+        )
+        async with client.session("filesystem") as session:
+            self.tools = await load_mcp_tools(session)
+            self._ready.set()
+            await self._closing.wait()
+
+    async def start(self):
+        """Lanza el servidor MCP (una sola vez) y espera a que las tools estén listas."""
+        start = time.perf_counter()
+        self._task = asyncio.create_task(self._run())
+        ready = asyncio.create_task(self._ready.wait())
+        done, _ = await asyncio.wait({ready, self._task}, return_when=asyncio.FIRST_COMPLETED)
+        if self._task in done:
+            ready.cancel()
+            # Propaga el error de arranque (npx no instalado, raíz inválida, etc.)
+            self._task.result()
+        self.startup_seconds = time.perf_counter() - start
+        print(f"   🔌 MCP filesystem iniciado en {self.startup_seconds:.1f}s (raíz: {self.root})")
+
+    async def get_tools(self) -> list:
+        """Retorna las tools MCP, arrancando el servidor en la primera llamada."""
+        async with self._lock:
+            if self.tools is None:
+                await self.start()
+            self.tool_requests += 1
+            return self.tools
+
+    async def close(self):
+        """Cierra la sesión y termina el proceso del servidor."""
+        if self._task is None:
+            return
+        self._closing.set()
+        try:
+            await self._task
+        except Exception as e:
+            # El error de arranque ya se propagó en start(); relanzarlo aquí ocultaría
+            # el error original (o haría fallar una ejecución que ya usó el fallback)
+            print(f"   ⚠️  MCP filesystem ({self.root}) terminó con error: {type(e).__name__}: {e}")
+        finally:
+            self._task = None
+
+    def report(self) -> str:
+        """Resumen del arranque compartido y del tiempo ahorrado."""
+        if self.tool_requests == 0:
+            return f"MCP filesystem ({self.root}): no se utilizó"
+        saved = self.startup_seconds * (self.tool_requests - 1)
+        return (
+            f"MCP filesystem ({self.root}): 1 arranque de {self.startup_seconds:.1f}s "
+            f"compartido por {self.tool_requests} nodos, ~{saved:.1f}s de arranque ahorrados"
+        )
+
+
+# Sesiones activas (una por raíz)
+_sessions: list[MCPFilesystemSession] = []
+
+
+async def get_mcp_filesystem_tools(root: str) -> list:
+    """
+    Retorna las tools filesystem MCP para `root`.
+
+    Reutiliza una sesión activa cuya raíz contenga `root`; si no hay ninguna,
+    arranca una nueva que queda abierta hasta close_mcp_sessions().
+    """
+    for session in _sessions:
+        if session.covers(root):
+            return await session.get_tools()
+
+    session = MCPFilesystemSession(root)
+    _sessions.append(session)
+    return await session.get_tools()
+
+
+async def close_mcp_sessions() -> list[str]:
+    """Cierra todas las sesiones activas y retorna sus reportes."""
+    reports = []
+    while _sessions:
+        session = _sessions.pop()
+        await session.close()
+        reports.append(session.report())
+    return reports
+
+
+@asynccontextmanager
+async def mcp_filesystem_session(root: str):
+    """
+    Context manager que mantiene un servidor MCP para toda una ejecución.
+
+    Uso:
+        async with mcp_filesystem_session(main_output) as mcp:
+            await graph.ainvoke(state)
+        print(mcp.report())
+    """
+    session = MCPFilesystemSession(root)
+    _sessions.append(session)
+    try:
+        yield session
+    finally:
+        if session in _sessions:
+            _sessions.remove(session)
+        await session.close()
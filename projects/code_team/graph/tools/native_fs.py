@@ -0,0 +1,143 @@
+"""
+Native FS - Tools de filesystem en proceso, alternativa al servidor MCP por npx.
+
+Con el servidor MCP cada lectura o escritura del agente viaja por JSON-RPC
+sobre stdio hasta un subproceso Node. Un backend generado puede implicar
+cientos de llamadas, y cada una paga serialización e IPC.
+
+Estas tools exponen los mismos nombres y argumentos que
+@modelcontextprotocol/server-filesystem (read_file, read_multiple_files,
+write_file, create_directory, list_directory, directory_tree, search_files,
+list_allowed_directories), así los prompts no cambian, pero se ejecutan
+directamente en Python y quedan restringidas a la raíz indicada (main_output).
+"""
+
+import fnmatch
+import json
+from pathlib import Path
+from langchain_core.tools import StructuredTool
+
+
+class NativeFilesystem:
+    """
+    Operaciones de filesystem confinadas a un directorio raíz.
+
+    Las rutas relativas se resuelven contra la raíz; cualquier ruta que salga
+    de ella (incluyendo symlinks) se rechaza, igual que en el servidor MCP.
+    """
+
+    def __init__(self, root: str):
+        self.root = Path(root).resolve()
+
+    def resolve(self, path: str) -> Path:
+        """Resuelve `path` dentro de la raíz o lanza ValueError si sale de ella."""
+        candidate = Path(path).expanduser()
+        if not candidate.is_absolute():
+            candidate = self.root / candidate
+        resolved = candidate.resolve()
+        if not resolved.is_relative_to(self.root):
+            raise ValueError(
+                f"Access denied - path outside allowed directories: {resolved} not in {self.root}"
+            )
+        return resolved
+
+    def read_file(self, path: str) -> str:
+        """Read the complete contents of a file as text."""
+        return self.resolve(path).read_text(encoding="utf-8")
+
+    def read_multiple_files(self, paths: list[str]) -> str:
+        """Read several files at once. Failed reads are reported per file."""
+        results = []
+        for path in paths:
+            try:
+                results.append(f"{path}:\n{self.read_file(path)}\n")
+            except Exception as e:
+                results.append(f"{path}: Error - {e}")
+        return "\n---\n".join(results)
+
+    def write_file(self, path: str, content: str) -> str:
+        """Create a new file or overwrite an existing one. Parent directories are created."""
+        target = self.resolve(path)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        target.write_text(content, encoding="utf-8")
+        return f"Successfully wrote to {path}"
+
+    def create_directory(self, path: str) -> str:
+        """Create a directory (and its parents). Succeeds silently if it already exists."""
+        self.resolve(path).mkdir(parents=True, exist_ok=True)
+        return f"Successfully created directory {path}"
+
+    def list_directory(self, path: str) -> str:
+        """List the entries of a directory, prefixed with [FILE] or [DIR]."""
+        entries = sorted(self.resolve(path).iterdir(), key=lambda entry: entry.name)
+        return "\n".join(
+            f"{'[DIR]' if entry.is_dir() else '[FILE]'} {entry.name}" for entry in entries
+        )
+
+    def _tree(self, directory: Path) -> list[dict]:
+        tree = []
+        for entry in sorted(directory.iterdir(), key=lambda entry: entry.name):
+            if entry.is_dir():
+                tree.append({"name": entry.name, "type": "directory", "children": self._tree(entry)})
+            else:
+                tree.append({"name": entry.name, "type": "file"})
+        return tree
+
+    def directory_tree(self, path: str) -> str:
+        """Recursive JSON tree of files and directories."""
+        return json.dumps(self._tree(self.resolve(path)), indent=2)
+
+    def search_files(self, path: str, pattern: str, excludePatterns: list[str] | None = None) -> str:
+        """
+        Recursively search for files and directories whose name contains `pattern`
+        (case-insensitive). Paths matching any glob in excludePatterns are skipped.
+        """
+        base = self.resolve(path)
+        pattern = pattern.lower()
+        excludes = excludePatterns or []
+        matches = []
+        for entry in sorted(base.rglob("*")):
+            relative = entry.relative_to(base).as_posix()
+            # Un patrón excluye la entrada si coincide con su ruta, su nombre o el de un directorio padre
+            candidates = [relative, f"/{relative}", *entry.relative_to(base).parts]
+            if any(
+                fnmatch.fnmatch(candidate, exclude) or fnmatch.fnmatch(candidate, f"*/{exclude}")
+                for candidate in candidates
+                for exclude in excludes
+            ):
+                continue
+            if pattern in entry.name.lower():
+                matches.append(str(entry))
+        return "\n".join(matches) if matches else "No matches found"
+
+    def list_allowed_directories(self) -> str:
+        """List the directories this toolset is allowed to access."""
+        return f"Allowed directories:\n{self.root}"
+
+    def as_tools(self) -> list:
+        """Retorna las operaciones como tools de LangChain con los nombres del servidor MCP."""
+        return [
+            StructuredTool.from_function(getattr(self, name), name=name)
+            for name in (
+                "read_file",
+                "read_multiple_files",
+                "write_file",
+                "create_directory",
+                "list_directory",
+                "directory_tree",
+                "search_files",
+                "list_allowed_directories",
+            )
+        ]
+
+
+# Toolsets ya construidos (uno por raíz)
+_toolsets: dict[Path, list] = {}
+
+
+def get_native_filesystem_tools(root: str) -> list:
+    """Retorna las tools nativas confinadas a `root`, reutilizándolas entre nodos."""
+    key = Path(root).resolve()
+    if key not in _toolsets:
+        _toolsets[key] = NativeFilesystem(key).as_tools()
+    return _toolsets[key]
@@ -0,0 +1,59 @@
+"""
+Units - Ejecución de unidades de trabajo con dependencias como ramas paralelas.
+
+Una unidad es un dict:
+    {"id": "backend_models:task", "stage": "backend_models", "entity": "task",
+     "class_name": "Task", "depends_on": ["backend_setup"]}
+
+El subgrafo guarda el plan en `units` y las unidades terminadas en
+`completed_units` (reducer operator.add, así varias ramas pueden reportar en el
+mismo superstep sin pisarse). En cada paso, route_units despacha con Send
+todas las unidades cuyas dependencias ya terminaron; LangGraph las ejecuta en
+paralelo respetando el max_concurrency del config.
+"""
+
+from langgraph.types import Send
+
+
+def ready_units(units: list[dict], completed: list[str]) -> list[dict]:
+    """
+    Unidades pendientes cuyas dependencias ya terminaron.
+
+    Las dependencias a unidades que no están en el plan se ignoran.
+    """
+    planned = {unit["id"] for unit in units}
+    done = set(completed)
+    return [
+        unit
+        for unit in units
+        if unit["id"] not in done
+        and all(dep in done or dep not in planned for dep in unit.get("depends_on", []))
+    ]
+
+
+def has_cycle(units: list[dict]) -> bool:
+    """Indica si las dependencias del plan forman un ciclo."""
+    completed: list[str] = []
+    while True:
+        ready = ready_units(units, completed)
+        if not ready:
+            return len(completed) < len(units)
+        completed += [unit["id"] for unit in ready]
+
+
+def route_units(state: dict, unit_node: str, done_node: str):
+    """
+    Función de routing: Send a `unit_node` por cada unidad lista, o `done_node`
+    cuando ya no quedan unidades ejecutables.
+    """
+    units = state.get("units", [])
+    completed = state.get("completed_units", [])
+    ready = ready_units(units, completed)
+    if not ready:
+        pending = [unit["id"] for unit in units if unit["id"] not in completed]
+        if pending:
+            print(f"   ⚠️  Unidades bloqueadas por dependencias: {', '.join(pending)}")
+        return done_node
+
+    print(f"   🔀 Ejecutando {len(ready)} unidad(es) en paralelo: {', '.join(unit['id'] for unit in ready)}")
+    return [Send(unit_node, {**state, "unit": unit}) for unit in ready]
@@ -0,0 +1,224 @@
+"""
+Verify - Verificación automática del backend generado, sin LLM.
+
+Antes la única verificación era contar archivos *.py con rglob. Este módulo
+ejecuta tres pasos, cada uno con su propio límite de tiempo:
+
+1. compile: byte-compila todos los módulos en paralelo (ProcessPoolExecutor)
+2. import: importa app.main en un subproceso aislado
+3. pytest: corre los tests generados con workers paralelos (pytest-xdist si
+   está instalado) contra SQLite
+
+Los subprocesos corren con cwd en el backend, un entorno mínimo (sin API keys
+del equipo), DATABASE_URL apuntando a SQLite y sin escribir bytecode ni cache.
+Cada fallo queda asociado a un archivo (`target`) para que el loop de
+reparación pueda corregir solo los archivos afectados.
+"""
+
+import asyncio
+import os
+import re
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+VERIFY_PYTHON = os.getenv("VERIFY_PYTHON", sys.executable)
+VERIFY_WORKERS = int(os.getenv("VERIFY_WORKERS", str(min(8, os.cpu_count() or 2))))
+STEP_TIMEOUTS = {
+    "compile": float(os.getenv("VERIFY_COMPILE_TIMEOUT", "60")),
+    "import": float(os.getenv("VERIFY_IMPORT_TIMEOUT", "30")),
+    "pytest": float(os.getenv("VERIFY_PYTEST_TIMEOUT", "300")),
+}
+# Variables del entorno que se heredan al sandbox (el resto, incluidas API keys, no)
+SANDBOX_ENV_KEYS = ("PATH", "HOME", "LANG", "SYSTEMROOT", "VIRTUAL_ENV")
+IGNORED_DIRS = {"__pycache__", ".venv", "venv", "node_modules", ".pytest_cache"}
+
+
+def python_files(backend_dir: Path) -> list[Path]:
+    return [
+        path for path in sorted(backend_dir.rglob("*.py"))
+        if not IGNORED_DIRS.intersection(path.relative_to(backend_dir).parts)
+    ]
+
+
+def _compile_file(path: str) -> str | None:
+    """Compila un archivo; retorna el error o None. Corre en un proceso del pool."""
+    try:
+        source = Path(path).read_text(encoding="utf-8")
+        compile(source, path, "exec")
+        return None
+    except SyntaxError as e:
+        return f"{e.msg} (línea {e.lineno})"
+    except (UnicodeDecodeError, ValueError) as e:
+        return f"{type(e).__name__}: {e}"
+
+
+def sandbox_env(backend_dir: Path, db_path: Path) -> dict:
+    """Entorno mínimo para ejecutar el código generado."""
+    env = {key: os.environ[key] for key in SANDBOX_ENV_KEYS if key in os.environ}
+    env.update({
+        "PYTHONPATH": str(backend_dir),
+        "PYTHONDONTWRITEBYTECODE": "1",
+        "DATABASE_URL": f"sqlite:///{db_path}",
+        "SECRET_KEY": "verify-secret-key",
+        "ENVIRONMENT": "test",
+    })
+    return env
+
+
+async def run_sandboxed(args: list[str], backend_dir: Path, env: dict, timeout: float) -> tuple[int | None, str]:
+    """
+    Ejecuta un comando en el backend con límite de tiempo.
+
+    Retorna (returncode, salida); returncode es None si se agotó el tiempo.
+    """
+    process = await asyncio.create_subprocess_exec(
+        *args, cwd=backend_dir, env=env,
+        stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.STDOUT,
+    )
+    try:
+        output, _ = await asyncio.wait_for(process.communicate(), timeout)
+    except asyncio.TimeoutError:
+        process.kill()
+        await process.wait()
+        return None, f"Tiempo agotado ({timeout:.0f}s)"
+    return process.returncode, output.decode("utf-8", errors="replace")
+
+
+def failing_file(output: str, backend_dir: Path) -> str | None:
+    """Último archivo del backend que aparece en un traceback."""
+    files = re.findall(r'File "([^"]+)", line \d+', output)
+    for file in reversed(files):
+        path = Path(file)
+        if path.is_absolute() and path.resolve().is_relative_to(backend_dir):
+            return str(path.resolve().relative_to(backend_dir))
+    return None
+
+
+async def verify_compile(backend_dir: Path, workers: int) -> dict:
+    files = python_files(backend_dir)
+    loop = asyncio.get_running_loop()
+    pool = ProcessPoolExecutor(max_workers=workers)
+    try:
+        errors = await asyncio.wait_for(
+            asyncio.gather(*(loop.run_in_executor(pool, _compile_file, str(path)) for path in files)),
+            STEP_TIMEOUTS["compile"],
+        )
+    finally:
+        # shutdown(wait=True) bloquearía el event loop hasta que terminen los workers
+        pool.shutdown(wait=False, cancel_futures=True)
+    failures = [
+        {"target": str(path.relative_to(backend_dir)), "error": error}
+        for path, error in zip(files, errors) if error
+    ]
+    return {"files": len(files), "failures": failures}
+
+
+async def verify_import(backend_dir: Path, env: dict) -> dict:
+    code, output = await run_sandboxed(
+        [VERIFY_PYTHON, "-c", "import app.main; assert hasattr(app.main, 'app')"],
+        backend_dir, env, STEP_TIMEOUTS["import"],
+    )
+    if code == 0:
+        return {"failures": []}
+    error = output.strip().splitlines()[-1] if output.strip() else f"exit code {code}"
+    target = failing_file(output, backend_dir) or "app/main.py"
+    return {"failures": [{"target": target, "error": error, "output": output[-3000:]}]}
+
+
+async def has_xdist(env: dict, backend_dir: Path) -> bool:
+    code, _ = await run_sandboxed([VERIFY_PYTHON, "-c", "import xdist"], backend_dir, env, 15)
+    return code == 0
+
+
+async def verify_pytest(backend_dir: Path, env: dict, workers: int) -> dict:
+    tests_dir = next((path for path in (backend_dir / "app/tests", backend_dir / "tests") if path.is_dir()), None)
+    if tests_dir is None:
+        return {"skipped": "no hay tests generados", "failures": []}
+
+    args = [VERIFY_PYTHON, "-m", "pytest", str(tests_dir.relative_to(backend_dir)),
+            "-q", "-rfE", "--tb=line", "-p", "no:cacheprovider"]
+    if workers > 1 and await has_xdist(env, backend_dir):
+        args += ["-n", str(workers)]
+
+    code, output = await run_sandboxed(args, backend_dir, env, STEP_TIMEOUTS["pytest"])
+    summary = output.strip().splitlines()[-1] if output.strip() else ""
+    if code == 0 or code == 5:  # 5 = no se recolectaron tests
+        return {"summary": summary, "failures": []}
+    if code is None:
+        return {"summary": summary, "failures": [{"target": str(tests_dir.relative_to(backend_dir)), "error": output}]}
+
+    # "FAILED app/tests/test_tasks.py::test_create - AssertionError: ..."
+    # "ERROR app/tests/test_tasks.py::test_create - ..." (fixture) o "ERROR app/tests/test_x.py - ..." (colección)
+    failures = [
+        {"target": match.group(1), "error": f"{match.group(2) or 'colección'}: {match.group(3) or 'falló'}"}
+        for match in re.finditer(r"^(?:FAILED|ERROR) ([^:\s]+)(?:::(\S+))?(?: - (.*))?$", output, re.MULTILINE)
+    ]
+    if not failures:
+        # Error de colección o de conftest: no hay resumen por test
+        failures = [{"target": failing_file(output, backend_dir) or str(tests_dir.relative_to(backend_dir)),
+                     "error": summary or f"exit code {code}", "output": output[-3000:]}]
+    return {"summary": summary, "failures": failures}
+
+
+async def verify_backend(backend_dir: str, workers: int = VERIFY_WORKERS) -> dict:
+    """
+    Ejecuta compile → import → pytest y retorna un reporte por paso.
+
+    Si un paso falla los siguientes no se ejecutan (un SyntaxError rompe
+    también el import y los tests, y repararlo primero es más barato).
+
+    Returns:
+        dict: {"ok": bool, "steps": {paso: {ok, seconds, failures, ...}}, "failures": [...]}
+    """
+    backend_dir = Path(backend_dir).resolve()
+    report = {"ok": True, "steps": {}, "failures": []}
+
+    with tempfile.TemporaryDirectory(prefix="verify_") as tmp:
+        env = sandbox_env(backend_dir, Path(tmp) / "verify.db")
+        steps = {
+            "compile": lambda: verify_compile(backend_dir, workers),
+            "import": lambda: verify_import(backend_dir, env),
+            "pytest": lambda: verify_pytest(backend_dir, env, workers),
+        }
+        for step, run_step in steps.items():
+            start = time.perf_counter()
+            try:
+                result = await run_step()
+            except asyncio.TimeoutError:
+                result = {"failures": [{"target": ".", "error": f"Tiempo agotado ({STEP_TIMEOUTS[step]:.0f}s)"}]}
+            result["seconds"] = round(time.perf_counter() - start, 2)
+            result["ok"] = not result["failures"]
+            for failure in result["failures"]:
+                failure["step"] = step
+            report["steps"][step] = result
+            if result["failures"]:
+                report["ok"] = False
+                report["failures"] = result["failures"]
+                break
+
+    return report
+
+
+def failures_by_target(failures: list[dict]) -> dict[str, list[dict]]:
+    """Agrupa los fallos por archivo para repararlos en paralelo."""
+    grouped = {}
+    for failure in failures:
+        grouped.setdefault(failure["target"], []).append(failure)
+    return grouped
+
+
+def format_verification(report: dict) -> str:
+    lines = []
+    for step, result in report["steps"].items():
+        status = "✅" if result["ok"] else "❌"
+        if result["ok"]:
+            detail = result.get("skipped") or result.get("summary") or (
+                f"{result['files']} archivos" if "files" in result else "ok"
+            )
+        else:
+            detail = f"{len(result['failures'])} fallo(s)"
+        lines.append(f"{status} {step:<8} {result['seconds']:>6.1f}s  {detail}")
+    return "\n".join(lines)
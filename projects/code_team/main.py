@@ -1,16 +1,41 @@
+import argparse
 import asyncio
+from datetime import datetime
 from langchain_core.messages import HumanMessage
 from graph import build_graph
+from graph.tools import mcp_filesystem_session
+from graph.agents import format_agent_stats
+from graph.checkpoint import open_checkpointer, format_durations
+from graph.report import write_run_report, REPORTS_DIR
+from graph.events import stream_run
 from pathlib import Path
 
 
+def parse_args():
+    parser = argparse.ArgumentParser(description="Equipo de desarrollo con LangGraph")
+    parser.add_argument("--run-id", help="Identificador de la ejecución (thread_id del checkpoint)")
+    parser.add_argument(
+        "--resume", metavar="RUN_ID",
+        help="Retoma una ejecución interrumpida desde el último nodo completado",
+    )
+    parser.add_argument(
+        "--stream", action="store_true",
+        help="Muestra eventos en vivo (nodos, tool calls, archivos, tokens) y los guarda en JSONL",
+    )
+    return parser.parse_args()
+
+
 async def main():
     """
     Punto de entrada principal para ejecutar el grafo del equipo de desarrollo.
     """
+    args = parse_args()
+    async with open_checkpointer() as checkpointer:
+        await run(build_graph(checkpointer), args, persistent=checkpointer is not None)
 
-    # Build the graph
-    graph = build_graph()
+
+async def run(graph, args, persistent: bool):
+    """Ejecuta una corrida nueva o retoma la indicada con --resume."""
 
     # Display the graph structure
     print("\n📊 Estructura del grafo:")
@@ -36,14 +61,53 @@ async def main():
         "main_output": str(output_dir_absolute),
     }
 
-    print("\n🚀 Iniciando ejecución del grafo con configuración:")
-    print(f"   📦 Proyecto: {initial_state['project_name']}")
-    print(f"   🔧 Backend: {initial_state['backend_stack']}")
-    print(f"   🎨 Frontend: {initial_state['frontend_stack']}")
+    run_id = args.resume or args.run_id or datetime.now().strftime("%Y%m%d-%H%M%S")
+    config = {"configurable": {"thread_id": run_id}}
+    graph_input = initial_state
+
+    if args.resume:
+        if not persistent:
+            print("❌ No se puede retomar sin checkpointer (pip install langgraph-checkpoint-sqlite)")
+            return
+        snapshot = await graph.aget_state(config)
+        if not snapshot.values:
+            print(f"❌ No hay checkpoints para la ejecución '{run_id}'")
+            return
+        if not snapshot.next:
+            print(f"✅ La ejecución '{run_id}' ya estaba completa")
+            return
+        # None = continuar desde el último checkpoint con el estado guardado
+        graph_input = None
+        initial_state = snapshot.values
+        print(f"\n⏯️  Retomando ejecución '{run_id}' desde: {', '.join(snapshot.next)}")
+    else:
+        print("\n🚀 Iniciando ejecución del grafo con configuración:")
+        print(f"   🆔 Run ID: {run_id}" + ("" if persistent else " (sin checkpoint)"))
+        print(f"   📦 Proyecto: {initial_state['project_name']}")
+        print(f"   🔧 Backend: {initial_state['backend_stack']}")
+        print(f"   🎨 Frontend: {initial_state['frontend_stack']}")
     print("\n" + "=" * 80 + "\n")
 
-    # Ejecutar el grafo
-    result = await graph.ainvoke(initial_state)
+    # Ejecutar el grafo con un único servidor MCP filesystem compartido por todos los nodos
+    async with mcp_filesystem_session(initial_state["main_output"]) as mcp_session:
+        if args.stream:
+            events_path = Path(initial_state["main_output"]) / REPORTS_DIR / f"{run_id}.events.jsonl"
+            result = await stream_run(graph, graph_input, config, events_path)
+        else:
+            result = await graph.ainvoke(graph_input, config)
+
+    print(f"\n🔌 {mcp_session.report()}")
+
+    if result.get("node_durations"):
+        print("\n⏱️  Duración por nodo:")
+        print(format_durations(result["node_durations"]))
+
+    if result.get("agent_stats"):
+        print("\n📊 Métricas por etapa:")
+        print(format_agent_stats(result["agent_stats"]))
+
+    report_path = write_run_report(result, run_id)
+    print(f"\n🧾 Reporte de la ejecución: {report_path}")
 
     print("\n" + "=" * 80)
     print("\n✅ Ejecución completada. Resumen de mensajes:")
@@ -0,0 +1,146 @@
+"""
+Recall@k and latency benchmark for the RAG retrievers.
+
+Builds an in-memory ChromaDB collection and BM25 index from the knowledge base
+fixtures (populate/populate_chromadb.py) and compares dense, BM25, hybrid
+(reciprocal rank fusion) and, optionally, hybrid + cross-encoder reranking on
+a set of labelled Spanish queries.
+
+Run from the project root:
+    python -m benchmarks.rag_retrieval            # real OpenAI embeddings
+    python -m benchmarks.rag_retrieval --offline  # fake embeddings, latency only
+    python -m benchmarks.rag_retrieval --rerank --budget-ms 200
+"""
+import argparse
+import statistics
+import time
+
+from langchain_chroma import Chroma
+from langchain_core.embeddings import DeterministicFakeEmbedding
+from langchain_openai import OpenAIEmbeddings
+from dotenv import load_dotenv
+
+from config import DEFAULT_EMBEDDING_MODEL, RAG_CANDIDATES_K
+from populate.populate_chromadb import SAMPLE_DOCUMENTS
+from tools.bm25_index import BM25Index
+from tools.rag_tool import CrossEncoderReranker, HybridRetriever
+
+load_dotenv()
+
+# (query, expected source) pairs over the knowledge base fixtures
+LABELLED_QUERIES = [
+    ("¿Cuántas unidades del Widget X-2000 vendimos?", "sales_report"),
+    ("Widget X-2000", "sales_report"),
+    ("¿Cuánto dura la garantía?", "warranty_policy"),
+    ("garantia comprobante de compra", "warranty_policy"),
+    ("¿Puedo devolver un producto sin usar?", "return_policy"),
+    ("política de devoluciones 30 días", "return_policy"),
+    ("¿Cuál es el horario de atención al cliente?", "customer_service"),
+    ("¿Abren los fines de semana?", "customer_service"),
+    ("¿Dónde está el centro de distribución?", "company_info"),
+    ("precio de la licencia anual del producto Z", "product_catalog"),
+    ("¿Cuánto ganamos el mes pasado?", "financial_report"),
+    ("ingresos $50,000", "financial_report"),
+]
+
+
+def percentile(values, pct):
+    """Nearest-rank percentile of a list of floats."""
+    ordered = sorted(values)
+    index = max(0, min(len(ordered) - 1, round(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+def evaluate(name, search_fn, k):
+    """Run every labelled query through search_fn and collect recall@k, MRR and latency."""
+    hits, reciprocal_ranks, latencies = 0, [], []
+    search_fn(LABELLED_QUERIES[0][0])  # warm-up (model loading, connections)
+    for query, expected_source in LABELLED_QUERIES:
+        start = time.perf_counter()
+        results = search_fn(query)[:k]
+        latencies.append((time.perf_counter() - start) * 1000)
+
+        sources = [doc.metadata.get("source") for doc in results]
+        if expected_source in sources:
+            hits += 1
+            reciprocal_ranks.append(1 / (sources.index(expected_source) + 1))
+        else:
+            reciprocal_ranks.append(0.0)
+
+    return {
+        "name": name,
+        "recall": hits / len(LABELLED_QUERIES),
+        "mrr": statistics.mean(reciprocal_ranks),
+        "p50_ms": statistics.median(latencies),
+        "p95_ms": percentile(latencies, 95),
+    }
+
+
+def fused_only(retriever: HybridRetriever, query: str, k: int):
+    """Hybrid search with the reranking stage bypassed."""
+    reranker, retriever.reranker = retriever.reranker, None
+    try:
+        return retriever.search(query, k=k)
+    finally:
+        retriever.reranker = reranker
+
+
+def build_retriever(offline: bool, reranker=None) -> HybridRetriever:
+    """Index the fixtures into an ephemeral Chroma collection and BM25 index."""
+    if offline:
+        embeddings = DeterministicFakeEmbedding(size=256)
+    else:
+        embeddings = OpenAIEmbeddings(model=DEFAULT_EMBEDDING_MODEL)
+
+    vectorstore = Chroma(collection_name="rag_benchmark", embedding_function=embeddings)
+    retriever = HybridRetriever(vectorstore, BM25Index(), reranker=reranker)
+    retriever.add_documents(SAMPLE_DOCUMENTS)
+    return retriever
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--k", type=int, default=3, help="Cut-off for recall@k")
+    parser.add_argument("--offline", action="store_true", help="Use fake embeddings (no API calls)")
+    parser.add_argument("--rerank", action="store_true", help="Also evaluate cross-encoder reranking")
+    parser.add_argument("--budget-ms", type=float, default=None, help="Reranking latency budget")
+    args = parser.parse_args()
+
+    reranker = None
+    if args.rerank:
+        reranker = CrossEncoderReranker()
+        if args.budget_ms is not None:
+            reranker.budget_ms = args.budget_ms
+
+    retriever = build_retriever(args.offline, reranker)
+    try:
+        modes = [
+            ("dense", lambda q: retriever.dense_search(q, RAG_CANDIDATES_K)),
+            ("bm25", lambda q: retriever.lexical_search(q, RAG_CANDIDATES_K)),
+            ("hybrid (rrf)", lambda q: fused_only(retriever, q, args.k)),
+        ]
+        if reranker is not None:
+            modes.append(("hybrid+rerank", lambda q: retriever.search(q, k=args.k)))
+        reports = [evaluate(name, fn, args.k) for name, fn in modes]
+    finally:
+        retriever.vectorstore.delete_collection()
+
+    print(f"\nKnowledge base: {len(SAMPLE_DOCUMENTS)} docs, {len(LABELLED_QUERIES)} labelled queries")
+    if args.offline:
+        print("⚠️  Offline mode: dense scores come from fake embeddings, only latency is meaningful.")
+    print(f"\n{'mode':<14}{'recall@' + str(args.k):>10}{'MRR':>8}{'p50 ms':>10}{'p95 ms':>10}")
+    for report in reports:
+        print(
+            f"{report['name']:<14}{report['recall']:>10.2f}{report['mrr']:>8.2f}"
+            f"{report['p50_ms']:>10.1f}{report['p95_ms']:>10.1f}"
+        )
+
+    if reranker is not None:
+        if not reranker.enabled:
+            print("\n⚠️  sentence-transformers no está instalado: hybrid+rerank equivale a hybrid.")
+        else:
+            print(f"\nReranker: {reranker.model_name}, budget {reranker.budget_ms:.0f} ms, last call {reranker.last_stats}")
+
+
+if __name__ == "__main__":
+    main()
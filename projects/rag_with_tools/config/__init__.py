@@ -1,4 +1,27 @@
-from .settings import CONFIG_PATH, DATA_SOURCES, MAX_RETRIES, DEFAULT_LLM_MODEL, DEFAULT_LLM_TEMPERATURE
+from .settings import (
+    CONFIG_PATH,
+    DATA_SOURCES,
+    MAX_RETRIES,
+    DEFAULT_LLM_MODEL,
+    DEFAULT_LLM_TEMPERATURE,
+    CHROMA_PERSIST_DIR,
+    CHROMA_COLLECTION_NAME,
+    BM25_INDEX_PATH,
+    DEFAULT_EMBEDDING_MODEL,
+    RAG_TOP_K,
+    RAG_CANDIDATES_K,
+    RRF_K,
+    RAG_AUTO_FILTER,
+    RAG_CATEGORY_KEYWORDS,
+    RAG_RERANK,
+    RAG_RERANK_MODEL,
+    RAG_RERANK_CANDIDATES,
+    RAG_RERANK_BATCH_SIZE,
+    RAG_RERANK_BUDGET_MS,
+    RAG_RERANK_CACHE_SIZE,
+    RAG_TOKEN_BUDGET,
+    RAG_DEDUP_THRESHOLD,
+)
 from .utils import get_source_config, get_retry_context, get_user_query, is_result_empty, has_error
 from .constants import Routes, EvaluationResults
 
@@ -8,6 +31,23 @@ __all__ = [
     "MAX_RETRIES",
     "DEFAULT_LLM_MODEL",
     "DEFAULT_LLM_TEMPERATURE",
+    "CHROMA_PERSIST_DIR",
+    "CHROMA_COLLECTION_NAME",
+    "BM25_INDEX_PATH",
+    "DEFAULT_EMBEDDING_MODEL",
+    "RAG_TOP_K",
+    "RAG_CANDIDATES_K",
+    "RRF_K",
+    "RAG_AUTO_FILTER",
+    "RAG_CATEGORY_KEYWORDS",
+    "RAG_RERANK",
+    "RAG_RERANK_MODEL",
+    "RAG_RERANK_CANDIDATES",
+    "RAG_RERANK_BATCH_SIZE",
+    "RAG_RERANK_BUDGET_MS",
+    "RAG_RERANK_CACHE_SIZE",
+    "RAG_TOKEN_BUDGET",
+    "RAG_DEDUP_THRESHOLD",
     "get_source_config",
     "get_retry_context",
     "get_user_query",
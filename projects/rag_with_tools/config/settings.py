@@ -15,3 +15,36 @@ MAX_RETRIES = 4
 # LLM configuration
 DEFAULT_LLM_MODEL = "gpt-4o-mini"
 DEFAULT_LLM_TEMPERATURE = 0.0
+
+# RAG configuration
+CHROMA_PERSIST_DIR = Path(__file__).parent.parent / "populate" / "chroma_db"
+CHROMA_COLLECTION_NAME = "knowledge_base"
+BM25_INDEX_PATH = CHROMA_PERSIST_DIR / "bm25_index.json"
+DEFAULT_EMBEDDING_MODEL = "text-embedding-3-small"
+RAG_TOP_K = 3  # Documents returned to the LLM
+RAG_CANDIDATES_K = 10  # Candidates fetched from each retriever before fusion
+RRF_K = 60  # Reciprocal rank fusion damping constant
+
+# Metadata-filtered retrieval
+RAG_AUTO_FILTER = False  # Opt-in: infer a category/date filter from the query when none is given
+# Keywords (lowercase, without accents) used to infer the knowledge base category of a query
+RAG_CATEGORY_KEYWORDS = {
+    "products": ["widget", "x-2000", "software", "licencia", "precio", "catalogo"],
+    "revenue": ["ingresos", "ganamos", "ganancias", "facturamos", "contribuidor"],
+    "policies": ["garantia", "devolucion", "devoluciones", "devolver", "reembolso", "politica"],
+    "operations": ["horario", "atencion", "abren", "abierto", "cierran", "festivos"],
+    "locations": ["ubicacion", "ubicaciones", "sucursal", "sucursales", "sede", "distribucion"],
+    "about": ["mision", "vision", "valores"],
+}
+
+# Cross-encoder reranking (optional, requires `pip install sentence-transformers`)
+RAG_RERANK = False  # Rerank the fused candidates before returning the top-k
+RAG_RERANK_MODEL = "cross-encoder/mmarco-mMiniLMv2-L12-H384-v1"  # Small multilingual model, runs on CPU
+RAG_RERANK_CANDIDATES = 50  # Fused candidates passed to the cross-encoder
+RAG_RERANK_BATCH_SIZE = 16
+RAG_RERANK_BUDGET_MS = 300  # Stop scoring new batches once this budget is spent
+RAG_RERANK_CACHE_SIZE = 2048  # (query, document) scores kept in memory
+
+# RAG output formatting
+RAG_TOKEN_BUDGET = 600  # Approximate token budget for the text returned by rag_tool
+RAG_DEDUP_THRESHOLD = 0.8  # Word-shingle Jaccard similarity above which chunks are near-duplicates
@@ -12,7 +12,7 @@ from graph.nodes import (
 )
 from tools.sql_tool import sql_db_tool
 from tools.mongo_tool import mongo_tool
-from tools.rag_tool import rag_tool
+from tools.rag_tool import rag_tool, rag_multi_tool
 from config import Routes, MAX_RETRIES, DATA_SOURCES, EvaluationResults
 
 
@@ -99,7 +99,7 @@ def build_graph():
     # Define tool nodes
     sql_db_tools = [sql_db_tool]
     nosql_db_tools = [mongo_tool]
-    rag_tools = [rag_tool]
+    rag_tools = [rag_tool, rag_multi_tool]
 
     # Initialize graph builder
     builder = StateGraph(GraphState)
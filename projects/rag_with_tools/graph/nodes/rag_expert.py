@@ -1,7 +1,7 @@
 from langchain_openai import ChatOpenAI
 from langchain_core.messages import SystemMessage
 from graph.state import GraphState
-from tools.rag_tool import rag_tool
+from tools.rag_tool import rag_tool, rag_multi_tool
 from config import DEFAULT_LLM_MODEL, get_user_query
 
 
@@ -36,11 +36,15 @@ def expert_rag(state: GraphState):
 
     IMPORTANT:
     - Use the rag_tool to search for documents related to the user's query.
+    - If the question has several parts, make ONE rag_multi_tool call with one query per part
+      instead of several rag_tool calls.
     - The tool will return the most relevant documents from the knowledge base.
-    - Be precise in your search query to get the best results."""
+    - Be precise in your search query to get the best results.
+    - If the question clearly targets one kind of document, pass the optional filters
+      (category: products, revenue, policies, operations, locations, about; date_from/date_to as "YYYY-MM")."""
 
     sys_msg = SystemMessage(content=instruction)
-    llm_with_tools = ChatOpenAI(model=DEFAULT_LLM_MODEL).bind_tools([rag_tool])
+    llm_with_tools = ChatOpenAI(model=DEFAULT_LLM_MODEL).bind_tools([rag_tool, rag_multi_tool])
     ai_msg = llm_with_tools.invoke([sys_msg] + clean_history)
 
     return {"messages": [ai_msg]}
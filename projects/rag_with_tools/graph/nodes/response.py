@@ -49,7 +49,9 @@ def response_generator(state: GraphState):
         context_parts.append(f"Database Query Results:\n{chr(10).join(db_results)}")
 
     if rag_results:
-        context_parts.append(f"Knowledge Base Information:\n{chr(10).join(rag_results)}")
+        # Repeated RAG calls often return the same snippets, include each result only once
+        unique_rag_results = list(dict.fromkeys(rag_results))
+        context_parts.append(f"Knowledge Base Information:\n{chr(10).join(unique_rag_results)}")
 
     if errors:
         context_parts.append(f"Encountered Issues:\n{chr(10).join(errors)}")
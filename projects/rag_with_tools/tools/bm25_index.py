@@ -0,0 +1,267 @@
+"""
+Local BM25 inverted index kept alongside the ChromaDB knowledge base.
+
+Dense embeddings are weak on exact tokens such as product codes ("Widget X-2000")
+or short policy keywords ("garantía"). This index scores documents lexically so
+that rag_tool can fuse both rankings. It is built at ingestion time, updated
+incrementally and persisted as JSON next to the Chroma files.
+"""
+import hashlib
+import json
+import math
+import re
+import unicodedata
+from collections import Counter, defaultdict
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from langchain_core.documents import Document
+
+TOKEN_PATTERN = re.compile(r"\w+(?:-\w+)*")
+
+STOPWORDS = {
+    # Spanish
+    "a", "al", "con", "cual", "cuando", "de", "del", "el", "en", "es", "esta",
+    "este", "la", "las", "lo", "los", "mas", "me", "mi", "nos", "nuestra",
+    "nuestro", "o", "para", "por", "que", "se", "si", "sin", "sobre", "son",
+    "su", "sus", "un", "una", "y",
+    # English
+    "an", "and", "are", "do", "does", "for", "how", "in", "is", "of", "on",
+    "or", "the", "to", "what", "which", "with",
+}
+
+
+def normalize_text(text: str) -> str:
+    """Lowercase text and strip accents so "garantía" matches "garantia"."""
+    decomposed = unicodedata.normalize("NFKD", text.lower())
+    return "".join(char for char in decomposed if not unicodedata.combining(char))
+
+
+def tokenize(text: str) -> List[str]:
+    """
+    Split text into BM25 terms.
+
+    Hyphenated codes are kept whole and also split into their parts, so
+    "X-2000" yields "x-2000", "x" and "2000".
+
+    Args:
+        text: Raw document or query text
+
+    Returns:
+        List of normalized terms without stopwords
+    """
+    tokens = []
+    for match in TOKEN_PATTERN.findall(normalize_text(text)):
+        if match not in STOPWORDS:
+            tokens.append(match)
+        if "-" in match:
+            tokens.extend(part for part in match.split("-") if part and part not in STOPWORDS)
+    return tokens
+
+
+_COMPARATORS = {
+    "$eq": lambda value, target: value == target,
+    "$ne": lambda value, target: value != target,
+    "$gt": lambda value, target: value is not None and value > target,
+    "$gte": lambda value, target: value is not None and value >= target,
+    "$lt": lambda value, target: value is not None and value < target,
+    "$lte": lambda value, target: value is not None and value <= target,
+    "$in": lambda value, target: value in target,
+    "$nin": lambda value, target: value not in target,
+}
+
+
+def matches_filter(metadata: Dict[str, Any], where: Optional[Dict[str, Any]]) -> bool:
+    """
+    Evaluate a ChromaDB-style ``where`` clause against document metadata.
+
+    Supports ``$and``/``$or`` and the comparison operators used by rag_tool,
+    so the BM25 index narrows its candidates exactly like ChromaDB does.
+
+    Args:
+        metadata: Document metadata
+        where: ChromaDB where clause, or None for no filtering
+
+    Returns:
+        True if the metadata satisfies the clause
+    """
+    if not where:
+        return True
+
+    for key, condition in where.items():
+        if key == "$and":
+            if not all(matches_filter(metadata, clause) for clause in condition):
+                return False
+        elif key == "$or":
+            if not any(matches_filter(metadata, clause) for clause in condition):
+                return False
+        elif isinstance(condition, dict):
+            value = metadata.get(key)
+            for operator, target in condition.items():
+                if not _COMPARATORS[operator](value, target):
+                    return False
+        elif metadata.get(key) != condition:
+            return False
+    return True
+
+
+def document_id(content: str) -> str:
+    """
+    Stable identifier for a chunk, shared by ChromaDB and the BM25 index.
+
+    Args:
+        content: Document page content
+
+    Returns:
+        Hex digest derived from the content
+    """
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()[:32]
+
+
+class BM25Index:
+    """
+    In-memory Okapi BM25 index with incremental add/remove and JSON persistence.
+    """
+
+    def __init__(self, k1: float = 1.5, b: float = 0.75):
+        """
+        Initialize an empty index.
+
+        Args:
+            k1: Term frequency saturation parameter
+            b: Document length normalization parameter
+        """
+        self.k1 = k1
+        self.b = b
+        self.documents: Dict[str, Dict[str, Any]] = {}
+        self.postings: Dict[str, Dict[str, int]] = defaultdict(dict)
+        self.total_length = 0
+
+    def __len__(self) -> int:
+        return len(self.documents)
+
+    def __contains__(self, doc_id: str) -> bool:
+        return doc_id in self.documents
+
+    def add(self, doc_id: str, content: str, metadata: Optional[Dict[str, Any]] = None):
+        """Add or replace a single document."""
+        if doc_id in self.documents:
+            self.remove(doc_id)
+
+        tokens = tokenize(content)
+        for term, frequency in Counter(tokens).items():
+            self.postings[term][doc_id] = frequency
+
+        self.documents[doc_id] = {
+            "content": content,
+            "metadata": metadata or {},
+            "length": len(tokens),
+        }
+        self.total_length += len(tokens)
+
+    def add_documents(self, documents: Iterable[Document], ids: Optional[List[str]] = None) -> List[str]:
+        """
+        Add LangChain documents to the index.
+
+        Args:
+            documents: Documents to index
+            ids: Optional explicit ids, defaults to document_id(page_content)
+
+        Returns:
+            List of ids that were indexed
+        """
+        documents = list(documents)
+        ids = ids or [document_id(doc.page_content) for doc in documents]
+        for doc_id, doc in zip(ids, documents):
+            self.add(doc_id, doc.page_content, doc.metadata)
+        return ids
+
+    def remove(self, doc_id: str):
+        """Remove a document from the index if present."""
+        entry = self.documents.pop(doc_id, None)
+        if entry is None:
+            return
+
+        for term in set(tokenize(entry["content"])):
+            posting = self.postings.get(term)
+            if posting is None:
+                continue
+            posting.pop(doc_id, None)
+            if not posting:
+                del self.postings[term]
+        self.total_length -= entry["length"]
+
+    def search(
+        self, query: str, k: int = 10, where: Optional[Dict[str, Any]] = None
+    ) -> List[Tuple[str, float]]:
+        """
+        Score documents against a query.
+
+        Args:
+            query: Search query
+            k: Maximum number of results
+            where: Optional ChromaDB-style metadata filter
+
+        Returns:
+            List of (doc_id, score) sorted by descending score
+        """
+        if not self.documents:
+            return []
+
+        total_docs = len(self.documents)
+        avg_length = self.total_length / total_docs or 1.0
+        scores: Dict[str, float] = defaultdict(float)
+
+        for term in set(tokenize(query)):
+            posting = self.postings.get(term)
+            if not posting:
+                continue
+            df = len(posting)
+            idf = math.log(1 + (total_docs - df + 0.5) / (df + 0.5))
+            for doc_id, frequency in posting.items():
+                if where and not matches_filter(self.documents[doc_id]["metadata"], where):
+                    continue
+                length = self.documents[doc_id]["length"]
+                norm = self.k1 * (1 - self.b + self.b * length / avg_length)
+                scores[doc_id] += idf * frequency * (self.k1 + 1) / (frequency + norm)
+
+        ranked = sorted(scores.items(), key=lambda item: (-item[1], item[0]))
+        return ranked[:k]
+
+    def get_document(self, doc_id: str) -> Document:
+        """Return the stored chunk as a LangChain Document."""
+        entry = self.documents[doc_id]
+        return Document(id=doc_id, page_content=entry["content"], metadata=dict(entry["metadata"]))
+
+    def save(self, path: Path):
+        """Persist the index as JSON (written atomically)."""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        payload = {
+            "k1": self.k1,
+            "b": self.b,
+            "documents": self.documents,
+            "postings": self.postings,
+        }
+        tmp_path = path.with_suffix(path.suffix + ".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(payload, f, ensure_ascii=False)
+        tmp_path.replace(path)
+
+    @classmethod
+    def load(cls, path: Path) -> "BM25Index":
+        """Load an index from disk, returning an empty one if the file is missing."""
+        index = cls()
+        path = Path(path)
+        if not path.exists():
+            return index
+
+        with open(path, "r", encoding="utf-8") as f:
+            payload = json.load(f)
+
+        index.k1 = payload.get("k1", index.k1)
+        index.b = payload.get("b", index.b)
+        index.documents = payload.get("documents", {})
+        index.postings = defaultdict(dict, payload.get("postings", {}))
+        index.total_length = sum(entry["length"] for entry in index.documents.values())
+        return index
@@ -0,0 +1,111 @@
+"""
+Compact formatting of retrieved documents for the LLM prompt.
+
+Retrieved chunks are deduplicated, rendered with a short citation instead of
+the full metadata dict, and trimmed to a token budget so the text that
+reaches expert_rag and response_generator stays small and stable.
+"""
+import math
+from typing import Any, Dict, List, Set, Tuple
+
+from langchain_core.documents import Document
+
+from config import RAG_TOKEN_BUDGET, RAG_DEDUP_THRESHOLD
+from tools.bm25_index import normalize_text
+
+# Metadata fields shown in citations, in this order
+CITATION_FIELDS = ("source", "category", "date")
+
+# Below this many tokens a truncated chunk is not worth including
+MIN_CHUNK_TOKENS = 20
+
+
+def estimate_tokens(text: str) -> int:
+    """Approximate token count (~4 characters per token), no tokenizer download needed."""
+    return max(1, math.ceil(len(text) / 4))
+
+
+def _shingles(text: str, size: int = 3) -> Set[Tuple[str, ...]]:
+    """Word n-grams of the normalized text."""
+    words = normalize_text(text).split()
+    if len(words) < size:
+        return {tuple(words)}
+    return {tuple(words[i:i + size]) for i in range(len(words) - size + 1)}
+
+
+def deduplicate(documents: List[Document], threshold: float = RAG_DEDUP_THRESHOLD) -> List[Document]:
+    """
+    Drop near-duplicate chunks, keeping the best ranked copy.
+
+    Two chunks are near-duplicates when the Jaccard similarity of their word
+    shingles reaches the threshold, or when one is contained in the other
+    (typical of overlapping splits).
+
+    Args:
+        documents: Documents in ranked order (best first)
+        threshold: Similarity at or above which a chunk is dropped
+
+    Returns:
+        Deduplicated documents, order preserved
+    """
+    kept: List[Tuple[Document, Set[Tuple[str, ...]], str]] = []
+    for doc in documents:
+        normalized = " ".join(normalize_text(doc.page_content).split())
+        shingles = _shingles(doc.page_content)
+        duplicate = False
+        for _, kept_shingles, kept_text in kept:
+            union = shingles | kept_shingles
+            similarity = len(shingles & kept_shingles) / len(union) if union else 1.0
+            if similarity >= threshold or normalized in kept_text or kept_text in normalized:
+                duplicate = True
+                break
+        if not duplicate:
+            kept.append((doc, shingles, normalized))
+    return [doc for doc, _, _ in kept]
+
+
+def format_citation(metadata: Dict[str, Any]) -> str:
+    """Render metadata as a compact citation, e.g. "warranty_policy · policies"."""
+    return " · ".join(str(metadata[field]) for field in CITATION_FIELDS if metadata.get(field))
+
+
+def _truncate(text: str, max_tokens: int) -> str:
+    """Cut text to roughly max_tokens at a word boundary."""
+    max_chars = max_tokens * 4
+    if len(text) <= max_chars:
+        return text
+    cut = text[:max_chars].rsplit(" ", 1)[0]
+    return cut.rstrip(" ,.;:") + "…"
+
+
+def format_documents(documents: List[Document], token_budget: int = RAG_TOKEN_BUDGET) -> str:
+    """
+    Format retrieved documents as numbered, cited snippets within a token budget.
+
+    Example output:
+        [1] warranty_policy · policies: La compañía ofrece garantía de 2 años...
+
+    Args:
+        documents: Documents in ranked order (best first)
+        token_budget: Approximate maximum number of tokens for the whole output
+
+    Returns:
+        Formatted string (empty if no documents)
+    """
+    lines = []
+    used = 0
+    for i, doc in enumerate(deduplicate(documents), 1):
+        citation = format_citation(doc.metadata)
+        header = f"[{i}] {citation}: " if citation else f"[{i}] "
+        content = " ".join(doc.page_content.split())
+
+        remaining = token_budget - used - estimate_tokens(header)
+        if remaining < MIN_CHUNK_TOKENS and lines:
+            break
+        content = _truncate(content, max(remaining, MIN_CHUNK_TOKENS))
+
+        line = header + content
+        lines.append(line)
+        used += estimate_tokens(line) + 1
+
+    return "\n".join(lines)
@@ -1,67 +1,641 @@
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor
+from collections import OrderedDict, defaultdict
+from typing import Any, Dict, List, Optional
+
 from langchain_core.tools import tool
+from langchain_core.documents import Document
 from langchain_chroma import Chroma
 from langchain_openai import OpenAIEmbeddings
-from pathlib import Path
+
+from config import (
+    CHROMA_PERSIST_DIR,
+    CHROMA_COLLECTION_NAME,
+    BM25_INDEX_PATH,
+    DEFAULT_EMBEDDING_MODEL,
+    RAG_TOP_K,
+    RAG_CANDIDATES_K,
+    RRF_K,
+    RAG_AUTO_FILTER,
+    RAG_CATEGORY_KEYWORDS,
+    RAG_RERANK,
+    RAG_RERANK_MODEL,
+    RAG_RERANK_CANDIDATES,
+    RAG_RERANK_BATCH_SIZE,
+    RAG_RERANK_BUDGET_MS,
+    RAG_RERANK_CACHE_SIZE,
+)
+from tools.bm25_index import BM25Index, document_id, tokenize
+from tools.rag_format import deduplicate, format_documents
 
 # Global ChromaDB client
 _vectorstore = None
 
+# Global hybrid retriever (dense + BM25)
+_retriever = None
+
+# Explicit year-month mentions such as "2025-01"
+DATE_PATTERN = re.compile(r"\b(20\d{2})-(0[1-9]|1[0-2])\b")
+
 
 def get_vectorstore():
     """Get or create the ChromaDB vectorstore instance."""
     global _vectorstore
     if _vectorstore is None:
-        # Define persistent directory
-        persist_directory = Path(__file__).parent.parent / "populate/chroma_db"
-        persist_directory.mkdir(exist_ok=True)
+        CHROMA_PERSIST_DIR.mkdir(parents=True, exist_ok=True)
 
         # Initialize embeddings
-        embeddings = OpenAIEmbeddings(model="text-embedding-3-small")
+        embeddings = OpenAIEmbeddings(model=DEFAULT_EMBEDDING_MODEL)
 
         # Create/load vectorstore
         _vectorstore = Chroma(
-            collection_name="knowledge_base",
+            collection_name=CHROMA_COLLECTION_NAME,
             embedding_function=embeddings,
-            persist_directory=str(persist_directory),
+            persist_directory=str(CHROMA_PERSIST_DIR),
         )
     return _vectorstore
 
 
+def date_to_number(value: str, end: bool = False) -> int:
+    """
+    Convert a "YYYY-MM" (or "YYYY") date into the sortable integer YYYYMM.
+
+    ChromaDB only supports range operators on numbers, so documents carry a
+    numeric ``date_num`` next to their ``date`` string.
+
+    Args:
+        value: Date string
+        end: For year-only values, use December instead of January
+
+    Returns:
+        Integer such as 202501
+
+    Raises:
+        ValueError: If the value is not "YYYY-MM" or "YYYY"
+    """
+    parts = value.strip().split("-")
+    if (
+        len(parts) > 2
+        or not (len(parts[0]) == 4 and parts[0].isdigit())
+        or (len(parts) == 2 and not (parts[1].isdigit() and 1 <= int(parts[1]) <= 12))
+    ):
+        raise ValueError(f'invalid date "{value}", expected "YYYY-MM" or "YYYY"')
+    year = int(parts[0])
+    month = int(parts[1]) if len(parts) > 1 else (12 if end else 1)
+    return year * 100 + month
+
+
+def index_metadata(metadata: Dict[str, Any]) -> Dict[str, Any]:
+    """Copy document metadata adding the numeric ``date_num`` used by date range filters."""
+    enriched = dict(metadata)
+    if enriched.get("date"):
+        try:
+            # Full dates ("2025-01-15") are indexed by their month
+            enriched["date_num"] = date_to_number(str(enriched["date"])[:7])
+        except ValueError:
+            pass
+    return enriched
+
+
+def build_metadata_filter(
+    category: Optional[str] = None,
+    source: Optional[str] = None,
+    date_from: Optional[str] = None,
+    date_to: Optional[str] = None,
+) -> Optional[Dict[str, Any]]:
+    """
+    Build a ChromaDB ``where`` clause from optional metadata filters.
+
+    Args:
+        category: Document category (e.g. "policies")
+        source: Document source (e.g. "warranty_policy")
+        date_from: Inclusive lower bound, "YYYY-MM" or "YYYY"
+        date_to: Inclusive upper bound, "YYYY-MM" or "YYYY"
+
+    Returns:
+        Where clause, or None if no filter was given
+
+    Raises:
+        ValueError: If date_from or date_to is malformed
+    """
+    clauses = []
+    if category:
+        clauses.append({"category": {"$eq": category}})
+    if source:
+        clauses.append({"source": {"$eq": source}})
+    if date_from:
+        clauses.append({"date_num": {"$gte": date_to_number(date_from)}})
+    if date_to:
+        clauses.append({"date_num": {"$lte": date_to_number(date_to, end=True)}})
+
+    if not clauses:
+        return None
+    return clauses[0] if len(clauses) == 1 else {"$and": clauses}
+
+
+def infer_metadata_filter(query: str) -> Optional[Dict[str, Any]]:
+    """
+    Cheap query classification that infers a metadata filter from the query.
+
+    The category is chosen only when a single category has the most keyword
+    hits (see RAG_CATEGORY_KEYWORDS); explicit "YYYY-MM" mentions become a
+    date filter. Ambiguous queries are left unfiltered.
+
+    Args:
+        query: Search query
+
+    Returns:
+        Where clause, or None if nothing could be inferred
+    """
+    terms = set(tokenize(query))
+    hits = {
+        category: sum(1 for keyword in keywords if keyword in terms)
+        for category, keywords in RAG_CATEGORY_KEYWORDS.items()
+    }
+    best_score = max(hits.values(), default=0)
+    best = [category for category, score in hits.items() if score and score == best_score]
+    category = best[0] if len(best) == 1 else None
+
+    date_match = DATE_PATTERN.search(query)
+    date = date_match.group(0) if date_match else None
+
+    return build_metadata_filter(category=category, date_from=date, date_to=date)
+
+
+def reciprocal_rank_fusion(rankings: List[List[str]], k: int = RRF_K) -> List[str]:
+    """
+    Merge several ranked id lists with reciprocal rank fusion.
+
+    Each list contributes 1 / (k + rank) to the score of every id it contains,
+    so documents ranked well by both retrievers rise to the top.
+
+    Args:
+        rankings: Ranked lists of document ids (best first)
+        k: Damping constant, larger values flatten the contribution of top ranks
+
+    Returns:
+        Fused list of ids, best first (ties broken by id for stable output)
+    """
+    scores: Dict[str, float] = defaultdict(float)
+    for ranking in rankings:
+        for rank, doc_id in enumerate(ranking, 1):
+            scores[doc_id] += 1.0 / (k + rank)
+    return sorted(scores, key=lambda doc_id: (-scores[doc_id], doc_id))
+
+
+class CrossEncoderReranker:
+    """
+    Reranks retrieval candidates with a small cross-encoder running on CPU.
+
+    Candidates are scored in batches; scores are cached per (query, document)
+    so repeated tool calls within a run are free. Scoring stops once the
+    latency budget is spent: the remaining candidates keep their fused
+    positions and only the scored ones are reordered among theirs.
+
+    Requires the optional ``sentence-transformers`` package. If it is missing
+    the reranker disables itself and returns the candidates unchanged.
+    """
+
+    def __init__(
+        self,
+        model_name: str = RAG_RERANK_MODEL,
+        batch_size: int = RAG_RERANK_BATCH_SIZE,
+        budget_ms: float = RAG_RERANK_BUDGET_MS,
+        cache_size: int = RAG_RERANK_CACHE_SIZE,
+    ):
+        """
+        Initialize the reranker (the model is loaded lazily on first use).
+
+        Args:
+            model_name: Hugging Face cross-encoder model name
+            batch_size: Number of (query, document) pairs scored per forward pass
+            budget_ms: Latency budget for scoring new pairs
+            cache_size: Maximum number of cached scores
+        """
+        self.model_name = model_name
+        self.batch_size = batch_size
+        self.budget_ms = budget_ms
+        self.cache_size = cache_size
+        self.enabled = True
+        self.last_stats: Dict[str, Any] = {}
+        self._model = None
+        self._cache: "OrderedDict[tuple, float]" = OrderedDict()
+
+    def _get_model(self):
+        """Load the cross-encoder on first use."""
+        if self._model is None and self.enabled:
+            try:
+                from sentence_transformers import CrossEncoder
+            except ImportError:
+                print("⚠️  sentence-transformers no está instalado, se omite el reranking.")
+                self.enabled = False
+                return None
+            self._model = CrossEncoder(self.model_name, device="cpu")
+        return self._model
+
+    def _cache_put(self, key: tuple, score: float):
+        self._cache[key] = score
+        self._cache.move_to_end(key)
+        while len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+
+    def rerank(self, query: str, documents: List[Document], k: int) -> List[Document]:
+        """
+        Reorder documents by cross-encoder relevance and keep the top-k.
+
+        Args:
+            query: Search query
+            documents: Candidates in fused order (best first)
+            k: Number of documents to return
+
+        Returns:
+            Top-k documents after reranking
+        """
+        model = self._get_model()
+        if model is None or not documents:
+            return documents[:k]
+
+        start = time.perf_counter()
+        scores: Dict[int, float] = {}
+        pending = []
+        for i, doc in enumerate(documents):
+            key = (query, document_id(doc.page_content))
+            if key in self._cache:
+                scores[i] = self._cache[key]
+                self._cache.move_to_end(key)
+            else:
+                pending.append(i)
+        cache_hits = len(scores)
+
+        budget_exceeded = False
+        for batch_start in range(0, len(pending), self.batch_size):
+            if (time.perf_counter() - start) * 1000 > self.budget_ms:
+                budget_exceeded = True
+                break
+            batch = pending[batch_start:batch_start + self.batch_size]
+            pairs = [(query, documents[i].page_content) for i in batch]
+            for i, score in zip(batch, model.predict(pairs, batch_size=len(pairs))):
+                scores[i] = float(score)
+                self._cache_put((query, document_id(documents[i].page_content)), float(score))
+
+        # Scored documents are reordered among the fused positions they occupy;
+        # unscored ones (budget spent) keep their fused position instead of
+        # falling behind every scored document
+        order = list(range(len(documents)))
+        by_score = sorted(scores, key=lambda i: (-scores[i], i))
+        for slot, i in zip(sorted(scores), by_score):
+            order[slot] = i
+
+        self.last_stats = {
+            "candidates": len(documents),
+            "scored": len(scores),
+            "cache_hits": cache_hits,
+            "budget_exceeded": budget_exceeded,
+            "latency_ms": (time.perf_counter() - start) * 1000,
+        }
+        return [documents[i] for i in order[:k]]
+
+
+class HybridRetriever:
+    """
+    Combines ChromaDB dense search with a local BM25 index.
+
+    Both retrievers return a wider candidate set which is merged with
+    reciprocal rank fusion. An optional cross-encoder stage reranks the fused
+    candidates before keeping the top-k documents.
+    """
+
+    def __init__(
+        self,
+        vectorstore: Chroma,
+        bm25_index: BM25Index,
+        index_path=None,
+        reranker: Optional[CrossEncoderReranker] = None,
+    ):
+        """
+        Initialize the retriever.
+
+        Args:
+            vectorstore: ChromaDB vectorstore used for dense search
+            bm25_index: Lexical index kept in sync with the vectorstore
+            index_path: Where to persist the BM25 index (None keeps it in memory)
+            reranker: Optional cross-encoder reranking stage
+        """
+        self.vectorstore = vectorstore
+        self.bm25_index = bm25_index
+        self.index_path = index_path
+        self.reranker = reranker
+
+    def dense_search(
+        self, query: str, k: int = RAG_CANDIDATES_K, where: Optional[Dict[str, Any]] = None
+    ) -> List[Document]:
+        """Semantic search over ChromaDB, with the metadata filter pushed down to Chroma."""
+        return self.vectorstore.similarity_search(query, k=k, filter=where)
+
+    def lexical_search(
+        self, query: str, k: int = RAG_CANDIDATES_K, where: Optional[Dict[str, Any]] = None
+    ) -> List[Document]:
+        """BM25 search over the local inverted index."""
+        return [
+            self.bm25_index.get_document(doc_id)
+            for doc_id, _ in self.bm25_index.search(query, k, where=where)
+        ]
+
+    def search(
+        self,
+        query: str,
+        k: int = RAG_TOP_K,
+        candidates_k: int = RAG_CANDIDATES_K,
+        where: Optional[Dict[str, Any]] = None,
+    ) -> List[Document]:
+        """
+        Hybrid search: dense + BM25 candidates merged with reciprocal rank fusion.
+
+        When a reranker is configured, a wider fused candidate set
+        (RAG_RERANK_CANDIDATES) is reranked by the cross-encoder.
+
+        Args:
+            query: Search query
+            k: Number of documents to return
+            candidates_k: Candidates fetched from each retriever before fusion
+            where: Optional ChromaDB where clause applied to both retrievers
+
+        Returns:
+            Top-k documents
+        """
+        if self.reranker is not None and self.reranker.enabled:
+            candidates_k = max(candidates_k, RAG_RERANK_CANDIDATES)
+
+        return self._fuse(
+            query,
+            self.dense_search(query, candidates_k, where),
+            self.lexical_search(query, candidates_k, where),
+            k,
+        )
+
+    def _fuse(self, query: str, dense: List[Document], lexical: List[Document], k: int) -> List[Document]:
+        """Fuse dense and lexical candidates for one query (and rerank them if configured)."""
+        docs_by_id: Dict[str, Document] = {}
+        rankings = []
+        for results in (dense, lexical):
+            ranking = []
+            for doc in results:
+                doc_id = document_id(doc.page_content)
+                docs_by_id.setdefault(doc_id, doc)
+                ranking.append(doc_id)
+            rankings.append(ranking)
+
+        # Near-duplicates are dropped before cutting to k so they are replaced, not lost
+        fused = deduplicate([docs_by_id[doc_id] for doc_id in reciprocal_rank_fusion(rankings)])
+
+        if self.reranker is not None and self.reranker.enabled:
+            return self.reranker.rerank(query, fused[:RAG_RERANK_CANDIDATES], k)
+        return fused[:k]
+
+    def dense_search_batch(
+        self, queries: List[str], k: int = RAG_CANDIDATES_K, where: Optional[Dict[str, Any]] = None
+    ) -> List[List[Document]]:
+        """
+        Semantic search for several queries: embeddings computed concurrently, one Chroma query.
+
+        Args:
+            queries: Search queries
+            k: Results per query
+            where: Optional ChromaDB where clause
+
+        Returns:
+            One list of documents per query, in the same order as queries
+        """
+        # embed_query, not embed_documents: asymmetric embedding models encode queries
+        # differently from passages, and the single-query path uses embed_query too
+        embeddings = self.vectorstore.embeddings
+        with ThreadPoolExecutor(max_workers=min(len(queries), 8)) as pool:
+            query_embeddings = list(pool.map(embeddings.embed_query, queries))
+        results = self.vectorstore._collection.query(
+            query_embeddings=query_embeddings,
+            n_results=k,
+            where=where,
+            include=["documents", "metadatas"],
+        )
+        return [
+            [Document(page_content=content, metadata=metadata or {}) for content, metadata in zip(contents, metadatas)]
+            for contents, metadatas in zip(results["documents"], results["metadatas"])
+        ]
+
+    def search_many(
+        self,
+        queries: List[str],
+        k: int = RAG_TOP_K,
+        candidates_k: int = RAG_CANDIDATES_K,
+        where: Optional[Dict[str, Any]] = None,
+    ) -> List[Document]:
+        """
+        Hybrid search for several sub-queries in a single batched round trip.
+
+        Each sub-query is fused (and reranked) on its own, then the per-query
+        results are merged with reciprocal rank fusion and deduplicated.
+
+        Args:
+            queries: Sub-queries (duplicates and blanks are ignored)
+            k: Documents kept per sub-query
+            candidates_k: Candidates fetched from each retriever before fusion
+            where: Optional ChromaDB where clause applied to every sub-query
+
+        Returns:
+            Up to k * len(queries) unique documents, best first
+        """
+        queries = list(dict.fromkeys(query.strip() for query in queries if query.strip()))
+        if not queries:
+            return []
+
+        if self.reranker is not None and self.reranker.enabled:
+            candidates_k = max(candidates_k, RAG_RERANK_CANDIDATES)
+
+        docs_by_id: Dict[str, Document] = {}
+        rankings = []
+        dense_batches = self.dense_search_batch(queries, candidates_k, where)
+        for query, dense in zip(queries, dense_batches):
+            lexical = self.lexical_search(query, candidates_k, where)
+            ranking = []
+            for doc in self._fuse(query, dense, lexical, k):
+                doc_id = document_id(doc.page_content)
+                docs_by_id.setdefault(doc_id, doc)
+                ranking.append(doc_id)
+            rankings.append(ranking)
+
+        fused = deduplicate([docs_by_id[doc_id] for doc_id in reciprocal_rank_fusion(rankings)])
+        return fused[:k * len(queries)]
+
+    def add_documents(self, documents: List[Document]) -> int:
+        """
+        Incrementally index documents in both ChromaDB and BM25.
+
+        Documents whose content is already indexed are skipped.
+
+        Args:
+            documents: Documents to add
+
+        Returns:
+            Number of new documents indexed
+        """
+        new_docs = {}
+        for doc in documents:
+            doc_id = document_id(doc.page_content)
+            if doc_id not in self.bm25_index and doc_id not in new_docs:
+                new_docs[doc_id] = Document(page_content=doc.page_content, metadata=index_metadata(doc.metadata))
+
+        if not new_docs:
+            return 0
+
+        ids = list(new_docs)
+        self.vectorstore.add_documents(list(new_docs.values()), ids=ids)
+        self.bm25_index.add_documents(new_docs.values(), ids=ids)
+        self.save_index()
+        return len(ids)
+
+    def rebuild_index(self):
+        """Rebuild the BM25 index from the documents stored in ChromaDB."""
+        stored = self.vectorstore.get(include=["documents", "metadatas"])
+        self.bm25_index = BM25Index(k1=self.bm25_index.k1, b=self.bm25_index.b)
+        for content, metadata in zip(stored["documents"], stored["metadatas"]):
+            self.bm25_index.add(document_id(content), content, metadata)
+        self.save_index()
+
+    def save_index(self):
+        """Persist the BM25 index if a path was configured."""
+        if self.index_path is not None:
+            self.bm25_index.save(self.index_path)
+
+
+def get_retriever() -> HybridRetriever:
+    """
+    Get or create the hybrid retriever over the persisted knowledge base.
+
+    If the BM25 index file is missing (e.g. ChromaDB was populated before the
+    index existed) it is rebuilt once from the Chroma collection.
+    """
+    global _retriever
+    if _retriever is None:
+        vectorstore = get_vectorstore()
+        reranker = CrossEncoderReranker() if RAG_RERANK else None
+        _retriever = HybridRetriever(
+            vectorstore, BM25Index.load(BM25_INDEX_PATH), BM25_INDEX_PATH, reranker=reranker
+        )
+        if len(_retriever.bm25_index) == 0 and vectorstore._collection.count() > 0:
+            _retriever.rebuild_index()
+    return _retriever
+
+
 @tool
-def rag_tool(query: str) -> str:
+def rag_tool(
+    query: str,
+    category: Optional[str] = None,
+    source: Optional[str] = None,
+    date_from: Optional[str] = None,
+    date_to: Optional[str] = None,
+) -> str:
     """
-    Searches the ChromaDB vector database for relevant documents.
+    Searches the knowledge base for relevant documents.
 
-    This tool performs semantic search over the knowledge base using
-    the provided query. It returns the most relevant documents found.
+    This tool performs hybrid search over the knowledge base: semantic search in
+    ChromaDB combined with keyword (BM25) search, so exact product names and
+    policy terms are found as well as paraphrases. Optional metadata filters
+    narrow the search before ranking.
 
     Parameters:
         query: The search query to find relevant documents
+        category: Optional category filter: products, revenue, policies, operations, locations or about
+        source: Optional source filter (e.g. "warranty_policy", "sales_report")
+        date_from: Optional inclusive start date, "YYYY-MM"
+        date_to: Optional inclusive end date, "YYYY-MM"
 
     Returns:
-        Formatted string with relevant documents and their content
+        Numbered snippets with compact citations, e.g. "[1] warranty_policy · policies: ..."
     """
     try:
-        vectorstore = get_vectorstore()
+        where = build_metadata_filter(category, source, date_from, date_to)
+    except ValueError as e:
+        return f"Invalid filter argument: {e}"
+
+    try:
+        retriever = get_retriever()
+
+        inferred = where is None and RAG_AUTO_FILTER
+        if inferred:
+            where = infer_metadata_filter(query)
+
+        results = retriever.search(query, k=RAG_TOP_K, where=where)
+
+        if not results and where is not None:
+            if not inferred:
+                return "No documents match the given filter."
+            # An inferred filter that matches nothing should not hide the rest of the knowledge base
+            results = retriever.search(query, k=RAG_TOP_K)
+
+        if not results:
+            return "No relevant documents found in the knowledge base."
+
+        # Compact, deduplicated output with short citations
+        return format_documents(results)
+
+    except Exception as e:
+        return f"Error querying ChromaDB: {str(e)}"
+
+
+@tool
+def rag_multi_tool(
+    queries: List[str],
+    category: Optional[str] = None,
+    source: Optional[str] = None,
+    date_from: Optional[str] = None,
+    date_to: Optional[str] = None,
+) -> str:
+    """
+    Searches the knowledge base for several sub-queries at once.
+
+    Use this instead of several rag_tool calls when the question has multiple
+    parts: all sub-queries are embedded concurrently and searched with a single
+    vector query, and the results are merged and deduplicated.
+
+    Parameters:
+        queries: List of search queries, one per part of the question
+        category: Optional category filter: products, revenue, policies, operations, locations or about
+        source: Optional source filter (e.g. "warranty_policy", "sales_report")
+        date_from: Optional inclusive start date, "YYYY-MM"
+        date_to: Optional inclusive end date, "YYYY-MM"
+
+    Returns:
+        Numbered snippets with compact citations covering all sub-queries
+    """
+    try:
+        where = build_metadata_filter(category, source, date_from, date_to)
+    except ValueError as e:
+        return f"Invalid filter argument: {e}"
+
+    try:
+        retriever = get_retriever()
+
+        inferred = where is None and RAG_AUTO_FILTER and bool(queries)
+        if inferred:
+            # A single where clause is shared by the batch, so only use an inferred
+            # filter when every sub-query agrees on it
+            clauses = [infer_metadata_filter(query) for query in queries]
+            if all(clause == clauses[0] for clause in clauses):
+                where = clauses[0]
+
+        results = retriever.search_many(queries, k=RAG_TOP_K, where=where)
 
-        # Perform similarity search
-        results = vectorstore.similarity_search(query, k=3)
+        if not results and where is not None:
+            if not inferred:
+                return "No documents match the given filter."
+            # An inferred filter that matches nothing should not hide the rest of the knowledge base
+            results = retriever.search_many(queries, k=RAG_TOP_K)
 
         if not results:
             return "No relevant documents found in the knowledge base."
 
-        # Format results
-        formatted_results = []
-        for i, doc in enumerate(results, 1):
-            metadata = doc.metadata
-            content = doc.page_content
-            formatted_results.append(
-                f"Document {i}:\n"
-                f"Content: {content}\n"
-                f"Metadata: {metadata}\n"
-            )
-
-        return "\n".join(formatted_results)
+        return format_documents(results)
 
     except Exception as e:
         return f"Error querying ChromaDB: {str(e)}"